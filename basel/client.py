@@ -1,4 +1,6 @@
 from pathlib import Path
+import time
+from typing import Iterator
 from typing import List
 from typing import Optional
 
@@ -8,8 +10,14 @@ from basel.dtos import Result
 from basel.exporters import Exporter
 from basel.exporters import Pack
 from basel.loaders import Loader
+from basel.loaders.granularity import get_grouper
+from basel.loaders.granularity import ModuleGrouper
+from basel.loaders.watcher import ModuleWatcher
 from basel.reports import Reporter
 from basel.reports import ReportFormat
+from basel.snapshots import diff_snapshots
+from basel.snapshots import FailRule
+from basel.snapshots import Snapshot
 
 
 class Basel:
@@ -28,6 +36,67 @@ class Basel:
         self.loader = loader
         self.exporter = exporter
 
+    def _add_loader_warnings(self, result: Result):
+        for node_name, error in self.loader.get_errors().items():
+            result.add_log(f"Skipped {node_name}: {error}", LogType.WARNING)
+
+    def _load_components(
+        self,
+        paths: List[Path],
+        ignore_dependencies: Optional[List[str]] = None,
+        exclude_components: Optional[List[str]] = None,
+        exclude_packages: bool = False,
+    ):
+        self.loader.load_components(
+            paths=paths,
+            ignore_dependencies=ignore_dependencies,
+            exclude_components=exclude_components,
+            exclude_packages=exclude_packages,
+        )
+
+    def _create_watcher(self) -> ModuleWatcher:
+        """Watcher of the modules and directories loaded by the loader, with
+        the same exclusion rules it discovered them with"""
+
+        return ModuleWatcher(
+            [node.name for comp in self.loader.components.values() for node in comp],
+            self.loader.module_index.directories.values(),
+            self.loader.exclusion_rules,
+        )
+
+    def _get_grouped_loader(
+        self,
+        root_path: List[Path],
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
+    ) -> Loader:
+        grouper = get_grouper(granularity, root_path, component_map)
+        if isinstance(grouper, ModuleGrouper):
+            return self.loader
+
+        return self.loader.group_components(grouper)
+
+    def _render_report(
+        self,
+        root_path: List[Path],
+        filter_by_components: Optional[List[str]] = None,
+        report_format: Optional[str] = None,
+        where: Optional[str] = None,
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
+    ):
+        reporter = self.reporter
+        report_filters = {}
+        if filter_by_components:
+            report_filters["name"] = ["match in", filter_by_components]
+        if where:
+            report_filters["where"] = where
+
+        loader = self._get_grouped_loader(root_path, granularity, component_map)
+        reporter.set_loader(loader)
+        report = reporter.get_as_report(report_filters)
+        return reporter.format_report(report, report_format)
+
     def report(
         self,
         root_path: Path,
@@ -36,32 +105,102 @@ class Basel:
         exclude_packages: bool = False,
         filter_by_components: Optional[List[str]] = None,
         report_format: Optional[str] = None,
+        where: Optional[str] = None,
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
     ):
         try:
             result = Result()
 
-            self.loader.load_components(
+            self._load_components(
                 paths=root_path,
                 ignore_dependencies=ignore_dependencies,
                 exclude_components=exclude_components,
                 exclude_packages=exclude_packages,
             )
 
-            reporter = self.reporter
-            report_filters = {}
-            if filter_by_components:
-                report_filters["name"] = ["match in", filter_by_components]
+            result.content = self._render_report(
+                root_path,
+                filter_by_components=filter_by_components,
+                report_format=report_format,
+                where=where,
+                granularity=granularity,
+                component_map=component_map,
+            )
+            self._add_loader_warnings(result)
 
-            reporter.set_loader(self.loader)
-            report = reporter.get_as_report(report_filters)
-            formatted_report = reporter.format_report(report, report_format)
+        except Exception as e:
+            result.add_log(e, LogType.ERROR)
 
-            result.content = formatted_report
+        return result
+
+    def watch(
+        self,
+        root_path: List[Path],
+        ignore_dependencies: Optional[List[str]] = None,
+        exclude_components: Optional[List[str]] = None,
+        exclude_packages: bool = False,
+        filter_by_components: Optional[List[str]] = None,
+        report_format: Optional[str] = None,
+        where: Optional[str] = None,
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
+        interval: float = config.WATCH_INTERVAL,
+        max_updates: Optional[int] = None,
+    ) -> Iterator[Result]:
+        """Yield the AE report, and again every time modules change.
+
+        The modules stay loaded between updates, only the changed ones are
+        parsed again and only the links they affect are resolved again.
+        """
 
+        result = Result()
+        try:
+            self._load_components(
+                paths=root_path,
+                ignore_dependencies=ignore_dependencies,
+                exclude_components=exclude_components,
+                exclude_packages=exclude_packages,
+            )
+            watcher = self._create_watcher()
         except Exception as e:
             result.add_log(e, LogType.ERROR)
+            result.success = False
+            yield result
+            return
 
-        return result
+        updates = 0
+        while True:
+            try:
+                result.content = self._render_report(
+                    root_path,
+                    filter_by_components=filter_by_components,
+                    report_format=report_format,
+                    where=where,
+                    granularity=granularity,
+                    component_map=component_map,
+                )
+                self._add_loader_warnings(result)
+            except Exception as e:
+                result.add_log(e, LogType.ERROR)
+
+            yield result
+
+            if max_updates is not None and updates >= max_updates:
+                return
+
+            changes = watcher.poll()
+            while not changes:
+                time.sleep(interval)
+                changes = watcher.poll()
+
+            result = Result()
+            try:
+                self.loader.update_modules(changes.modified, changes.removed)
+            except Exception as e:
+                result.add_log(e, LogType.ERROR)
+
+            updates += 1
 
     def component_relations(
         self,
@@ -71,11 +210,15 @@ class Basel:
         exclude_packages: bool = False,
         filter_by_components: Optional[List[str]] = None,
         report_format: Optional[str] = None,
+        where: Optional[str] = None,
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
+        sparse: bool = False,
     ):
         try:
             result = Result()
 
-            self.loader.load_components(
+            self._load_components(
                 paths=root_path,
                 ignore_dependencies=ignore_dependencies,
                 exclude_components=exclude_components,
@@ -86,9 +229,15 @@ class Basel:
             report_filters = {}
             if filter_by_components:
                 report_filters["name"] = ["match in", filter_by_components]
+            if where:
+                report_filters["where"] = where
 
-            reporter.set_loader(self.loader)
-            report = reporter.get_component_links_report(report_filters)
+            loader = self._get_grouped_loader(root_path, granularity, component_map)
+            reporter.set_loader(loader)
+            if sparse:
+                report = reporter.get_component_edges_report(report_filters)
+            else:
+                report = reporter.get_component_links_report(report_filters)
             formatted_report = reporter.format_report(report, report_format)
 
             if report_format == ReportFormat.UML_IMG:
@@ -98,8 +247,154 @@ class Basel:
                 result.add_log(f"Exported successfully on {image_path}")
             else:
                 result.content = formatted_report
+            self._add_loader_warnings(result)
+
+        except Exception as e:
+            result.add_log(e, LogType.ERROR)
+
+        return result
+
+    def cycles(
+        self,
+        root_path: Path,
+        ignore_dependencies: Optional[List[str]] = None,
+        exclude_components: Optional[List[str]] = None,
+        exclude_packages: bool = False,
+        filter_by_components: Optional[List[str]] = None,
+        report_format: Optional[str] = None,
+        where: Optional[str] = None,
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
+    ):
+        try:
+            result = Result()
+
+            self._load_components(
+                paths=root_path,
+                ignore_dependencies=ignore_dependencies,
+                exclude_components=exclude_components,
+                exclude_packages=exclude_packages,
+            )
+
+            reporter = self.reporter
+            report_filters = {}
+            if filter_by_components:
+                report_filters["name"] = ["match in", filter_by_components]
+            if where:
+                report_filters["where"] = where
+
+            loader = self._get_grouped_loader(root_path, granularity, component_map)
+            reporter.set_loader(loader)
+            report = reporter.get_cycles_report(report_filters)
+            formatted_report = reporter.format_report(report, report_format)
+
+            result.content = formatted_report
+            self._add_loader_warnings(result)
+
+        except Exception as e:
+            result.add_log(e, LogType.ERROR)
+
+        return result
+
+    def _take_snapshot(
+        self,
+        root_path: List[Path],
+        ignore_dependencies: Optional[List[str]] = None,
+        exclude_components: Optional[List[str]] = None,
+        exclude_packages: bool = False,
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
+    ) -> Snapshot:
+        self._load_components(
+            paths=root_path,
+            ignore_dependencies=ignore_dependencies,
+            exclude_components=exclude_components,
+            exclude_packages=exclude_packages,
+        )
+
+        loader = self._get_grouped_loader(root_path, granularity, component_map)
+        return Snapshot.from_loader(loader)
+
+    def snapshot(
+        self,
+        root_path: List[Path],
+        ignore_dependencies: Optional[List[str]] = None,
+        exclude_components: Optional[List[str]] = None,
+        exclude_packages: bool = False,
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
+        output: Path = Path(config.SNAPSHOT_PATH),
+    ):
+        try:
+            result = Result()
+
+            snapshot = self._take_snapshot(
+                root_path,
+                ignore_dependencies=ignore_dependencies,
+                exclude_components=exclude_components,
+                exclude_packages=exclude_packages,
+                granularity=granularity,
+                component_map=component_map,
+            )
+            snapshot.save(output)
+
+            result.add_log(f"Saved snapshot on {output}")
+            self._add_loader_warnings(result)
+
+        except Exception as e:
+            result.add_log(e, LogType.ERROR)
+
+        return result
+
+    def diff(
+        self,
+        base_snapshot: Path,
+        head_snapshot: Optional[Path] = None,
+        root_path: Optional[List[Path]] = None,
+        ignore_dependencies: Optional[List[str]] = None,
+        exclude_components: Optional[List[str]] = None,
+        exclude_packages: bool = False,
+        granularity: Optional[str] = None,
+        component_map: Optional[Path] = None,
+        fail_on: Optional[List[str]] = None,
+        report_format: Optional[str] = None,
+    ):
+        """Compare two snapshots, the head one is taken from ``root_path``
+        when it is not given. Fails when a ``fail_on`` rule finds regressions"""
+
+        try:
+            result = Result()
+
+            rules = [FailRule.parse(rule) for rule in fail_on or []]
+
+            base = Snapshot.load(base_snapshot)
+            if head_snapshot:
+                head = Snapshot.load(head_snapshot)
+            elif root_path:
+                head = self._take_snapshot(
+                    root_path,
+                    ignore_dependencies=ignore_dependencies,
+                    exclude_components=exclude_components,
+                    exclude_packages=exclude_packages,
+                    granularity=granularity,
+                    component_map=component_map,
+                )
+                self._add_loader_warnings(result)
+            else:
+                raise ValueError("Missing the head snapshot or the path to analyze")
+
+            diff = diff_snapshots(base, head)
+
+            report = self.reporter.get_diff_report(diff)
+            result.content = self.reporter.format_report(report, report_format)
+
+            for rule in rules:
+                for regression in rule.get_regressions(diff):
+                    result.add_log(regression, LogType.ERROR)
+                    result.success = False
 
         except Exception as e:
             result.add_log(e, LogType.ERROR)
+            result.success = False
 
         return result
@@ -1,28 +1,40 @@
 from typing import Dict
-from typing import List
+from typing import Iterable
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from basel.components.nodes import Node
 
 
 class ClassNode(Node):
+    __slots__ = ("subclasses", "_keywords")
+
     def __init__(
         self,
         name: str,
-        subclasses: Optional[List] = None,
-        keywords: Optional[Dict] = None,
+        subclasses: Optional[Iterable] = None,
+        keywords: Optional[Union[Mapping, Iterable[Tuple]]] = None,
         **kwargs,
     ):
         super().__init__(name, **kwargs)
-        self.subclasses = subclasses or []
-        self.keywords = keywords or {}
+        self.subclasses = tuple(subclasses or ())
+
+        if isinstance(keywords, Mapping):
+            keywords = keywords.items()
+        self._keywords = tuple(keywords or ())
+
+    @property
+    def keywords(self) -> Dict:
+        return dict(self._keywords)
 
     def __eq__(self, other_node):
         if not other_node:
             return False
 
         match_names = other_node.name == self.name
-        match_subclasses = other_node.subclasses == self.subclasses
+        match_subclasses = tuple(other_node.subclasses) == self.subclasses
         match_keywords = other_node.keywords == self.keywords
         match_children = self.has_children(other_node)
 
@@ -0,0 +1,351 @@
+from array import array
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+
+def _zeros(size: int) -> array:
+    return array("i", [0]) * size
+
+
+class DependencyGraph:
+    """Directed graph of named nodes backed by integer arrays.
+
+    Every node gets a dense integer id in insertion order, edges are kept as
+    two parallel ``array('i')`` of source and target ids. Neighbour queries
+    use compressed sparse rows (CSR) for both directions, built lazily from
+    the edge arrays and reused until the graph changes.
+
+    Removed nodes leave a tombstone: their id is never reused and their
+    edges are dropped the next time the edge arrays are compacted.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[Optional[str]] = []
+        self._data: List[object] = []
+        self._sources = array("i")
+        self._targets = array("i")
+        self._edge_keys: Set[int] = set()
+        self._in_degree = array("i")
+        self._out_degree = array("i")
+        self._removed = 0
+        self._out_csr: Optional[Tuple[array, array]] = None
+        self._in_csr: Optional[Tuple[array, array]] = None
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, name: str):
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def add_node(self, name: str, data: object = None) -> int:
+        """Add a node or update the data of an existing one, returns its id"""
+
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = len(self._names)
+            self._ids[name] = node_id
+            self._names.append(name)
+            self._data.append(data)
+            self._in_degree.append(0)
+            self._out_degree.append(0)
+            self._out_csr = self._in_csr = None
+        elif data is not None:
+            self._data[node_id] = data
+
+        return node_id
+
+    def remove_node(self, name: str) -> Optional[object]:
+        node_id = self._ids.pop(name, None)
+        if node_id is None:
+            return None
+
+        data = self._data[node_id]
+        self._names[node_id] = None
+        self._data[node_id] = None
+        self._removed += 1
+        self._out_csr = self._in_csr = None
+
+        return data
+
+    def get_id(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
+
+    def get_name(self, node_id: int) -> Optional[str]:
+        return self._names[node_id]
+
+    def get_data(self, name: str) -> Optional[object]:
+        node_id = self._ids.get(name)
+        if node_id is None:
+            return None
+
+        return self._data[node_id]
+
+    @staticmethod
+    def _get_edge_key(source_id: int, target_id: int) -> int:
+        return source_id << 32 | target_id
+
+    def add_edge(self, source: str, target: str) -> bool:
+        """Add an edge between two nodes, adding the missing nodes. Returns
+        False when the edge already exists"""
+
+        source_id = self.add_node(source)
+        target_id = self.add_node(target)
+
+        key = self._get_edge_key(source_id, target_id)
+        if key in self._edge_keys:
+            return False
+
+        self._edge_keys.add(key)
+        self._sources.append(source_id)
+        self._targets.append(target_id)
+
+        # a node depending on itself has no afferent coupling
+        self._out_degree[source_id] += 1
+        if source_id != target_id:
+            self._in_degree[target_id] += 1
+
+        self._out_csr = self._in_csr = None
+
+        return True
+
+    def remove_edge(self, source: str, target: str) -> bool:
+        """Remove an edge, returns False when it does not exist. Degrees are
+        updated at once, the edge arrays on the next compaction"""
+
+        source_id = self._ids.get(source)
+        target_id = self._ids.get(target)
+        if source_id is None or target_id is None:
+            return False
+
+        key = self._get_edge_key(source_id, target_id)
+        if key not in self._edge_keys:
+            return False
+
+        self._edge_keys.discard(key)
+        self._out_degree[source_id] -= 1
+        if source_id != target_id:
+            self._in_degree[target_id] -= 1
+
+        self._removed += 1
+        self._out_csr = self._in_csr = None
+
+        return True
+
+    def has_edge(self, source: str, target: str) -> bool:
+        source_id = self._ids.get(source)
+        target_id = self._ids.get(target)
+        if source_id is None or target_id is None:
+            return False
+
+        # ids of removed nodes are never reused, so stale keys never match
+        return self._get_edge_key(source_id, target_id) in self._edge_keys
+
+    def _compact(self):
+        """Drop the removed edges and the edges of removed nodes, and recount
+        the degrees"""
+
+        if not self._removed:
+            return
+
+        names = self._names
+        sources = array("i")
+        targets = array("i")
+        edge_keys = set()
+        in_degree = _zeros(len(self._in_degree))
+        out_degree = _zeros(len(self._out_degree))
+
+        for source_id, target_id in zip(self._sources, self._targets):
+            if names[source_id] is None or names[target_id] is None:
+                continue
+
+            # removed edges left their key, re-added ones are kept once
+            key = self._get_edge_key(source_id, target_id)
+            if key not in self._edge_keys or key in edge_keys:
+                continue
+
+            sources.append(source_id)
+            targets.append(target_id)
+            edge_keys.add(key)
+            out_degree[source_id] += 1
+            if source_id != target_id:
+                in_degree[target_id] += 1
+
+        self._sources, self._targets = sources, targets
+        self._edge_keys = edge_keys
+        self._in_degree, self._out_degree = in_degree, out_degree
+        self._removed = 0
+
+    def _build_csr(self, rows: array, columns: array) -> Tuple[array, array]:
+        """Counting sort of the edges by row, keeping insertion order within a
+        row. Returns the row offsets and the column ids"""
+
+        size = len(self._names)
+        offsets = _zeros(size + 1)
+        for row in rows:
+            offsets[row + 1] += 1
+
+        for idx in range(size):
+            offsets[idx + 1] += offsets[idx]
+
+        positions = offsets[:-1]
+        neighbours = _zeros(len(columns))
+        for row, column in zip(rows, columns):
+            neighbours[positions[row]] = column
+            positions[row] += 1
+
+        return offsets, neighbours
+
+    def _get_out_csr(self) -> Tuple[array, array]:
+        if self._out_csr is None:
+            self._compact()
+            self._out_csr = self._build_csr(self._sources, self._targets)
+
+        return self._out_csr
+
+    def _get_in_csr(self) -> Tuple[array, array]:
+        if self._in_csr is None:
+            self._compact()
+            self._in_csr = self._build_csr(self._targets, self._sources)
+
+        return self._in_csr
+
+    def get_successor_ids(self, node_id: int) -> array:
+        offsets, neighbours = self._get_out_csr()
+        start, end = offsets[node_id], offsets[node_id + 1]
+        return neighbours[start:end]
+
+    def get_predecessor_ids(self, node_id: int) -> array:
+        offsets, neighbours = self._get_in_csr()
+        start, end = offsets[node_id], offsets[node_id + 1]
+        return neighbours[start:end]
+
+    def get_successors(self, name: str) -> List[str]:
+        node_id = self._ids.get(name)
+        if node_id is None:
+            return []
+
+        return [self._names[idx] for idx in self.get_successor_ids(node_id)]
+
+    def get_predecessors(self, name: str) -> List[str]:
+        node_id = self._ids.get(name)
+        if node_id is None:
+            return []
+
+        return [self._names[idx] for idx in self.get_predecessor_ids(node_id)]
+
+    def get_strongly_connected_components(self) -> List[List[str]]:
+        """Groups of nodes that reach each other, in topological order: a
+        group comes before the groups it has edges to.
+
+        Tarjan's algorithm with an explicit stack of (node, next edge)
+        frames instead of recursion, so deep graphs don't hit the recursion
+        limit. Runs in O(V + E) over the CSR adjacency.
+        """
+
+        offsets, neighbours = self._get_out_csr()
+        names = self._names
+        size = len(names)
+
+        index = array("i", [-1]) * size
+        lowlink = _zeros(size)
+        on_stack = bytearray(size)
+        stack: List[int] = []
+        groups: List[List[str]] = []
+        counter = 0
+
+        for root in range(size):
+            if names[root] is None or index[root] != -1:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            frames = [(root, offsets[root])]
+
+            while frames:
+                node, position = frames[-1]
+                if position < offsets[node + 1]:
+                    frames[-1] = (node, position + 1)
+                    successor = neighbours[position]
+                    if index[successor] == -1:
+                        index[successor] = lowlink[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = 1
+                        frames.append((successor, offsets[successor]))
+                    elif on_stack[successor] and index[successor] < lowlink[node]:
+                        lowlink[node] = index[successor]
+
+                    continue
+
+                frames.pop()
+                if frames:
+                    parent = frames[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] != index[node]:
+                    continue
+
+                group = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    group.append(member)
+                    if member == node:
+                        break
+
+                groups.append([names[member] for member in sorted(group)])
+
+        # tarjan emits a group after every group reachable from it
+        groups.reverse()
+        return groups
+
+    def get_in_degree(self, name: str) -> int:
+        """Number of edges that target the node, without self edges"""
+
+        node_id = self._ids.get(name)
+        if node_id is None:
+            return 0
+
+        self._compact()
+        return self._in_degree[node_id]
+
+    def get_out_degree(self, name: str) -> int:
+        node_id = self._ids.get(name)
+        if node_id is None:
+            return 0
+
+        self._compact()
+        return self._out_degree[node_id]
+
+    def get_edge_ids(self) -> Iterator[Tuple[int, int]]:
+        self._compact()
+        return zip(self._sources, self._targets)
+
+    def get_edges(self) -> Iterator[Tuple[str, str]]:
+        names = self._names
+        for source_id, target_id in self.get_edge_ids():
+            yield names[source_id], names[target_id]
+
+    def get_number_of_edges(self) -> int:
+        self._compact()
+        return len(self._sources)
+
+    def clear_edges(self):
+        self._sources = array("i")
+        self._targets = array("i")
+        self._edge_keys = set()
+        self._in_degree = _zeros(len(self._names))
+        self._out_degree = _zeros(len(self._names))
+        self._removed = 0
+        self._out_csr = self._in_csr = None
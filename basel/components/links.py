@@ -8,5 +8,10 @@ class Link(metaclass=abc.ABCMeta):
         self.source = source
         self.target = target
 
+    @property
+    def key(self):
+        """Identity of the link, components are unique by name"""
+        return (self.source.name, self.target.name)
+
     def __eq__(self, other_link):
         return self.source == other_link.source and self.target == other_link.target
@@ -2,4 +2,4 @@ from basel.components.nodes import Node
 
 
 class ModuleNode(Node):
-    pass
+    __slots__ = ()
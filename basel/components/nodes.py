@@ -1,21 +1,36 @@
 class Node:
+    __slots__ = ("name", "children", "__weakref__")
+
     def __init__(self, name, children=None) -> None:
         self.name = name
-        self.children = {}
+        # most nodes are leaves, the dict is only allocated for the first child
+        self.children = None
 
         for child in children or []:
             self.add_child(child)
 
     def add_child(self, node):
+        if self.children is None:
+            self.children = {}
+
         self.children[node.name] = node
 
     def get_children(self):
+        if not self.children:
+            return []
+
         return list(self.children.values())
 
     def get_child(self, node_name):
+        if not self.children:
+            return None
+
         return self.children.get(node_name)
 
     def remove_child(self, node_name):
+        if not self.children:
+            raise KeyError(node_name)
+
         self.children.pop(node_name)
 
     def __eq__(self, other_node):
@@ -39,8 +54,8 @@ class Node:
         return not self.__eq__(other_node)
 
     def __iter__(self):
-        for child in self.children.values():
-            yield child
+        if self.children:
+            yield from self.children.values()
 
     def __repr__(self):
         return f"<{self.__class__.__name__}:{self.name}>"
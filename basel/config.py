@@ -5,3 +5,34 @@ HTML_REPORT_FILE = "basel.html"
 UML_IMAGE_PATH = "components.png"
 
 PLANTUML_URL = "http://www.plantuml.com/plantuml/img/"
+
+CACHE_DIR = ".basel_cache"
+CACHE_MAX_SIZE = 64 * 1024 * 1024
+
+RESOLVER_CACHE_SIZE = 64 * 1024
+
+SNAPSHOT_PATH = "basel-snapshot.json"
+
+IGNORE_DIRS = (
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    ".venv",
+    "venv",
+    "node_modules",
+    "build",
+    "dist",
+    ".eggs",
+    "*.egg-info",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    CACHE_DIR,
+)
+
+WATCH_INTERVAL = 1.0
+
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
@@ -7,6 +7,7 @@ from typing import Optional
 
 class LogType(str, Enum):
     SUCCESS = "SUCCESS"
+    WARNING = "WARNING"
     ERROR = "ERROR"
 
 
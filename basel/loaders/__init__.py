@@ -1,4 +1,5 @@
 from basel.loaders.loaders import Loader
+from basel.loaders.loaders import LoaderPhase
 from basel.loaders.modules import ModuleLoader
 
-__all__ = ["Loader", "ModuleLoader"]
+__all__ = ["Loader", "LoaderPhase", "ModuleLoader"]
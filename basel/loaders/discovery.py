@@ -0,0 +1,197 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from basel.loaders.exclusion import ExclusionRules
+from basel.loaders.exclusion import GITIGNORE_FILE
+
+MODULE_SUFFIX = ".py"
+
+FILE = 0
+DIRECTORY = 1
+LINKED_DIRECTORY = 2
+
+Entry = Tuple[str, int]
+
+
+def scan_directory(directory: str) -> Optional[List[Entry]]:
+    """Python modules, .gitignore files and directories of a directory sorted
+    by name, None when it can not be listed.
+
+    Entry types come from the directory listing itself, only symlinks are
+    followed to know if they point to a directory.
+    """
+
+    entries = []
+    try:
+        with os.scandir(directory) as dir_entries:
+            for entry in dir_entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.name, DIRECTORY))
+                    elif entry.is_symlink() and entry.is_dir():
+                        entries.append((entry.name, LINKED_DIRECTORY))
+                    elif entry.name.endswith(MODULE_SUFFIX):
+                        entries.append((entry.name, FILE))
+                    elif entry.name == GITIGNORE_FILE:
+                        entries.append((entry.name, FILE))
+                except OSError:
+                    continue
+    except OSError:
+        return None
+
+    entries.sort()
+    return entries
+
+
+class ModuleDiscovery:
+    """Discover the python modules below some paths.
+
+    Directories are listed level by level, each level across a thread pool,
+    and the listings are visited depth first at the end, so modules come out
+    in the same order as sorting their paths without sorting them. Symlinked
+    directories are followed after the rest of the tree and only when their
+    target neither was walked nor holds a walked path, which skips symlink
+    loops and paths walked twice, like roots nested in other roots.
+    """
+
+    parallel_threshold = 8
+
+    def __init__(self, rules: Optional[ExclusionRules] = None, jobs: int = 1):
+        self.rules = rules or ExclusionRules()
+        self.jobs = jobs
+
+        self._walked: Set[str] = set()
+        self._listings: Dict[str, List[Entry]] = {}
+
+    def _is_walked(self, real_path: str) -> bool:
+        """Whether the path, one of its parents or one of its subdirectories
+        was walked, a link to a parent of a walked path would walk it again"""
+
+        prefix = real_path if real_path.endswith(os.sep) else real_path + os.sep
+        if any(walked.startswith(prefix) for walked in self._walked):
+            return True
+
+        while True:
+            if real_path in self._walked:
+                return True
+
+            parent = os.path.dirname(real_path)
+            if parent == real_path:
+                return False
+
+            real_path = parent
+
+    def _claim(self, path: str) -> bool:
+        real_path = os.path.realpath(path)
+        if self._is_walked(real_path):
+            return False
+
+        self._walked.add(real_path)
+        return True
+
+    def _get_roots(self, paths: Iterable[str]) -> List[str]:
+        roots = {str(Path(path)): os.path.realpath(path) for path in paths}
+
+        # parents are claimed before their subdirectories
+        claimed = {
+            root
+            for root, real_path in sorted(roots.items(), key=lambda item: item[1])
+            if self._claim(real_path)
+        }
+
+        return [str(root) for root in sorted(map(Path, claimed))]
+
+    def _filter_entries(
+        self, directory: str, entries: List[Entry], linked_dirs: List[str]
+    ) -> List[str]:
+        """Keep the paths not excluded in the listing of the directory and
+        return the subdirectories to walk"""
+
+        if self.rules.use_gitignore and (GITIGNORE_FILE, FILE) in entries:
+            self.rules.add_gitignore(directory)
+
+        prefix = directory if directory.endswith(os.sep) else directory + os.sep
+        children = []
+        subdirectories = []
+        for name, entry_type in entries:
+            path = prefix + name
+            if entry_type == FILE:
+                if name.endswith(MODULE_SUFFIX) and not self.rules.is_excluded_module(
+                    path
+                ):
+                    children.append((path, FILE))
+                continue
+
+            if self.rules.is_excluded_dir(path):
+                continue
+
+            children.append((path, DIRECTORY))
+            if entry_type == LINKED_DIRECTORY:
+                linked_dirs.append(path)
+            else:
+                subdirectories.append(path)
+
+        self._listings[directory] = children
+        return subdirectories
+
+    def _walk(self, roots: List[str], executor: Optional[ThreadPoolExecutor]):
+        level = roots
+        linked_dirs: List[str] = []
+
+        while level or linked_dirs:
+            if not level:
+                level = [path for path in linked_dirs if self._claim(path)]
+                linked_dirs = []
+                continue
+
+            if executor is None or len(level) < self.parallel_threshold:
+                listings = map(scan_directory, level)
+            else:
+                listings = executor.map(scan_directory, level)
+
+            next_level = []
+            for directory, entries in zip(level, listings):
+                if entries is not None:
+                    next_level.extend(
+                        self._filter_entries(directory, entries, linked_dirs)
+                    )
+
+            level = next_level
+
+    def discover(self, paths: Iterable[str]) -> Tuple[List[Path], List[Path]]:
+        """Discovered modules and walked directories, both in path order"""
+
+        self._walked.clear()
+        self._listings.clear()
+        roots = self._get_roots(paths)
+
+        if self.jobs > 1:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                self._walk(roots, executor)
+        else:
+            self._walk(roots, None)
+
+        modules = []
+        directories = []
+        pending = [(root, DIRECTORY) for root in reversed(roots)]
+        while pending:
+            path, entry_type = pending.pop()
+            if entry_type == FILE:
+                modules.append(Path(path))
+                continue
+
+            children = self._listings.get(path)
+            if children is None:
+                continue
+
+            directories.append(Path(path))
+            pending.extend(reversed(children))
+
+        return modules, directories
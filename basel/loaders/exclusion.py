@@ -0,0 +1,112 @@
+import os
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+
+from basel import config
+from basel import utils
+
+GITIGNORE_FILE = ".gitignore"
+
+PACKAGE_FILE = "__init__.py"
+
+
+def _as_posix(path: str) -> str:
+    if os.sep == "/":
+        return path
+
+    return path.replace(os.sep, "/")
+
+
+class ExclusionRules:
+    """Rules to skip modules and directories while discovering modules.
+
+    Rules are globs matched like ``Path.match``, a module is excluded when
+    it matches any of them. Directories are pruned before walking into them
+    when their name is one of the ignored directories and they are not a
+    package, when a rule ending in ``/**`` matches them, or when a
+    ``.gitignore`` ignores them. Every group of globs is compiled once into a
+    single regex.
+    """
+
+    def __init__(
+        self,
+        patterns: Optional[Iterable[str]] = None,
+        ignore_dirs: Optional[Iterable[str]] = config.IGNORE_DIRS,
+        use_gitignore: bool = False,
+    ):
+        patterns = list(patterns or [])
+        self.use_gitignore = use_gitignore
+
+        self._module_regex = utils.globs_to_regex(patterns)
+        self._dir_regex = utils.globs_to_regex(
+            pattern for pattern in patterns if pattern.endswith("/**")
+        )
+        self._ignore_dirs_regex = utils.globs_to_regex(ignore_dirs or [])
+
+        # (directory of the .gitignore, regex, only matches directories)
+        self._gitignore_rules: List[Tuple[str, Pattern, bool]] = []
+
+    def add_gitignore(self, directory: str):
+        """Load the rules of the .gitignore in the directory, they apply to
+        the paths below it. Negated rules are not supported and skipped"""
+
+        path = os.path.join(directory, GITIGNORE_FILE)
+        try:
+            with open(path) as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+
+        base = os.path.normpath(directory)
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith(("#", "!")):
+                continue
+
+            dir_only = line.endswith("/")
+            pattern = line.rstrip("/")
+            if not pattern:
+                continue
+
+            # patterns with a separator are relative to the .gitignore
+            if "/" in pattern and not pattern.startswith("**/"):
+                pattern = "/" + pattern.lstrip("/")
+
+            regex = utils.glob_to_regex(pattern)
+            self._gitignore_rules.append((base, regex, dir_only))
+
+    def _is_gitignored(self, path: str, is_dir: bool) -> bool:
+        for base, regex, dir_only in self._gitignore_rules:
+            if dir_only and not is_dir:
+                continue
+
+            relative_path = os.path.relpath(path, base)
+            if relative_path.startswith(".."):
+                continue
+
+            relative_path = "/" + _as_posix(relative_path)
+            if regex.search(relative_path):
+                return True
+
+        return False
+
+    def is_excluded_dir(self, path: str) -> bool:
+        name = os.path.basename(path)
+        if self._ignore_dirs_regex.search(name) and not os.path.isfile(
+            os.path.join(path, PACKAGE_FILE)
+        ):
+            return True
+
+        if self._dir_regex.search(_as_posix(path)):
+            return True
+
+        return self._is_gitignored(path, is_dir=True)
+
+    def is_excluded_module(self, path: str) -> bool:
+        if self._module_regex.search(_as_posix(path)):
+            return True
+
+        return self._is_gitignored(path, is_dir=False)
@@ -0,0 +1,111 @@
+import abc
+import json
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from basel import utils
+
+MODULE_GRANULARITY = "module"
+PACKAGE_GRANULARITY = "package"
+DEPTH_GRANULARITY = "depth"
+
+
+class ComponentGrouper(metaclass=abc.ABCMeta):
+    """Name of the component that holds each module"""
+
+    @abc.abstractmethod
+    def get_component_name(self, module_path: str) -> str:
+        raise NotImplementedError()
+
+
+class ModuleGrouper(ComponentGrouper):
+    def get_component_name(self, module_path: str) -> str:
+        return module_path
+
+
+class PackageGrouper(ComponentGrouper):
+    """Group modules by their package, or by the package at ``depth`` levels
+    below the root they were discovered from"""
+
+    def __init__(self, roots: Optional[List[Path]] = None, depth: Optional[int] = None):
+        self.roots = [Path(root) for root in roots or []]
+        self.depth = depth
+
+    def _get_root(self, path: Path) -> Optional[Path]:
+        for root in self.roots:
+            if root == path or root in path.parents:
+                return root
+
+        return None
+
+    def get_component_name(self, module_path: str) -> str:
+        package = Path(module_path).parent
+        if self.depth is None:
+            return str(package)
+
+        root = self._get_root(package)
+        if root is None:
+            return str(package)
+
+        parts = package.relative_to(root).parts[: self.depth]
+        return str(root.joinpath(*parts))
+
+
+class MappingGrouper(ComponentGrouper):
+    """Group modules by the first glob of the mapping they match, modules
+    without a match are components on their own"""
+
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = mapping
+        self._patterns = [
+            (utils.glob_to_regex(pattern), component_name)
+            for pattern, component_name in mapping.items()
+        ]
+
+    @classmethod
+    def from_file(cls, path: Path) -> "MappingGrouper":
+        with open(path) as f:
+            mapping = json.load(f)
+
+        if not isinstance(mapping, dict):
+            raise ValueError(f"The component map {path} must be a JSON object")
+
+        return cls(mapping)
+
+    def get_component_name(self, module_path: str) -> str:
+        path = Path(module_path).as_posix()
+        for regex, component_name in self._patterns:
+            if regex.search(path):
+                return component_name
+
+        return module_path
+
+
+def get_grouper(
+    granularity: Optional[str] = None,
+    roots: Optional[List[Path]] = None,
+    component_map: Optional[Path] = None,
+) -> ComponentGrouper:
+    """Grouper of a granularity spec: module, package or depth:N. A
+    component map file takes precedence over the granularity"""
+
+    if component_map:
+        return MappingGrouper.from_file(component_map)
+
+    if not granularity or granularity == MODULE_GRANULARITY:
+        return ModuleGrouper()
+
+    if granularity == PACKAGE_GRANULARITY:
+        return PackageGrouper(roots)
+
+    name, _, depth = granularity.partition(":")
+    if name == DEPTH_GRANULARITY and depth.isdigit():
+        return PackageGrouper(roots, depth=int(depth))
+
+    raise ValueError(
+        f"Not exists the granularity {granularity}, "
+        f"posibles values {MODULE_GRANULARITY}, {PACKAGE_GRANULARITY}, "
+        f"{DEPTH_GRANULARITY}:N"
+    )
@@ -0,0 +1,73 @@
+import os
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+
+
+class ModuleIndex:
+    """Modules, packages and directories seen while discovering modules,
+    indexed by their absolute path.
+
+    Dotted names are searched relative to the source roots, the working
+    directory by default, the same way python imports them from there.
+    Resolving an import becomes a few dictionary lookups instead of
+    filesystem probes.
+    """
+
+    def __init__(self, roots: Optional[List[Path]] = None):
+        self.roots = [os.path.abspath(root) for root in roots or [os.curdir]]
+        self.modules: Dict[str, Path] = {}
+        self.packages: Dict[str, Path] = {}
+        self.directories: Dict[str, Path] = {}
+
+    @staticmethod
+    def get_key(module_path: Path) -> str:
+        """Absolute path the module is searched by, the directory of a
+        package"""
+
+        if module_path.name == "__init__.py":
+            return os.path.abspath(module_path.parent)
+
+        return os.path.abspath(module_path.with_suffix(""))
+
+    def add_module(self, module_path: Path):
+        key = self.get_key(module_path)
+        if module_path.name == "__init__.py":
+            self.packages.setdefault(key, module_path)
+        else:
+            self.modules.setdefault(key, module_path)
+
+    def remove_module(self, module_path: Path):
+        key = self.get_key(module_path)
+        modules = self.packages if module_path.name == "__init__.py" else self.modules
+
+        if modules.get(key) == module_path:
+            del modules[key]
+
+    def add_directory(self, directory: Path):
+        self.directories.setdefault(os.path.abspath(directory), directory)
+
+    def search_path(self, path: str) -> Optional[Path]:
+        """Search a module by its absolute path without suffix, looking for a
+        module file, then a package and then a directory without __init__.py"""
+
+        return (
+            self.modules.get(path)
+            or self.packages.get(path)
+            or self.directories.get(path)
+        )
+
+    def search(self, name: str) -> Optional[Path]:
+        """Search a module by its dotted name in every source root"""
+
+        parts = name.split(".")
+        for root in self.roots:
+            module = self.search_path(os.path.join(root, *parts))
+            if module:
+                return module
+
+        return None
+
+    def __len__(self):
+        return len(self.modules) + len(self.packages)
@@ -1,13 +1,36 @@
 import abc
+from enum import Enum
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 from basel.components import Component
+from basel.components.graph import DependencyGraph
 from basel.components.links import Link
+from basel.components.nodes import Node
 from basel.parsers.parser import Parser
 
 
+class LoaderPhase(str, Enum):
+    CLASSES = "classes"
+    LINKS = "links"
+    ABSTRACTION = "abstraction"
+    INSTABILITY = "instability"
+    ERROR = "error"
+
+
+# phases that must be recomputed when a phase changes
+PHASE_DEPENDANTS = {
+    LoaderPhase.CLASSES: (LoaderPhase.ABSTRACTION,),
+    LoaderPhase.LINKS: (LoaderPhase.INSTABILITY,),
+    LoaderPhase.ABSTRACTION: (LoaderPhase.ERROR,),
+    LoaderPhase.INSTABILITY: (LoaderPhase.ERROR,),
+    LoaderPhase.ERROR: (),
+}
+
+
 class Loader(metaclass=abc.ABCMeta):
     components: Dict[str, Component]
 
@@ -17,9 +40,14 @@ class Loader(metaclass=abc.ABCMeta):
         components: Optional[List[Component]] = None,
         links: List[Link] = None,
     ) -> None:
-        self.links = links or []
         self.parser = parser
         self.components = {}
+        self.graph = DependencyGraph()
+        self._node_index: Dict[str, Component] = {}
+        self._stale: Set[LoaderPhase] = set(LoaderPhase)
+
+        for link in links or []:
+            self._add_link(link.source, link.target)
 
         for comp in components or []:
             self.add_component(comp)
@@ -56,6 +84,30 @@ class Loader(metaclass=abc.ABCMeta):
     def calculate_mean_instability(self):
         raise NotImplementedError()
 
+    def invalidate(self, *phases: LoaderPhase):
+        """Mark phases as out of date, along with the phases computed from
+        them, all of them by default"""
+
+        pending = list(phases or LoaderPhase)
+        while pending:
+            phase = pending.pop()
+            self._stale.add(phase)
+            pending.extend(PHASE_DEPENDANTS[phase])
+
+    def is_stale(self, phase: LoaderPhase) -> bool:
+        return phase in self._stale
+
+    def _mark_fresh(self, phase: LoaderPhase):
+        self._stale.discard(phase)
+
+    def clear(self):
+        """Drop every component and link"""
+
+        self.components = {}
+        self.graph = DependencyGraph()
+        self._node_index = {}
+        self.invalidate()
+
     def get_component(self, component_name):
         return self.components.get(component_name)
 
@@ -63,11 +115,97 @@ class Loader(metaclass=abc.ABCMeta):
         return list(self.components.values())
 
     def add_component(self, component: Component):
+        if component.name in self.components:
+            self.remove_component(component.name)
+
         self.components[component.name] = component
+        self.graph.add_node(component.name, component)
+        self.invalidate()
+
+        for node in component:
+            self._node_index.setdefault(node.name, component)
+
+    def remove_component(self, component_name: str) -> Optional[Component]:
+        component = self.components.pop(component_name, None)
+        if not component:
+            return None
+
+        self.graph.remove_node(component_name)
+        self.invalidate()
+
+        for node in component:
+            if self._node_index.get(node.name) is component:
+                del self._node_index[node.name]
+                self._index_node_owner(node.name)
+
+        return component
+
+    def _index_node_owner(self, node_name: str):
+        for component in self.components.values():
+            if component.has_node(node_name):
+                self._node_index[node_name] = component
+                return
+
+    def add_node(self, component_name: str, node: Node):
+        component = self.components[component_name]
+        component.add_node(node)
+        self._node_index.setdefault(node.name, component)
+        self.invalidate(LoaderPhase.CLASSES, LoaderPhase.LINKS)
+
+    def get_component_by_node(self, node_name: str) -> Optional[Component]:
+        return self._node_index.get(node_name)
+
+    def _add_link(self, source: Component, target: Component) -> bool:
+        for component in (source, target):
+            if component.name not in self.graph:
+                self.graph.add_node(component.name, component)
+
+        return self.graph.add_edge(source.name, target.name)
 
     def link_component(self, source, target):
-        link = Link(source, target)
-        self.links.append(link)
+        if self._add_link(source, target):
+            self.invalidate(LoaderPhase.INSTABILITY)
+
+    def unlink_component(self, source: Component, target: Component):
+        if self.graph.remove_edge(source.name, target.name):
+            self.invalidate(LoaderPhase.INSTABILITY)
+
+    def get_fan_in(self, component_name: str) -> int:
+        """Afferent coupling, number of links that target the component"""
+        return self.graph.get_in_degree(component_name)
+
+    def get_fan_out(self, component_name: str) -> int:
+        """Efferent coupling, number of links that start from the component"""
+        return self.graph.get_out_degree(component_name)
+
+    def get_coupling(self, component_name: str) -> Tuple[int, int]:
+        """Afferent and efferent coupling of the component"""
+        return self.get_fan_in(component_name), self.get_fan_out(component_name)
+
+    def get_dependencies(self, component_name: str) -> List[str]:
+        """Names of the components linked from the component"""
+        return self.graph.get_successors(component_name)
+
+    def get_dependants(self, component_name: str) -> List[str]:
+        """Names of the components that link to the component"""
+        return self.graph.get_predecessors(component_name)
+
+    def get_link_groups(self) -> List[List[str]]:
+        """Groups of components that link to each other, directly or through
+        other components, in topological order"""
+        return self.graph.get_strongly_connected_components()
+
+    def has_link(self, source: Component, target: Component) -> bool:
+        return self.graph.has_edge(source.name, target.name)
+
+    def get_links(self) -> List[Link]:
+        get_data = self.graph.get_data
+        return [
+            Link(get_data(source), get_data(target))
+            for source, target in self.graph.get_edges()
+        ]
+
+    def get_errors(self) -> Dict[str, str]:
+        """Errors found while loading, by the name of the failed node"""
 
-    def get_links(self):
-        return self.links
+        return {}
@@ -1,16 +1,52 @@
+from concurrent.futures import ProcessPoolExecutor
 import os
 from pathlib import Path
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Set
 
-from basel import utils
+from basel import config
+from basel import metrics
 from basel.components import Component
 from basel.components.classes import ClassNode
 from basel.components.modules import ModuleNode
 from basel.loaders import Loader
+from basel.loaders.discovery import ModuleDiscovery
+from basel.loaders.exclusion import ExclusionRules
+from basel.loaders.granularity import ComponentGrouper
+from basel.loaders.index import ModuleIndex
+from basel.loaders.loaders import LoaderPhase
+from basel.loaders.prefetch import prefetch_summaries
+from basel.loaders.resolver import ImportResolver
+from basel.parsers import ModuleSummary
 
 
 class ModuleLoader(Loader):
+    parallel_threshold = 32
+
+    def __init__(
+        self,
+        *args,
+        jobs: int = 1,
+        prefetch: int = 0,
+        source_roots: Optional[List[Path]] = None,
+        ignore_dirs: Optional[List[str]] = config.IGNORE_DIRS,
+        use_gitignore: bool = False,
+        **kwargs,
+    ) -> None:
+        self._summaries: Dict[str, ModuleSummary] = {}
+        self._importers: Optional[Dict[str, Set[str]]] = None
+        self.exclusion_rules: Optional[ExclusionRules] = None
+        self.source_roots = list(source_roots or [])
+        self.ignore_dirs = ignore_dirs
+        self.use_gitignore = use_gitignore
+        self._set_module_index(ModuleIndex(self._get_source_roots()))
+        self.jobs = jobs
+        self.prefetch = prefetch
+        super().__init__(*args, **kwargs)
+
     def load_components(
         self,
         paths: List[str],
@@ -18,10 +54,15 @@ class ModuleLoader(Loader):
         exclude_components: Optional[List[str]] = None,
         exclude_packages: Optional[List[str]] = None,
     ):
-        modules = self._discover_modules(paths)
+        self.clear()
+        self._summaries.clear()
+        self._importers = None
 
-        rules = self._get_path_rules(exclude_components, exclude_packages)
-        modules = self._exclude_modules(modules, rules)
+        # kept with the .gitignore rules found while discovering the modules
+        self.exclusion_rules = self.get_exclusion_rules(
+            exclude_components, exclude_packages
+        )
+        modules = self._discover_modules(paths, self.exclusion_rules)
 
         self.add_modules(modules)
 
@@ -32,94 +73,182 @@ class ModuleLoader(Loader):
 
         return rules
 
-    def _exclude_modules(self, modules: List[Path], rules):
-        _alt_modules = []
+    def get_exclusion_rules(self, modules, include_packages=True) -> ExclusionRules:
+        return ExclusionRules(
+            self._get_path_rules(modules, include_packages),
+            ignore_dirs=self.ignore_dirs,
+            use_gitignore=self.use_gitignore,
+        )
 
-        if not rules:
-            return modules
+    def _search_linked_component(self, module_path):
+        return self.get_component_by_node(module_path)
+
+    def _get_summary(self, module_path) -> ModuleSummary:
+        summary = self._summaries.get(module_path)
+        if summary is None:
+            summary = self.parser.get_summary(module_path)
+            self._summaries[module_path] = summary
+
+        return summary
+
+    @staticmethod
+    def _get_module_size(module_path) -> int:
+        try:
+            return os.path.getsize(module_path)
+        except OSError:
+            return 0
+
+    def _load_summaries(self):
+        """Parse the pending modules across a process pool, or in this process
+        while the next modules are prefetched
+
+        The biggest modules are scheduled first so no worker is left parsing a
+        large file at the end, results are stored in the order of the modules
+        so the loaders and the errors follow the same order as a serial run.
+        """
+
+        module_paths = [
+            node.name
+            for comp in self.components.values()
+            for node in comp
+            if node.name not in self._summaries
+        ]
+
+        if self.jobs <= 1 or len(module_paths) < self.parallel_threshold:
+            if self.prefetch:
+                summaries = prefetch_summaries(
+                    module_paths,
+                    self.parser.get_summary,
+                    self.prefetch,
+                    self.parser.get_cached_summary,
+                )
+                self._summaries.update(summaries)
+
+            return
+
+        scheduled_paths = sorted(module_paths, key=self._get_module_size, reverse=True)
+        chunksize = max(1, len(module_paths) // (self.jobs * 8))
+
+        # workers start from the size counted here instead of scanning the
+        # cache on every chunk, the real size is counted again at the end
+        cache = getattr(self.parser, "cache", None)
+        if cache:
+            cache.get_size()
+
+        summaries = {}
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            results = executor.map(
+                self.parser.get_summary, scheduled_paths, chunksize=chunksize
+            )
+            for module_path, summary in zip(scheduled_paths, results):
+                # strings are no longer interned once they cross processes
+                summaries[module_path] = ModuleSummary.create(
+                    summary.imports, summary.classes, summary.error
+                )
 
-        for module in modules:
-            if not all(module.match(rule) for rule in rules):
-                _alt_modules.append(module)
+        for module_path in module_paths:
+            self._summaries[module_path] = summaries[module_path]
 
-        return _alt_modules
+        if cache:
+            cache.sync()
 
-    def _search_linked_component(self, module_path):
-        for comp in self.components.values():
-            if comp.has_node(module_path):
-                return comp
+    def get_errors(self) -> Dict[str, str]:
+        return {
+            module_path: summary.error
+            for module_path, summary in self._summaries.items()
+            if summary.error
+        }
+
+    def _get_source_roots(self) -> List[Path]:
+        return self.source_roots + [Path(os.curdir)]
+
+    def _set_module_index(self, module_index: ModuleIndex):
+        self.module_index = module_index
+        self.resolver = ImportResolver(module_index)
 
     def _get_imports_from_component_nodes(self, component):
         _imports = []
         for node in component:
-            _imports.extend(self.parser.get_imports(node.name))
+            for _import in self._get_summary(node.name).imports:
+                _imports.append((node.name, _import))
 
         return _imports
 
     def _exists_link(self, source_comp: Component, target_comp: Component):
-        for link in self.links:
-            if link.source == source_comp and link.target == target_comp:
-                return True
+        return self.has_link(source_comp, target_comp)
 
-        return False
+    def _link_imports(self, comp: Component):
+        for node_name, _import in self._get_imports_from_component_nodes(comp):
+            module_path = self.search_py_module(_import, node_name)
+            linked_component = self._search_linked_component(str(module_path))
+            if not linked_component or self._exists_link(comp, linked_component):
+                continue
 
-    def load_links(self):
-        for comp_name, comp in self.components.items():
-            comp_imports = self._get_imports_from_component_nodes(comp)
-            for _import in comp_imports:
-                module_path = self.search_py_module(_import)
-                linked_component = self._search_linked_component(str(module_path))
-                if linked_component and not self._exists_link(comp, linked_component):
-                    self.link_component(comp, linked_component)
+            # imports between modules of the same component are not links
+            if linked_component is comp and str(module_path) != node_name:
+                continue
 
-    def _format_to_py_module_path(self, _import: str):
-        return Path(_import.replace(".", "/") + ".py")
+            self.link_component(comp, linked_component)
 
-    def _format_to_py_package_path(self, _import: str):
-        return Path(_import.replace(".", "/")) / "__init__.py"
+    def load_links(self):
+        if not self.is_stale(LoaderPhase.LINKS):
+            return
+
+        self._load_summaries()
+        for comp in self.components.values():
+            self._link_imports(comp)
 
-    def search_py_module(self, _import: str):
-        _parent_import = ".".join(_import.split(".")[:-1])
-        search_attemps = [_import, _parent_import]
+        self._mark_fresh(LoaderPhase.LINKS)
 
-        for _import in search_attemps:
-            module = self._get_local_py_module(_import)
-            if module:
-                return module
+    def search_py_module(self, _import: str, module_path: Optional[str] = None):
+        """Search the discovered module imported by ``module_path``"""
+        return self.resolver.resolve(_import, module_path)
 
     def _load_classes_for_node(self, node):
-        _classes = self.parser.get_classes(node.name)
+        _classes = self._get_summary(node.name).classes
         for _class in _classes:
             class_node = ClassNode(*_class)
             node.add_child(class_node)
 
     def load_classes(self):
+        if not self.is_stale(LoaderPhase.CLASSES):
+            return
+
+        self._load_summaries()
         for comp_name, comp in self.components.items():
             for node in comp:
                 self._load_classes_for_node(node)
 
-    def _get_input_and_output_deps_of_component(self, component):
-        input_deps = output_deps = 0
-
-        for link in self.links:
-            if link.source.name == component.name:
-                output_deps += 1
-            elif link.target.name == component.name:
-                input_deps += 1
-
-        return input_deps, output_deps
+        self._mark_fresh(LoaderPhase.CLASSES)
 
     def calculate_error(self):
-        for comp in self.components.values():
-            error = utils.abs_error_to_main_sequence(comp.instability, comp.abstraction)
+        if not self.is_stale(LoaderPhase.ERROR):
+            return
+
+        components = list(self.components.values())
+        errors = metrics.abs_error_to_main_sequence(
+            [comp.instability for comp in components],
+            [comp.abstraction for comp in components],
+        )
+        for comp, error in zip(components, errors):
             comp.set_error(error)
 
+        self._mark_fresh(LoaderPhase.ERROR)
+
     def calculate_instability(self):
         self.load_links()
-        for comp in self.components.values():
-            input_deps, output_deps = self._get_input_and_output_deps_of_component(comp)
-            comp_instability = utils.instability(input_deps, output_deps)
-            comp.set_instability(comp_instability)
+        if not self.is_stale(LoaderPhase.INSTABILITY):
+            return
+
+        components = list(self.components.values())
+        instabilities = metrics.instability(
+            [self.get_fan_in(comp.name) for comp in components],
+            [self.get_fan_out(comp.name) for comp in components],
+        )
+        for comp, instability in zip(components, instabilities):
+            comp.set_instability(instability)
+
+        self._mark_fresh(LoaderPhase.INSTABILITY)
 
     def _get_abs_and_imp_classes_of_comp(self, comp):
         abstract_classes = implementation_classes = 0
@@ -141,22 +270,160 @@ class ModuleLoader(Loader):
 
     def calculate_abstraction(self):
         self.load_classes()
-        for comp in self.components.values():
-            abs_classes, imp_classes = self._get_abs_and_imp_classes_of_comp(comp)
-            comp_abstraction = utils.abstraction(abs_classes, imp_classes)
-            comp.set_abstraction(comp_abstraction)
+        if not self.is_stale(LoaderPhase.ABSTRACTION):
+            return
+
+        components = list(self.components.values())
+        class_counts = [
+            self._get_abs_and_imp_classes_of_comp(comp) for comp in components
+        ]
+        abstractions = metrics.abstraction(
+            [abs_classes for abs_classes, _ in class_counts],
+            [imp_classes for _, imp_classes in class_counts],
+        )
+        for comp, abstraction in zip(components, abstractions):
+            comp.set_abstraction(abstraction)
+
+        self._mark_fresh(LoaderPhase.ABSTRACTION)
+
+    @staticmethod
+    def _get_module_name(module_path: Path) -> str:
+        """Last name of the imports that reach the module"""
+
+        if module_path.name == "__init__.py":
+            return module_path.parent.name
+
+        return module_path.stem
+
+    def _get_import_keys(self, module_name: str, _import: str) -> List[str]:
+        """Names used by an import, and for relative imports the absolute
+        path of the package they start from, which they fall back to"""
+
+        keys = _import.lstrip(".").split(".")
+        level = self.resolver.get_level(_import)
+        if level:
+            package = os.path.dirname(os.path.abspath(module_name))
+            keys.append(os.path.normpath(os.path.join(package, *[".."] * (level - 1))))
+
+        return keys
+
+    def _index_importer(self, module_name: str, index: bool = True):
+        for _import in self._get_summary(module_name).imports:
+            for key in self._get_import_keys(module_name, _import):
+                importers = self._importers.setdefault(key, set())
+                if index:
+                    importers.add(module_name)
+                else:
+                    importers.discard(module_name)
+
+    def _get_importers(self) -> Dict[str, Set[str]]:
+        """Modules by the names their imports use and by the packages their
+        relative imports start from, built on the first update"""
+
+        if self._importers is None:
+            self._importers = {}
+            for comp in self.components.values():
+                for node in comp:
+                    self._index_importer(node.name)
+
+        return self._importers
+
+    def update_modules(
+        self, modified: Iterable[Path], removed: Iterable[Path] = ()
+    ) -> Set[str]:
+        """Patch the loaded modules after their files changed.
+
+        Modified modules are parsed again, the ones not loaded yet are added
+        and the removed ones dropped along with their links. Only the links of
+        the modified modules, and of the modules that import a name or a
+        package path of an added or removed module, are resolved again, so
+        the cost follows the size of the change instead of the size of the
+        tree.
+
+        :return: names of the modules whose links were resolved again
+        """
+
+        self.load_classes()
+        self.load_links()
+        importers = self._get_importers()
+
+        modified = list(modified)
+        changed_names: Set[str] = set()
+        relinked: Set[str] = set()
+
+        for module_path in removed:
+            module_name = str(module_path)
+            component = self.get_component_by_node(module_name)
+            if component is None:
+                continue
+
+            self._index_importer(module_name, index=False)
+            self._summaries.pop(module_name, None)
+            self.module_index.remove_module(module_path)
+            self.remove_component(component.name)
+            changed_names.add(self._get_module_name(module_path))
+            changed_names.add(self.module_index.get_key(module_path))
+
+        for module_path in modified:
+            module_name = str(module_path)
+            if self.get_component_by_node(module_name) is None:
+                # imports of new directories reached nothing before
+                directory = module_path.parent
+                while os.path.abspath(directory) not in self.module_index.directories:
+                    self.module_index.add_directory(directory)
+                    changed_names.add(directory.name)
+                    changed_names.add(os.path.abspath(directory))
+                    if directory == directory.parent:
+                        break
+
+                    directory = directory.parent
+
+                self.module_index.add_module(module_path)
+                self.add_modules([module_path])
+                changed_names.add(self._get_module_name(module_path))
+                changed_names.add(self.module_index.get_key(module_path))
+            else:
+                self._index_importer(module_name, index=False)
+                self._summaries.pop(module_name, None)
+
+            relinked.add(module_name)
+
+        if changed_names:
+            self.resolver.clear()
+
+        for name in changed_names:
+            relinked.update(importers.get(name, ()))
+
+        self._load_summaries()
+        for module_path in modified:
+            module_name = str(module_path)
+            node = self.get_component_by_node(module_name).get_node(module_name)
+            for class_node in node.get_children():
+                node.remove_child(class_node.name)
+
+            self._load_classes_for_node(node)
+            self._index_importer(module_name)
+
+        components = {}
+        for module_name in relinked:
+            component = self.get_component_by_node(module_name)
+            if component is not None:
+                components[component.name] = component
+
+        dependencies = {name: self.get_dependencies(name) for name in components}
+        for name, targets in dependencies.items():
+            for target in targets:
+                self.unlink_component(components[name], self.components[target])
 
-    def _get_local_py_module(self, _import: str):
-        py_module = self._format_to_py_module_path(_import)
-        if os.path.exists(py_module):
-            return py_module
+        for component in components.values():
+            self._link_imports(component)
 
-        py_package = self._format_to_py_package_path(_import)
-        if os.path.exists(py_package):
-            return py_package
+        # classes and links were patched, only the metrics are computed again
+        self._mark_fresh(LoaderPhase.CLASSES)
+        self._mark_fresh(LoaderPhase.LINKS)
+        self.invalidate(LoaderPhase.ABSTRACTION, LoaderPhase.INSTABILITY)
 
-        if os.path.isdir(py_package.parent):
-            return py_package.parent
+        return relinked
 
     def add_modules(self, modules: List[Path]):
         for module_path in modules:
@@ -166,28 +433,83 @@ class ModuleLoader(Loader):
 
             self.add_component(component)
 
-    def _discover_modules(self, paths: List[str]):
-        discovered_modules = []
+    def group_components(self, grouper: ComponentGrouper) -> "ModuleLoader":
+        """Loader with the modules of this one grouped into components.
+
+        Classes and links are taken from this loader in a single pass over
+        its nodes and links, so nothing is parsed again and other groupings
+        can be built from the same loader.
+        """
+
+        self.load_classes()
+        self.load_links()
+
+        loader = ModuleLoader(
+            self.parser,
+            jobs=self.jobs,
+            prefetch=self.prefetch,
+            source_roots=self.source_roots,
+            ignore_dirs=self.ignore_dirs,
+            use_gitignore=self.use_gitignore,
+        )
+        loader._summaries = self._summaries
+        loader.module_index = self.module_index
+        loader.resolver = self.resolver
+
+        groups: Dict[str, List[ModuleNode]] = {}
+        for comp in self.components.values():
+            for node in comp:
+                component_name = grouper.get_component_name(node.name)
+                groups.setdefault(component_name, []).append(node)
+
+        for component_name, nodes in groups.items():
+            loader.add_component(Component(name=component_name, nodes=nodes))
+
+        for source, target in self.graph.get_edges():
+            source_comp = loader.get_component_by_node(source)
+            target_comp = loader.get_component_by_node(target)
+            if not source_comp or not target_comp:
+                continue
+
+            if source_comp is target_comp and source != target:
+                continue
 
-        for path in paths:
-            for root, packages, modules in os.walk(path):
-                for module in sorted(modules):
-                    if not module.endswith(".py"):
-                        continue
+            loader.link_component(source_comp, target_comp)
 
-                    module_path = Path(root) / module
-                    discovered_modules.append(module_path)
+        loader._mark_fresh(LoaderPhase.CLASSES)
+        loader._mark_fresh(LoaderPhase.LINKS)
+
+        return loader
+
+    def _discover_modules(
+        self, paths: List[str], rules: Optional[ExclusionRules] = None
+    ) -> List[Path]:
+        """Discover the python modules of the paths, excluded directories are
+        never walked into"""
+
+        if rules is None:
+            rules = ExclusionRules(ignore_dirs=self.ignore_dirs)
+
+        discovery = ModuleDiscovery(rules, jobs=self.jobs)
+        modules, directories = discovery.discover(paths)
+
+        self._set_module_index(ModuleIndex(self._get_source_roots()))
+        for directory in directories:
+            self.module_index.add_directory(directory)
+
+        for module_path in modules:
+            self.module_index.add_module(module_path)
 
-        return sorted(discovered_modules)
+        return modules
 
     def calculate_mean_error(self):
         errors = [comp.error for comp in self.get_components()]
-        return utils.mean(errors)
+        return metrics.mean(errors)
 
     def calculate_mean_abstraction(self):
         abstractions = [comp.abstraction for comp in self.get_components()]
-        return utils.mean(abstractions)
+        return metrics.mean(abstractions)
 
     def calculate_mean_instability(self):
         instabilities = [comp.instability for comp in self.get_components()]
-        return utils.mean(instabilities)
+        return metrics.mean(instabilities)
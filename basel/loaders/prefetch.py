@@ -0,0 +1,102 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from basel.parsers import ModuleSummary
+
+SummaryParser = Callable[[str, Optional[bytes]], ModuleSummary]
+CachedSummaryGetter = Callable[[str], Optional[ModuleSummary]]
+
+
+def read_module(module_path: str) -> bytes:
+    with open(module_path, "rb") as module:
+        return module.read()
+
+
+def _prefetch_module(
+    module_path: str, get_cached: Optional[CachedSummaryGetter]
+) -> Tuple[Optional[ModuleSummary], Optional[bytes]]:
+    """Cached summary of the module, or its source when it is not cached"""
+
+    if get_cached:
+        summary = get_cached(module_path)
+        if summary is not None:
+            return summary, None
+
+    try:
+        return None, read_module(module_path)
+    except OSError as e:
+        return ModuleSummary(error=f"{e.__class__.__name__}: {e}"), None
+
+
+async def _read_modules(
+    module_paths: Iterator[str],
+    queue: asyncio.Queue,
+    executor: ThreadPoolExecutor,
+    get_cached: Optional[CachedSummaryGetter],
+):
+    loop = asyncio.get_running_loop()
+    for module_path in module_paths:
+        summary, source = await loop.run_in_executor(
+            executor, _prefetch_module, module_path, get_cached
+        )
+        await queue.put((module_path, summary, source))
+
+
+async def _parse_modules(
+    module_paths: List[str],
+    parse: SummaryParser,
+    concurrency: int,
+    get_cached: Optional[CachedSummaryGetter],
+) -> Dict[str, ModuleSummary]:
+    queue = asyncio.Queue(maxsize=concurrency)
+    pending_paths = iter(module_paths)
+    summaries = {}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        readers = [
+            asyncio.create_task(
+                _read_modules(pending_paths, queue, executor, get_cached)
+            )
+            for _ in range(concurrency)
+        ]
+
+        try:
+            for _ in module_paths:
+                module_path, summary, source = await queue.get()
+                if summary is None:
+                    summary = parse(module_path, source)
+
+                summaries[module_path] = summary
+        finally:
+            for reader in readers:
+                reader.cancel()
+
+    # modules are read in any order, the summaries keep the given one
+    return {module_path: summaries[module_path] for module_path in module_paths}
+
+
+def prefetch_summaries(
+    module_paths: List[str],
+    parse: SummaryParser,
+    concurrency: int,
+    get_cached: Optional[CachedSummaryGetter] = None,
+) -> Dict[str, ModuleSummary]:
+    """Parse modules while the next ones are read in the background.
+
+    Up to ``concurrency`` reads are in flight at any time, and the modules
+    already read wait in a bounded queue to be parsed, so slow filesystems
+    do not serialize one read per module. Modules with a cached summary are
+    not read, and the ones that can not be read keep the error in their
+    summary.
+    """
+
+    if not module_paths:
+        return {}
+
+    return asyncio.run(_parse_modules(module_paths, parse, concurrency, get_cached))
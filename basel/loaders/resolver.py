@@ -0,0 +1,69 @@
+from functools import lru_cache
+import os
+from pathlib import Path
+from typing import Optional
+
+from basel import config
+from basel.loaders.index import ModuleIndex
+
+
+class ImportResolver:
+    """Resolve the imports of a module to the discovered modules.
+
+    Absolute imports are searched in the source roots of the index, relative
+    imports from the package of the importing module. Each (package, import)
+    pair is resolved once, the results are kept in a bounded LRU cache since
+    the same imports repeat across many modules.
+    """
+
+    def __init__(
+        self, index: ModuleIndex, maxsize: Optional[int] = config.RESOLVER_CACHE_SIZE
+    ):
+        self.index = index
+        self._resolve = lru_cache(maxsize=maxsize)(self._resolve_uncached)
+
+    @staticmethod
+    def get_level(_import: str) -> int:
+        return len(_import) - len(_import.lstrip("."))
+
+    def resolve(self, _import: str, module_path=None) -> Optional[Path]:
+        """Search the module of an import, or the module that holds the
+        imported object
+        :param _import: imported name, relative ones start with dots
+        :param module_path: path of the importing module
+        """
+
+        package = ""
+        if self.get_level(_import):
+            if module_path is None:
+                return None
+
+            package = os.path.dirname(os.path.abspath(module_path))
+
+        return self._resolve(package, _import)
+
+    def _resolve_uncached(self, package: str, _import: str) -> Optional[Path]:
+        level = self.get_level(_import)
+        name = _import[level:]
+        parts = name.split(".") if name else []
+
+        search_attemps = [parts]
+        if parts:
+            search_attemps.append(parts[:-1])
+
+        for attempt in search_attemps:
+            if level:
+                base = os.path.normpath(os.path.join(package, *[".."] * (level - 1)))
+                module = self.index.search_path(os.path.join(base, *attempt))
+            elif attempt:
+                module = self.index.search(".".join(attempt))
+            else:
+                module = None
+
+            if module:
+                return module
+
+        return None
+
+    def clear(self):
+        self._resolve.cache_clear()
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from dataclasses import field
+import os
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from basel.loaders.discovery import DIRECTORY
+from basel.loaders.discovery import FILE
+from basel.loaders.discovery import MODULE_SUFFIX
+from basel.loaders.discovery import ModuleDiscovery
+from basel.loaders.discovery import scan_directory
+from basel.loaders.exclusion import ExclusionRules
+
+Stamp = Tuple[int, int]
+
+
+def _get_stamp(path: str) -> Optional[Stamp]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class ModuleChanges:
+    modified: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.modified or self.removed)
+
+
+class ModuleWatcher:
+    """Find the modules changed, added or removed since the last poll.
+
+    Every poll stats the known modules and directories, without reading
+    them, and only lists again the directories whose mtime changed, which is
+    where modules are added or removed.
+    """
+
+    def __init__(
+        self,
+        modules: Iterable[Path],
+        directories: Iterable[Path],
+        rules: Optional[ExclusionRules] = None,
+    ):
+        self.rules = rules or ExclusionRules()
+        self._modules: Dict[str, Optional[Stamp]] = {
+            str(module_path): _get_stamp(str(module_path)) for module_path in modules
+        }
+        self._directories: Dict[str, Optional[Stamp]] = {
+            str(directory): _get_stamp(str(directory)) for directory in directories
+        }
+
+    def _add_directory(self, directory: str, changes: ModuleChanges):
+        modules, directories = ModuleDiscovery(self.rules).discover([directory])
+        for directory in directories:
+            self._directories[str(directory)] = _get_stamp(str(directory))
+
+        for module_path in modules:
+            if str(module_path) not in self._modules:
+                self._modules[str(module_path)] = _get_stamp(str(module_path))
+                changes.modified.append(module_path)
+
+    def _rescan_directory(self, directory: str, changes: ModuleChanges):
+        entries = scan_directory(directory) or []
+
+        for name, entry_type in entries:
+            # named like the discovered paths, e.g. a.py instead of ./a.py
+            path = str(Path(directory, name))
+            if entry_type == FILE:
+                if (
+                    name.endswith(MODULE_SUFFIX)
+                    and path not in self._modules
+                    and not self.rules.is_excluded_module(path)
+                ):
+                    self._modules[path] = _get_stamp(path)
+                    changes.modified.append(Path(path))
+            elif (
+                entry_type == DIRECTORY
+                and path not in self._directories
+                and not self.rules.is_excluded_dir(path)
+            ):
+                self._add_directory(path, changes)
+
+    def poll(self) -> ModuleChanges:
+        changes = ModuleChanges()
+
+        for directory, stamp in list(self._directories.items()):
+            current_stamp = _get_stamp(directory)
+            if current_stamp == stamp:
+                continue
+
+            if current_stamp is None:
+                del self._directories[directory]
+                continue
+
+            self._directories[directory] = current_stamp
+            self._rescan_directory(directory, changes)
+
+        added = {str(module_path) for module_path in changes.modified}
+        for module_name, stamp in list(self._modules.items()):
+            if module_name in added:
+                continue
+
+            current_stamp = _get_stamp(module_name)
+            if current_stamp == stamp:
+                continue
+
+            if current_stamp is None:
+                del self._modules[module_name]
+                changes.removed.append(Path(module_name))
+            else:
+                self._modules[module_name] = current_stamp
+                changes.modified.append(Path(module_name))
+
+        return changes
@@ -1,15 +1,28 @@
 import argparse
+import os
 from pathlib import Path
 import sys
+from typing import List
+from typing import Optional
+from typing import Type
 
 from basel import config
 from basel import ReportFormat
 from basel.client import Basel
 from basel.dtos import LogType
+from basel.dtos import Result
 from basel.exporters import FileExporter
 from basel.loaders import ModuleLoader
+from basel.loaders.granularity import get_grouper
+from basel.parsers import ImportScope
+from basel.parsers import ParseCache
 from basel.parsers import PythonParser
 from basel.reports import Reporter
+from basel.reports.filters import compile_where
+from basel.server import is_loopback_host
+from basel.server import send_request
+from basel.server import serve
+from basel.server import WarmBasel
 
 COMMANDS = {
     "report": {
@@ -17,9 +30,12 @@ COMMANDS = {
         "args": [
             ("path", "root_path"),
             ("exclude", "exclude_components"),
-            ("no-packages", "exclude_packages"),
+            ("no_packages", "exclude_packages"),
             ("filter", "filter_by_components"),
+            ("where", "where"),
             ("format", "report_format"),
+            ("granularity", "granularity"),
+            ("component_map", "component_map"),
         ],
     },
     "rel": {
@@ -27,9 +43,71 @@ COMMANDS = {
         "args": [
             ("path", "root_path"),
             ("exclude", "exclude_components"),
-            ("no-packages", "exclude_packages"),
+            ("no_packages", "exclude_packages"),
             ("filter", "filter_by_components"),
+            ("where", "where"),
             ("format", "report_format"),
+            ("granularity", "granularity"),
+            ("component_map", "component_map"),
+            ("sparse", "sparse"),
+        ],
+    },
+    "snapshot": {
+        "method": "snapshot",
+        "args": [
+            ("path", "root_path"),
+            ("exclude", "exclude_components"),
+            ("no_packages", "exclude_packages"),
+            ("granularity", "granularity"),
+            ("component_map", "component_map"),
+            ("output", "output"),
+        ],
+    },
+    "diff": {
+        "method": "diff",
+        "path_required": False,
+        "args": [
+            ("base", "base_snapshot"),
+            ("head", "head_snapshot"),
+            ("path", "root_path"),
+            ("exclude", "exclude_components"),
+            ("no_packages", "exclude_packages"),
+            ("granularity", "granularity"),
+            ("component_map", "component_map"),
+            ("fail_on", "fail_on"),
+            ("format", "report_format"),
+        ],
+    },
+    "watch": {
+        "method": "watch",
+        "stream": True,
+        "args": [
+            ("path", "root_path"),
+            ("exclude", "exclude_components"),
+            ("no_packages", "exclude_packages"),
+            ("filter", "filter_by_components"),
+            ("where", "where"),
+            ("format", "report_format"),
+            ("granularity", "granularity"),
+            ("component_map", "component_map"),
+            ("interval", "interval"),
+        ],
+    },
+    "serve": {
+        "path_required": False,
+        "args": [],
+    },
+    "cycles": {
+        "method": "cycles",
+        "args": [
+            ("path", "root_path"),
+            ("exclude", "exclude_components"),
+            ("no_packages", "exclude_packages"),
+            ("filter", "filter_by_components"),
+            ("where", "where"),
+            ("format", "report_format"),
+            ("granularity", "granularity"),
+            ("component_map", "component_map"),
         ],
     },
 }
@@ -51,23 +129,106 @@ def cast_list_string(string):
         return string.split(",")
 
 
-def setup_basel_client() -> Basel:
-    parser = PythonParser()
-    loader = ModuleLoader(parser)
+def validate_where(expression):
+    try:
+        compile_where(expression)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+    return expression
+
+
+def validate_granularity(granularity):
+    try:
+        get_grouper(granularity)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+    return granularity
+
+
+def setup_basel_client(
+    cache_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    prefetch: int = 0,
+    import_scope: ImportScope = ImportScope.FULL,
+    use_pyc: bool = False,
+    source_roots: Optional[List[Path]] = None,
+    ignore_dirs: Optional[List[str]] = config.IGNORE_DIRS,
+    use_gitignore: bool = False,
+    client_class: Type[Basel] = Basel,
+) -> Basel:
+    cache = None
+    if cache_dir:
+        cache = ParseCache(cache_dir)
+
+    parser = PythonParser(cache=cache, scope=import_scope, use_bytecode=use_pyc)
+    loader = ModuleLoader(
+        parser,
+        jobs=jobs or 1,
+        prefetch=prefetch,
+        source_roots=source_roots,
+        ignore_dirs=ignore_dirs,
+        use_gitignore=use_gitignore,
+    )
 
     reporter = Reporter(loader)
     exporter = FileExporter()
 
-    client = Basel(loader, exporter, reporter)
+    client = client_class(loader, exporter, reporter)
 
     return client
 
 
 HELPER_FOOTER_LOG = """
-FORMATS: basic|html|mean_i|mean_a|mean|uml
+FORMATS: basic|html|mean_i|mean_a|mean|uml|adjacency
+FAIL ON: edges|I>N|A>N|E>N
 """
 
 
+CLEAR_SCREEN = "\033[2J\033[H"
+
+# options of the loading, set when starting 'basel serve'
+SERVE_OPTIONS = (
+    "cache_dir",
+    "no_cache",
+    "jobs",
+    "prefetch",
+    "import_scope",
+    "use_pyc",
+    "source_roots",
+    "gitignore",
+    "no_default_ignores",
+)
+
+
+def print_result(result):
+    """Print the content to stdout and the logs to stderr, so the output of
+    a report can be piped or redirected without them"""
+
+    error_color = "\033[91m"
+    success_color = "\033[92m"
+    warning_color = "\033[93m"
+    reset_color = "\033[0m"
+
+    stderr = ""
+    for log in result.logs:
+        color = success_color
+        if log.type == LogType.ERROR:
+            color = error_color
+        elif log.type == LogType.WARNING:
+            color = warning_color
+
+        stderr += f"{color}{log.content}{reset_color}\n"
+
+    if stderr:
+        sys.stderr.write(stderr)
+        sys.stderr.flush()
+
+    if result.content:
+        print(result.content)
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog=config.PROJECT_NAME,
@@ -75,8 +236,8 @@ def main():
         epilog=HELPER_FOOTER_LOG,
     )
 
-    parser.add_argument("command", choices=["report", "rel"])
-    parser.add_argument("-p", "--path", required=True, type=Path, nargs="+")
+    parser.add_argument("command", choices=list(COMMANDS))
+    parser.add_argument("-p", "--path", type=Path, nargs="+")
 
     parser.add_argument(
         "-e",
@@ -88,10 +249,28 @@ def main():
         "-np", "--no-packages", action="store_true", help="Exculde all python package"
     )
 
+    parser.add_argument(
+        "--gitignore",
+        action="store_true",
+        help="Skip the modules and directories ignored by .gitignore files",
+    )
+    parser.add_argument(
+        "--no-default-ignores",
+        action="store_true",
+        help="Walk into directories like .git, venv or build too",
+    )
+
     parser.add_argument(
         "-f", "--filter", help="Filter Report by Components", type=cast_list_string
     )
 
+    parser.add_argument(
+        "-w",
+        "--where",
+        help="Filter Report by an expression, e.g. \"E > 0.7 and name ~ 'svc/**'\"",
+        type=validate_where,
+    )
+
     parser.add_argument(
         "-fmt",
         "--format",
@@ -100,39 +279,198 @@ def main():
         default=None,
     )
 
+    parser.add_argument(
+        "-g",
+        "--granularity",
+        help="Components to report: module, package or depth:N, 'module' by default",
+        type=validate_granularity,
+        default=None,
+    )
+    parser.add_argument(
+        "--component-map",
+        help="JSON file mapping module globs to component names",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="List the links of the rel report instead of building a matrix",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        help=f"File to save the snapshot, '{config.SNAPSHOT_PATH}' by default",
+        type=Path,
+        default=Path(config.SNAPSHOT_PATH),
+    )
+    parser.add_argument("--base", help="Snapshot to compare from", type=Path)
+    parser.add_argument(
+        "--head",
+        help="Snapshot to compare to, the --path analysis by default",
+        type=Path,
+    )
+    parser.add_argument(
+        "--fail-on",
+        help="Regressions that fail the diff, e.g. 'E>0.05,edges'",
+        type=cast_list_string,
+    )
+
+    parser.add_argument(
+        "--interval",
+        help=f"Seconds between checks for changes in watch, {config.WATCH_INTERVAL} "
+        "by default",
+        type=float,
+        default=config.WATCH_INTERVAL,
+    )
+
+    parser.add_argument(
+        "--host",
+        help=f"Address the server listens on, '{config.SERVER_HOST}' by default",
+        default=config.SERVER_HOST,
+    )
+    parser.add_argument(
+        "--port",
+        help=f"Port the server listens on, {config.SERVER_PORT} by default",
+        type=int,
+        default=config.SERVER_PORT,
+    )
+    parser.add_argument(
+        "--server",
+        help="URL of a running 'basel serve' to run the command in, "
+        f"e.g. http://{config.SERVER_HOST}:{config.SERVER_PORT}",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Directory to cache parsed modules, '{config.CACHE_DIR}' by default",
+        type=Path,
+        default=Path(config.CACHE_DIR),
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Parse all modules from scratch"
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of processes to parse modules, all cores by default",
+        type=int,
+        default=os.cpu_count(),
+    )
+
+    parser.add_argument(
+        "--prefetch",
+        help="Number of modules read ahead while parsing in a single process",
+        type=int,
+        default=0,
+    )
+
+    parser.add_argument(
+        "--import-scope",
+        help="Statements scanned for imports, 'full' by default",
+        type=ImportScope,
+        choices=[scope.value for scope in ImportScope],
+        default=ImportScope.FULL,
+    )
+
+    parser.add_argument(
+        "--use-pyc",
+        action="store_true",
+        help="Read modules from their __pycache__ bytecode when it is up to date",
+    )
+
+    parser.add_argument(
+        "--source-roots",
+        help="Directories to resolve absolute imports from, besides the current one",
+        type=Path,
+        nargs="+",
+        default=None,
+    )
+
     if len(sys.argv) == 1:
         parser.print_help()
         return
 
     _args = parser.parse_args()
 
-    basel = setup_basel_client()
-
     command_name = _args.command
     command_spec = COMMANDS.get(command_name)
 
-    method_name = command_spec.get("method")
-    method_args = get_args_from_namespace(command_name, _args)
+    if command_spec.get("path_required", True) and not _args.path:
+        parser.error("the following arguments are required: -p/--path")
+
+    if command_name == "diff" and not _args.base:
+        parser.error("the following arguments are required: --base")
+
+    if _args.server:
+        server_options = [
+            "--" + option.replace("_", "-")
+            for option in SERVE_OPTIONS
+            if getattr(_args, option) != parser.get_default(option)
+        ]
+        if server_options:
+            parser.error(
+                f"{', '.join(server_options)} can not be used with --server, "
+                "they are set when starting 'basel serve'"
+            )
+
+    cache_dir = None if _args.no_cache else _args.cache_dir
+    client_options = dict(
+        cache_dir=cache_dir,
+        jobs=_args.jobs,
+        prefetch=_args.prefetch,
+        import_scope=_args.import_scope,
+        use_pyc=_args.use_pyc,
+        source_roots=_args.source_roots,
+        ignore_dirs=None if _args.no_default_ignores else config.IGNORE_DIRS,
+        use_gitignore=_args.gitignore,
+    )
 
-    method = getattr(basel, method_name)
+    if command_name == "serve":
+        if not is_loopback_host(_args.host):
+            result = Result()
+            result.add_log(
+                f"The server listens on {_args.host}, anyone who can reach it "
+                "can read the analyzed project and write files in it",
+                LogType.WARNING,
+            )
+            print_result(result)
+
+        print(f"Serving on http://{_args.host}:{_args.port}")
+        serve(
+            _args.host,
+            _args.port,
+            lambda: setup_basel_client(**client_options, client_class=WarmBasel),
+        )
+        return
 
-    result = method(**method_args)
+    method_name = command_spec.get("method")
+    method_args = get_args_from_namespace(command_name, _args)
 
-    error_color = "\033[91m"
-    success_color = "\033[92m"
+    if command_spec.get("stream"):
+        basel = setup_basel_client(**client_options)
+        try:
+            for result in getattr(basel, method_name)(**method_args):
+                print(CLEAR_SCREEN, end="")
+                print_result(result)
+        except KeyboardInterrupt:
+            pass
 
-    stdout = ""
-    for log in result.logs:
-        color = success_color
-        if log.type == LogType.ERROR:
-            color = error_color
+        return
 
-        stdout += f"\n{color}{log.content}{color}"
+    if _args.server:
+        result = send_request(_args.server, method_name, method_args)
+    else:
+        basel = setup_basel_client(**client_options)
+        result = getattr(basel, method_name)(**method_args)
 
-    if result.content:
-        stdout += str(result.content)
+    print_result(result)
 
-    print(stdout)
+    if not result.success:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
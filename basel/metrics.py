@@ -0,0 +1,103 @@
+import operator
+from typing import List
+from typing import Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+COMPARISONS = {
+    "eq": operator.eq,
+    "not eq": operator.ne,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "lt": operator.lt,
+    "gt": operator.gt,
+}
+
+
+def _ratio(numerators: Sequence[float], others: Sequence[float]) -> List[float]:
+    """numerator / (numerator + other) of each component, 1 when both are 0.
+
+    Metrics take the values of every component at once and return one
+    result per component, computed with NumPy when it is installed. Results
+    are not rounded, rounding is left to the reports.
+    """
+
+    if numpy is not None:
+        numerators = numpy.asarray(numerators, dtype=float)
+        totals = numerators + numpy.asarray(others, dtype=float)
+        ratios = numpy.divide(
+            numerators, totals, out=numpy.ones_like(totals), where=totals != 0
+        )
+        return ratios.tolist()
+
+    return [
+        numerator / (numerator + other) if numerator + other else 1.0
+        for numerator, other in zip(numerators, others)
+    ]
+
+
+def instability(in_deps: Sequence[float], out_deps: Sequence[float]) -> List[float]:
+    """out_deps / (out_deps + in_deps) of each component
+
+    :param in_deps: input dependencies of each component
+    :param out_deps: output dependencies of each component
+    """
+
+    return _ratio(out_deps, in_deps)
+
+
+def abstraction(
+    abs_classes: Sequence[float], imp_classes: Sequence[float]
+) -> List[float]:
+    """abs_classes / (abs_classes + imp_classes) of each component
+
+    :param abs_classes: abstract classes of each component
+    :param imp_classes: implementation classes of each component
+    """
+
+    return _ratio(abs_classes, imp_classes)
+
+
+def abs_error_to_main_sequence(
+    instability: Sequence[float], abstraction: Sequence[float]
+) -> List[float]:
+    """|instability + abstraction - 1| of each component"""
+
+    if numpy is not None:
+        errors = numpy.abs(
+            numpy.asarray(instability, dtype=float)
+            + numpy.asarray(abstraction, dtype=float)
+            - 1
+        )
+        return errors.tolist()
+
+    return [abs(i + a - 1) for i, a in zip(instability, abstraction)]
+
+
+def mean(values: Sequence[float]) -> float:
+    if not len(values):
+        return 0
+
+    if numpy is not None:
+        return float(numpy.mean(numpy.asarray(values, dtype=float)))
+
+    return sum(values) / len(values)
+
+
+def compare(values: Sequence, op: str, value) -> List[bool]:
+    """Compare every value with the same operand
+
+    :param op: one of the keys of ``COMPARISONS``
+    """
+
+    comparison = COMPARISONS[op]
+    if numpy is not None:
+        try:
+            return comparison(numpy.asarray(values, dtype=float), value).tolist()
+        except (TypeError, ValueError):
+            pass
+
+    return [comparison(item, value) for item in values]
@@ -1,4 +1,15 @@
+from basel.parsers.cache import ParseCache
+from basel.parsers.parser import ClassRecord
+from basel.parsers.parser import ModuleSummary
 from basel.parsers.parser import Parser
 from basel.parsers.python_parser import PythonParser
+from basel.parsers.visitors import ImportScope
 
-__all__ = ["Parser", "PythonParser"]
+__all__ = [
+    "ClassRecord",
+    "ImportScope",
+    "ModuleSummary",
+    "ParseCache",
+    "Parser",
+    "PythonParser",
+]
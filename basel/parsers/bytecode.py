@@ -0,0 +1,205 @@
+import dis
+import importlib.util
+import itertools
+import marshal
+import os
+from types import CodeType
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from basel.parsers.parser import ModuleSummary
+from basel.parsers.sources import open_source
+from basel.parsers.visitors import get_imported_name
+
+PYC_HEADER_SIZE = 16
+
+_LOAD_CONST_OPS = {"LOAD_CONST", "LOAD_SMALL_INT"}
+_LOAD_NAME_OPS = {
+    "LOAD_NAME",
+    "LOAD_GLOBAL",
+    "LOAD_FAST",
+    "LOAD_FAST_BORROW",
+    "LOAD_DEREF",
+    "LOAD_CLASSDEREF",
+    "LOAD_FROM_DICT_OR_DEREF",
+    "LOAD_FROM_DICT_OR_GLOBALS",
+}
+_LOAD_ATTR_OPS = {"LOAD_ATTR", "LOAD_METHOD"}
+_IGNORED_OPS = {"PUSH_NULL", "PRECALL", "CACHE", "NOP", "EXTENDED_ARG"}
+_CALL_OPS = {"CALL", "CALL_FUNCTION"}
+_CALL_KW_OPS = {"CALL_KW", "CALL_FUNCTION_KW"}
+
+
+_SCANNED_OPCODES = bytes([dis.opmap["IMPORT_NAME"], dis.opmap["LOAD_BUILD_CLASS"]])
+
+
+class UnsupportedBytecode(Exception):
+    pass
+
+
+def load_fresh_code(path) -> Optional[CodeType]:
+    """Load the code object cached in __pycache__ for a module, only when the
+    pyc header still matches the source mtime and size, or its hash"""
+
+    try:
+        pyc_path = importlib.util.cache_from_source(os.fspath(path))
+        with open(pyc_path, "rb") as pyc:
+            data = pyc.read()
+
+        stat = os.stat(path)
+    except (OSError, NotImplementedError, ValueError):
+        return None
+
+    if len(data) < PYC_HEADER_SIZE or data[:4] != importlib.util.MAGIC_NUMBER:
+        return None
+
+    flags = int.from_bytes(data[4:8], "little")
+    if flags & 0b1:
+        try:
+            with open_source(path) as source:
+                source_hash = importlib.util.source_hash(source)
+        except OSError:
+            return None
+
+        if data[8:16] != source_hash:
+            return None
+    else:
+        mtime = int.from_bytes(data[8:12], "little")
+        size = int.from_bytes(data[12:16], "little")
+        if mtime != int(stat.st_mtime) & 0xFFFFFFFF:
+            return None
+
+        if size != stat.st_size & 0xFFFFFFFF:
+            return None
+
+    try:
+        code = marshal.loads(memoryview(data)[PYC_HEADER_SIZE:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(code, CodeType):
+        return None
+
+    return code
+
+
+class BytecodeScanner:
+    """Recover the imports and classes of a module from its code object,
+    following the same rules as the SummaryVisitor with the full scope"""
+
+    def __init__(self):
+        self.imports: Set[str] = set()
+        self.classes: List[Tuple[str, List[str], Dict[str, str]]] = []
+
+    def scan(self, code: CodeType):
+        # disassembling is slow, most code objects are function bodies
+        # without imports or classes, only their nested code is scanned
+        opcodes = code.co_code[::2]
+        if not any(opcode in opcodes for opcode in _SCANNED_OPCODES):
+            for const in code.co_consts:
+                if isinstance(const, CodeType):
+                    self.scan(const)
+            return
+
+        instructions = list(dis.get_instructions(code))
+
+        for idx, instruction in enumerate(instructions):
+            if instruction.opname == "IMPORT_NAME":
+                self._add_import(instructions, idx)
+
+            elif instruction.opname == "LOAD_BUILD_CLASS":
+                self.classes.append(self._get_class(code, instructions, idx))
+
+            elif instruction.opname in _LOAD_CONST_OPS and isinstance(
+                instruction.argval, CodeType
+            ):
+                self.scan(instruction.argval)
+
+    def _add_import(self, instructions, idx):
+        if idx < 2:
+            raise UnsupportedBytecode(instructions[idx])
+
+        level, fromlist = instructions[idx - 2], instructions[idx - 1]
+        if (
+            level.opname not in _LOAD_CONST_OPS
+            or fromlist.opname not in _LOAD_CONST_OPS
+        ):
+            raise UnsupportedBytecode(instructions[idx])
+
+        module = instructions[idx].argval
+
+        if not fromlist.argval:
+            self.imports.add(module)
+            return
+
+        for name in fromlist.argval:
+            self.imports.add(get_imported_name(level.argval, module, name))
+
+    def _get_class(self, code: CodeType, instructions, idx):
+        instructions = itertools.islice(instructions, idx + 1, None)
+
+        for instruction in instructions:
+            if instruction.opname == "MAKE_FUNCTION":
+                break
+        else:
+            raise UnsupportedBytecode(code)
+
+        instruction = next(instructions, None)
+        if not instruction or not isinstance(instruction.argval, str):
+            raise UnsupportedBytecode(code)
+
+        class_name = instruction.argval
+
+        values = []
+        keyword_names = ()
+        for instruction in instructions:
+            opname = instruction.opname
+            if opname in _LOAD_NAME_OPS:
+                values.append(instruction.argval)
+            elif opname in _LOAD_ATTR_OPS and values:
+                values[-1] = instruction.argval
+            elif opname == "KW_NAMES":
+                keyword_names = instruction.argval
+                if not isinstance(keyword_names, tuple):
+                    keyword_names = code.co_consts[instruction.arg]
+            elif opname in _LOAD_CONST_OPS and isinstance(instruction.argval, tuple):
+                keyword_names = instruction.argval
+            elif opname in _CALL_OPS or opname in _CALL_KW_OPS:
+                # __build_class__(function, name, *bases, **keywords), any
+                # other call is part of a base or keyword expression
+                if instruction.arg != 2 + len(values):
+                    raise UnsupportedBytecode(instruction)
+                break
+            elif opname not in _IGNORED_OPS:
+                raise UnsupportedBytecode(instruction)
+        else:
+            raise UnsupportedBytecode(code)
+
+        n_bases = len(values) - len(keyword_names)
+        if n_bases < 0:
+            raise UnsupportedBytecode(code)
+
+        _subclasses = values[:n_bases]
+        _kwargs = dict(zip(keyword_names, values[n_bases:]))
+
+        return (class_name, _subclasses, _kwargs)
+
+
+def get_bytecode_summary(path) -> Optional[ModuleSummary]:
+    """Get the module summary from its fresh pyc, None if it is stale, missing
+    or compiled from constructions the scanner does not understand"""
+
+    code = load_fresh_code(path)
+    if not code:
+        return None
+
+    scanner = BytecodeScanner()
+    try:
+        scanner.scan(code)
+    except UnsupportedBytecode:
+        return None
+
+    return ModuleSummary.create(scanner.imports, scanner.classes)
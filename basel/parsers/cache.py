@@ -0,0 +1,184 @@
+import hashlib
+import marshal
+import os
+from pathlib import Path
+from typing import Optional
+
+from basel import config
+from basel.parsers.parser import ModuleSummary
+from basel.parsers.sources import open_source
+from basel.parsers.sources import Source
+
+CACHE_VERSION = 2
+
+
+class ParseCache:
+    """Persist parser results between runs.
+
+    Every module is stored in its own entry, named after the module path, with
+    the mtime, size and content digest of the file it was parsed from. Entries
+    are serialized with marshal and the least recently used ones are evicted
+    once the directory grows over ``max_size`` bytes.
+    """
+
+    def __init__(self, directory, max_size: int = config.CACHE_MAX_SIZE):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self._size = None
+
+    @staticmethod
+    def digest(source: Source) -> bytes:
+        return hashlib.blake2b(source, digest_size=16).digest()
+
+    def _get_entry_path(self, path, variant: str) -> Path:
+        key = f"{variant}:{os.path.abspath(path)}".encode()
+        return self.directory / hashlib.sha1(key).hexdigest()
+
+    def _read_entry(self, entry_path: Path):
+        try:
+            with open(entry_path, "rb") as entry:
+                data = marshal.load(entry)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(data, tuple) or len(data) != 6:
+            return None
+
+        if data[0] != CACHE_VERSION:
+            return None
+
+        return data
+
+    def _write_entry(self, entry_path: Path, data) -> None:
+        content = marshal.dumps(data)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            size = self.get_size() - self._get_entry_size(entry_path)
+
+            with open(tmp_path, "wb") as entry:
+                entry.write(content)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            return
+
+        self._size = size + len(content)
+        if self._size > self.max_size:
+            self.evict()
+
+    @staticmethod
+    def _get_entry_size(entry_path: Path) -> int:
+        try:
+            return entry_path.stat().st_size
+        except OSError:
+            return 0
+
+    def get(self, path, variant: str = "") -> Optional[ModuleSummary]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        entry_path = self._get_entry_path(path, variant)
+        entry = self._read_entry(entry_path)
+        if not entry:
+            return None
+
+        _, mtime, size, digest, imports, classes = entry
+        if size != stat.st_size:
+            return None
+
+        if mtime != stat.st_mtime_ns:
+            try:
+                with open_source(path) as source:
+                    if self.digest(source) != digest:
+                        return None
+            except OSError:
+                return None
+
+            entry = (CACHE_VERSION, stat.st_mtime_ns, size, digest, imports, classes)
+            self._write_entry(entry_path, entry)
+        else:
+            self._touch(entry_path)
+
+        return ModuleSummary.create(imports, classes)
+
+    def set(
+        self, path, summary: ModuleSummary, source: Source, variant: str = ""
+    ) -> None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+
+        entry = (
+            CACHE_VERSION,
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.digest(source),
+            summary.imports,
+            [tuple(_class) for _class in summary.classes],
+        )
+        self._write_entry(self._get_entry_path(path, variant), entry)
+
+    @staticmethod
+    def _touch(entry_path: Path) -> None:
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+    def _get_entries(self):
+        try:
+            with os.scandir(self.directory) as entries:
+                return [
+                    (entry.path, entry.stat())
+                    for entry in entries
+                    if entry.is_file() and not entry.name.endswith(".tmp")
+                ]
+        except OSError:
+            return []
+
+    def get_size(self) -> int:
+        if self._size is None:
+            self._size = sum(stat.st_size for _, stat in self._get_entries())
+
+        return self._size
+
+    def sync(self) -> None:
+        """Recount the size once other processes wrote entries, evicting the
+        least recently used ones when it went over ``max_size``"""
+
+        self._size = None
+        if self.get_size() > self.max_size:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits
+        in ``max_size``"""
+
+        entries = sorted(self._get_entries(), key=lambda entry: entry[1].st_mtime_ns)
+        size = sum(stat.st_size for _, stat in entries)
+
+        for entry_path, stat in entries:
+            if size <= self.max_size:
+                break
+
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+
+            size -= stat.st_size
+
+        self._size = size
+
+    def clear(self) -> None:
+        for entry_path, _ in self._get_entries():
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+        self._size = 0
@@ -1,8 +1,93 @@
 import abc
+from dataclasses import dataclass
+from dataclasses import field
+import sys
+from typing import Iterable
 from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+
+def _intern(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+
+    return value
+
+
+class ClassRecord(NamedTuple):
+    """Immutable record of a parsed class, its names are interned so the same
+    base classes and keywords are shared across all modules"""
+
+    name: str
+    subclasses: Tuple[Optional[str], ...] = ()
+    keywords: Tuple[Tuple[str, Optional[str]], ...] = ()
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        subclasses: Iterable[Optional[str]] = (),
+        keywords: Union[Mapping, Iterable[Tuple[str, Optional[str]]]] = (),
+    ) -> "ClassRecord":
+        if isinstance(keywords, Mapping):
+            keywords = keywords.items()
+
+        return cls(
+            _intern(name),
+            tuple(map(_intern, subclasses)),
+            tuple((_intern(key), _intern(value)) for key, value in keywords),
+        )
+
+
+@dataclass
+class ModuleSummary:
+    """Everything the loaders need from a module, extracted in a single pass
+    :param imports: sorted list of imported names
+    :param classes: List[ClassRecord]
+    :param error: why the module could not be parsed, if it failed
+    """
+
+    imports: List[str] = field(default_factory=list)
+    classes: List[ClassRecord] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @classmethod
+    def create(
+        cls,
+        imports: Iterable[str] = (),
+        classes: Iterable[Tuple] = (),
+        error: Optional[str] = None,
+    ) -> "ModuleSummary":
+        """Build a summary with interned names and compact class records"""
+
+        return cls(
+            imports=list(sorted(map(_intern, imports))),
+            classes=[ClassRecord.create(*_class) for _class in classes],
+            error=error,
+        )
 
 
 class Parser(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def get_summary(self, path, source: Optional[bytes] = None) -> ModuleSummary:
+        """Parse imports and classes of the script at once
+        :param path: script path
+        :param source: script content, when it was already read
+        return: ModuleSummary
+        """
+
+        raise NotImplementedError()
+
+    def get_cached_summary(self, path) -> Optional[ModuleSummary]:
+        """Summary kept from a previous parse of the script, without reading
+        it, None when there is none"""
+
+        return None
+
     @abc.abstractmethod
     def get_imports(self, path) -> List[str]:
         raise NotADirectoryError()
@@ -1,56 +1,77 @@
 import ast
+from typing import Optional
 
+from basel.parsers.bytecode import get_bytecode_summary
+from basel.parsers.cache import ParseCache
+from basel.parsers.parser import ModuleSummary
 from basel.parsers.parser import Parser
+from basel.parsers.sources import open_source
+from basel.parsers.sources import Source
+from basel.parsers.visitors import ImportScope
+from basel.parsers.visitors import SummaryVisitor
 
 
 class PythonParser(Parser):
-    def get_imports(self, path, native_lib=False, only_local=False):
-        with open(path, "r") as module:
-            py_tree = ast.parse(module.read())
+    def __init__(
+        self,
+        cache: Optional[ParseCache] = None,
+        scope: ImportScope = ImportScope.FULL,
+        use_bytecode: bool = False,
+    ):
+        self.cache = cache
+        self.scope = ImportScope(scope)
+        self.use_bytecode = use_bytecode
 
-        _imports = set()
-        for stmt in ast.walk(py_tree):
-            if isinstance(stmt, ast.Import):
-                for alias in stmt.names:
-                    _imports.add(alias.name)
+    def _get_cache_variant(self) -> str:
+        return f"{self.__class__.__name__}:{self.scope.value}"
 
-            if isinstance(stmt, ast.ImportFrom):
-                for alias in stmt.names:
-                    if alias.name == "*":
-                        _imported_obj = stmt.module
-                    else:
-                        _imported_obj = f"{stmt.module}.{alias.name}"
+    def get_cached_summary(self, path) -> Optional[ModuleSummary]:
+        if self.cache:
+            return self.cache.get(path, self._get_cache_variant())
 
-                    _imports.add(_imported_obj)
+        return None
 
-        return list(sorted(_imports))
+    def get_summary(self, path, source: Optional[Source] = None) -> ModuleSummary:
+        summary = self.get_cached_summary(path)
+        if summary is not None:
+            return summary
 
-    @staticmethod
-    def _get_ast_value(name: ast.Name):
-        return getattr(name, "id", getattr(name, "attr", None))
+        # the compiler flattens the blocks, so pyc can only replace a full scan
+        if self.use_bytecode and self.scope == ImportScope.FULL:
+            summary = get_bytecode_summary(path)
+            if summary is not None:
+                return summary
 
-    def get_classes(self, path):
-        with open(path, "r") as module:
-            py_tree = ast.parse(module.read())
+        if source is None:
+            with open_source(path) as source:
+                return self._get_source_summary(path, source)
+
+        return self._get_source_summary(path, source)
+
+    def _get_source_summary(self, path, source: Source) -> ModuleSummary:
+        try:
+            summary = self._parse_summary(source)
+        except (SyntaxError, ValueError) as e:
+            return ModuleSummary(error=f"{e.__class__.__name__}: {e}")
 
-        _classes = []
+        if self.cache:
+            self.cache.set(path, summary, source, self._get_cache_variant())
 
-        for stmt in ast.walk(py_tree):
-            if isinstance(stmt, ast.ClassDef):
-                _subclasses = []
-                for base in stmt.bases:
-                    _subclass = self._get_ast_value(base)
-                    _subclasses.append(_subclass)
+        return summary
 
-                _kwargs = {}
-                for keyword in stmt.keywords:
-                    _kwargs[keyword.arg] = self._get_ast_value(keyword.value)
+    def _parse_summary(self, source: Source) -> ModuleSummary:
+        py_tree = ast.parse(source)
 
-                _class = (stmt.name, _subclasses, _kwargs)
+        visitor = SummaryVisitor(self.scope)
+        visitor.visit(py_tree)
 
-                _classes.append(_class)
+        return ModuleSummary.create(visitor.imports, visitor.classes)
 
-        return _classes
+    def get_imports(self, path, native_lib=False, only_local=False):
+        return self.get_summary(path).imports
+
+    def get_classes(self, path):
+        return self.get_summary(path).classes
 
     def is_abstract_class(self, class_name, subclasses, keywords):
         abc_classes = ["abc.ABC", "ABC"]
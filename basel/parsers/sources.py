@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+import mmap
+import os
+from typing import Iterator
+from typing import Union
+
+MMAP_THRESHOLD = 256 * 1024
+
+Source = Union[bytes, mmap.mmap]
+
+
+@contextmanager
+def open_source(path) -> Iterator[Source]:
+    """Open the raw bytes of a python module.
+
+    The source is never decoded here, the parser detects the encoding from the
+    BOM or the PEP 263 cookie. Modules bigger than MMAP_THRESHOLD are memory
+    mapped instead of read, which skips the read buffer, the parser still
+    copies the source while compiling it.
+    """
+
+    with open(path, "rb") as module:
+        size = os.fstat(module.fileno()).st_size
+
+        if not size or size < MMAP_THRESHOLD:
+            yield module.read()
+            return
+
+        with mmap.mmap(module.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            yield source
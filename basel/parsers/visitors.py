@@ -0,0 +1,106 @@
+import ast
+from enum import Enum
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+_BLOCK_FIELDS = ("body", "orelse", "handlers", "finalbody", "cases")
+
+
+def get_imported_name(level: int, module: Optional[str], name: str) -> str:
+    """Name of an object imported with ``from module import name``, relative
+    imports keep one leading dot per level, e.g. ``from ..a import b`` is
+    ``..a.b``"""
+
+    _module = "." * (level or 0) + (module or "")
+
+    if name == "*":
+        return _module
+
+    if not module:
+        return f"{_module}{name}"
+
+    return f"{_module}.{name}"
+
+
+class ImportScope(str, Enum):
+    MODULE = "module"
+    CONDITIONAL = "conditional"
+    FULL = "full"
+
+
+class SummaryVisitor(ast.NodeVisitor):
+    """Collect the imports and classes of a module.
+
+    Imports and classes are always statements, so only statement blocks are
+    visited and expressions are never entered. Classes are collected from
+    every block, the scope only limits the blocks imports are taken from:
+
+    * module: only the top level statements
+    * conditional: top level statements and the ``if``/``try`` blocks
+    * full: every block, including function and class bodies
+    """
+
+    def __init__(self, scope: ImportScope = ImportScope.FULL):
+        self.scope = scope
+        self.imports: Set[str] = set()
+        self.classes: List[Tuple[str, List[str], Dict[str, str]]] = []
+        self._in_scope = True
+
+    def visit_block(self, node: ast.AST):
+        for field in _BLOCK_FIELDS:
+            for stmt in getattr(node, field, ()):
+                self.visit(stmt)
+
+    def _visit_nested_block(self, node: ast.AST, in_scope: bool):
+        in_outer_scope = self._in_scope
+        self._in_scope = in_outer_scope and in_scope
+        self.visit_block(node)
+        self._in_scope = in_outer_scope
+
+    def generic_visit(self, node: ast.AST):
+        self._visit_nested_block(node, self.scope == ImportScope.FULL)
+
+    def visit_Module(self, node: ast.Module):
+        self.visit_block(node)
+
+    def visit_If(self, node: ast.AST):
+        self._visit_nested_block(node, self.scope != ImportScope.MODULE)
+
+    visit_Try = visit_If
+    visit_TryStar = visit_If
+    visit_ExceptHandler = visit_If
+
+    def visit_Import(self, node: ast.Import):
+        if not self._in_scope:
+            return
+
+        for alias in node.names:
+            self.imports.add(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if not self._in_scope:
+            return
+
+        for alias in node.names:
+            self.imports.add(get_imported_name(node.level, node.module, alias.name))
+
+    @staticmethod
+    def _get_ast_value(name: ast.AST):
+        return getattr(name, "id", getattr(name, "attr", None))
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        _subclasses = []
+        for base in node.bases:
+            _subclass = self._get_ast_value(base)
+            _subclasses.append(_subclass)
+
+        _kwargs = {}
+        for keyword in node.keywords:
+            _kwargs[keyword.arg] = self._get_ast_value(keyword.value)
+
+        self.classes.append((node.name, _subclasses, _kwargs))
+
+        self.generic_visit(node)
@@ -1,7 +1,19 @@
 from basel.reports.as_plane import ASReport
 from basel.reports.formats import ReportFormat
 from basel.reports.reporter import Reporter
+from basel.reports.reports import CycleReport
+from basel.reports.reports import DiffReport
+from basel.reports.reports import EdgeReport
 from basel.reports.reports import LinkReport
 from basel.reports.reports import Report
 
-__all__ = ["Reporter", "ASReport", "Report", "ReportFormat", "LinkReport"]
+__all__ = [
+    "Reporter",
+    "ASReport",
+    "Report",
+    "ReportFormat",
+    "LinkReport",
+    "EdgeReport",
+    "CycleReport",
+    "DiffReport",
+]
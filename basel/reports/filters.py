@@ -0,0 +1,200 @@
+from functools import lru_cache
+import re
+from typing import Callable
+from typing import FrozenSet
+from typing import List
+from typing import Tuple
+
+from basel import utils
+
+Predicate = Callable[[object], bool]
+
+FIELDS = {
+    "name": "name",
+    "i": "instability",
+    "instability": "instability",
+    "a": "abstraction",
+    "abstraction": "abstraction",
+    "e": "error",
+    "error": "error",
+}
+
+MATCH_OPERATORS = ("~", "!~")
+
+ORDER_OPERATORS = (">", ">=", "<", "<=")
+
+TOKEN_REGEX = re.compile(
+    r"""\s*(?:
+        (?P<number>-?\d+(?:\.\d+)?)
+        |(?P<string>'[^']*'|"[^"]*")
+        |(?P<operator>==|!=|>=|<=|>|<|!~|~)
+        |(?P<paren>[()])
+        |(?P<word>[A-Za-z_]\w*)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_REGEX.match(expression, position)
+        if not match:
+            raise ValueError(
+                f"Invalid where expression, unexpected {expression[position:]!r}"
+            )
+
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+
+    return tokens
+
+
+class _Compiler:
+    """Translate a where expression into the source of a single python
+    expression over ``obj``, globs are compiled once into regexes"""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.position = 0
+        self.globs: List[Callable] = []
+        self.attributes = set()
+
+    def _peek(self) -> Tuple[str, str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+
+        return ("end", "")
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _error(self, message: str):
+        return ValueError(f"Invalid where expression {self.expression!r}: {message}")
+
+    def _is_keyword(self, keyword: str) -> bool:
+        kind, value = self._peek()
+        return kind == "word" and value.lower() == keyword
+
+    def compile(self) -> str:
+        source = self._parse_or()
+        kind, value = self._peek()
+        if kind != "end":
+            raise self._error(f"unexpected {value!r}")
+
+        return source
+
+    def _parse_or(self) -> str:
+        terms = [self._parse_and()]
+        while self._is_keyword("or"):
+            self._next()
+            terms.append(self._parse_and())
+
+        if len(terms) == 1:
+            return terms[0]
+
+        return f"({' or '.join(terms)})"
+
+    def _parse_and(self) -> str:
+        terms = [self._parse_not()]
+        while self._is_keyword("and"):
+            self._next()
+            terms.append(self._parse_not())
+
+        if len(terms) == 1:
+            return terms[0]
+
+        return f"({' and '.join(terms)})"
+
+    def _parse_not(self) -> str:
+        if self._is_keyword("not"):
+            self._next()
+            return f"(not {self._parse_not()})"
+
+        return self._parse_atom()
+
+    def _parse_atom(self) -> str:
+        kind, value = self._peek()
+        if kind == "paren" and value == "(":
+            self._next()
+            source = self._parse_or()
+            kind, value = self._next()
+            if (kind, value) != ("paren", ")"):
+                raise self._error("missing ')'")
+
+            return source
+
+        return self._parse_comparison()
+
+    def _parse_comparison(self) -> str:
+        kind, field = self._next()
+        attribute = FIELDS.get(field.lower()) if kind == "word" else None
+        if attribute is None:
+            raise self._error(
+                f"unknown field {field!r}, posibles values {list(FIELDS)}"
+            )
+
+        kind, operator = self._next()
+        if kind != "operator":
+            raise self._error(f"missing operator after {field!r}")
+
+        self.attributes.add(attribute)
+
+        kind, value = self._next()
+        if kind == "string":
+            value = value[1:-1]
+        elif kind == "number":
+            value = float(value)
+        else:
+            raise self._error(f"missing value after {field} {operator}")
+
+        if operator in ORDER_OPERATORS:
+            if attribute == "name":
+                raise self._error(f"{operator} can not compare {field}")
+
+            if not isinstance(value, float):
+                raise self._error(f"{operator} needs a number")
+
+        if operator in MATCH_OPERATORS:
+            if not isinstance(value, str):
+                raise self._error(f"{operator} needs a glob between quotes")
+
+            self.globs.append(utils.glob_to_regex(value).search)
+            check = "is None" if operator == "!~" else "is not None"
+            return f"(_globs[{len(self.globs) - 1}](str(obj.{attribute})) {check})"
+
+        return f"(obj.{attribute} {operator} {value!r})"
+
+
+@lru_cache(maxsize=128)
+def compile_where(expression: str) -> Predicate:
+    """Compile a where expression into a predicate over components.
+
+    Expressions compare fields with values and combine the comparisons with
+    ``and``, ``or``, ``not`` and parentheses, e.g.
+    ``E > 0.7 and name ~ 'svc/**'``. Fields are ``name``, ``I``, ``A`` and
+    ``E`` (or ``instability``, ``abstraction`` and ``error``), operators are
+    ``== != > >= < <=``, plus ``~`` and ``!~`` to match a glob. Names are not
+    ordered, ``> >= < <=`` only compare metrics with numbers.
+    """
+
+    compiler = _Compiler(expression)
+    source = compiler.compile()
+
+    namespace = {"_globs": compiler.globs, "__builtins__": {"str": str}}
+    return eval(f"lambda obj: {source}", namespace)
+
+
+@lru_cache(maxsize=128)
+def get_where_fields(expression: str) -> FrozenSet[str]:
+    """Component attributes compared by a where expression"""
+
+    compiler = _Compiler(expression)
+    compiler.compile()
+    return frozenset(compiler.attributes)
@@ -10,3 +10,4 @@ class ReportFormat(str, Enum):
     MEAN = "mean"
     UML = "uml"
     UML_IMG = "img"
+    ADJACENCY = "adjacency"
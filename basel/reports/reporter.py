@@ -1,4 +1,3 @@
-import pathlib
 import re
 from typing import Dict
 from typing import List
@@ -7,17 +6,34 @@ from typing import Optional
 from typing import Union
 
 from basel import config
+from basel import metrics
+from basel import utils
 from basel.loaders import Loader
 from basel.reports.as_plane import ASReport
+from basel.reports.filters import compile_where
+from basel.reports.filters import get_where_fields
 from basel.reports.formats import ReportFormat
+from basel.reports.reports import CycleReport
+from basel.reports.reports import DiffReport
+from basel.reports.reports import EdgeReport
 from basel.reports.reports import LinkReport
 from basel.reports.reports import Report
-from plantuml import PlantUML
+from basel.snapshots import SnapshotDiff
 from tabulate import SEPARATING_LINE
 from tabulate import tabulate
 
 ReportFilter = NewType("ReportFilter", Dict[str, Union[str, List[str]]])
 
+WHERE_FILTER = "where"
+
+METRIC_FIELDS = frozenset(("instability", "abstraction", "error"))
+
+# globs are compiled once into regexes instead of building paths to match
+MATCH_OPERATIONS = {
+    "match": utils.glob_to_regex,
+    "match in": utils.globs_to_regex,
+}
+
 
 class Reporter:
     def __init__(self, loader: Optional[Loader] = None):
@@ -26,69 +42,94 @@ class Reporter:
     def set_loader(self, loader):
         self._loader = loader
 
-    def _filter(self, obj: dict, filters: ReportFilter):
-        conditions = dict.fromkeys(filters)
-
-        operations = {
-            "eq": lambda a, b: a == b,
-            "not eq": lambda a, b: a != b,
-            "match": lambda a, b: pathlib.Path(a).match(b),
-            "match in": lambda a, b: any(pathlib.Path(a).match(r) for r in b),
-            "gte": lambda a, b: a >= b,
-            "lte": lambda a, b: a <= b,
-            "lt": lambda a, b: a < b,
-            "gt": lambda a, b: a > b,
-        }
+    def _get_filter_mask(self, objs: List, filters: ReportFilter) -> List[bool]:
+        """Evaluate the filters over all the objects at once, field by field.
 
+        The ``where`` filter is an expression compiled into a single
+        predicate, see ``compile_where``.
+        """
+
+        mask = [True] * len(objs)
         for filter_field, filter_value in filters.items():
-            obj_value = getattr(obj, filter_field, None)
+            if filter_field == WHERE_FILTER:
+                predicate = compile_where(filter_value)
+                matches = [predicate(obj) for obj in objs]
+                mask = [keep and match for keep, match in zip(mask, matches)]
+                continue
+
+            values = [getattr(obj, filter_field, None) for obj in objs]
 
             op = "eq"
             if isinstance(filter_value, list):
                 op, filter_value = filter_value
 
-            operation = operations.get(op)
-            if not operation:
+            if op in metrics.COMPARISONS:
+                matches = metrics.compare(values, op, filter_value)
+            elif op in MATCH_OPERATIONS:
+                regex = MATCH_OPERATIONS[op](filter_value)
+                matches = [regex.search(str(value)) is not None for value in values]
+            else:
+                operations = list(metrics.COMPARISONS) + list(MATCH_OPERATIONS)
                 raise ValueError(
-                    f"Not exists the operator {op},"
-                    "posibles value {list(operations.keys())}"
+                    f"Not exists the operator {op}, posibles value {operations}"
                 )
 
-            conditions[filter_field] = operation(obj_value, filter_value)
+            mask = [keep and match for keep, match in zip(mask, matches)]
 
-        match_all_conditions = all(conditions.values())
+        return mask
 
-        return match_all_conditions
+    def _calculate_filtered_metrics(self, filters: Optional[ReportFilter]):
+        """Compute the metrics compared by the filters, reports of links
+        only load the links otherwise"""
+
+        if not filters:
+            return
+
+        fields = set(filters)
+        if WHERE_FILTER in filters:
+            fields.update(get_where_fields(filters[WHERE_FILTER]))
+
+        if fields & METRIC_FIELDS:
+            self._loader.calculate_abstraction()
+            self._loader.calculate_instability()
+            self._loader.calculate_error()
+
+    def _filter(self, obj: dict, filters: ReportFilter):
+        return self._get_filter_mask([obj], filters)[0]
+
+    def _filter_components(self, components: List, filters: Optional[ReportFilter]):
+        if not filters:
+            return list(components)
+
+        mask = self._get_filter_mask(components, filters)
+        return [comp for comp, keep in zip(components, mask) if keep]
 
     def get_component_links_report(
         self, filters: Optional[ReportFilter] = None
     ) -> LinkReport:
         self._loader.load_links()
-
-        out_deps = {}
-        for link in self._loader.get_links():
-            deps = out_deps.get(link.source.name, [])
-            deps.append(link.target.name)
-            out_deps[link.source.name] = deps
+        self._calculate_filtered_metrics(filters)
 
         data = []
 
+        components = self._loader.get_components()
+        mask = [True] * len(components)
+        if filters:
+            mask = self._get_filter_mask(components, filters)
+
         labels = {}
-        for idx, comp in enumerate(self._loader.get_components()):
-            if filters and not self._filter(comp, filters):
+        for idx, (comp, keep) in enumerate(zip(components, mask)):
+            if not keep:
                 continue
 
             label = str(idx + 1)
             labels[comp.name] = label
 
         for eval_comp, idx in labels.items():
+            dependants = set(self._loader.get_dependants(eval_comp))
             row = [idx]
             for comp in labels.keys():
-                value = 0
-                deps = out_deps.get(comp, [])
-                if eval_comp in deps:
-                    value = 1
-                row.append(value)
+                row.append(int(comp in dependants))
 
             data.append(tuple(row))
 
@@ -102,6 +143,92 @@ class Reporter:
 
         return report
 
+    def get_component_edges_report(
+        self, filters: Optional[ReportFilter] = None
+    ) -> EdgeReport:
+        """Sparse version of the link report, one row per link between the
+        filtered components"""
+
+        self._loader.load_links()
+        self._calculate_filtered_metrics(filters)
+
+        components = self._filter_components(self._loader.get_components(), filters)
+
+        names = {comp.name for comp in components}
+
+        data = []
+        for comp in components:
+            for target in self._loader.get_dependencies(comp.name):
+                if target in names:
+                    data.append((comp.name, target))
+
+        return EdgeReport(columns=["Source", "Target"], data=data)
+
+    def get_cycles_report(self, filters: Optional[ReportFilter] = None) -> CycleReport:
+        """Groups of components that import each other, with the number of
+        links inside each group, and the graph of links between the groups"""
+
+        self._loader.load_links()
+        self._calculate_filtered_metrics(filters)
+
+        groups = self._loader.get_link_groups()
+        group_indexes = {}
+        for idx, group in enumerate(groups):
+            for name in group:
+                group_indexes[name] = idx
+
+        internal_links = [0] * len(groups)
+        group_links = {}
+        for idx, group in enumerate(groups):
+            for name in group:
+                for target in self._loader.get_dependencies(name):
+                    target_idx = group_indexes[target]
+                    if target_idx == idx:
+                        internal_links[idx] += 1
+                    else:
+                        group_links.setdefault((idx, target_idx))
+
+        visible = set(range(len(groups)))
+        if filters:
+            components = self._loader.get_components()
+            visible = {
+                group_indexes[comp.name]
+                for comp in self._filter_components(components, filters)
+            }
+
+        cycles = [
+            idx
+            for idx, group in enumerate(groups)
+            if idx in visible and (len(group) > 1 or internal_links[idx])
+        ]
+        cycles.sort(key=lambda idx: len(groups[idx]), reverse=True)
+
+        labels = {idx: group[0] for idx, group in enumerate(groups)}
+        data = []
+        for number, idx in enumerate(cycles, start=1):
+            labels[idx] = f"cycle {number}"
+            members = "\n".join(groups[idx])
+            data.append((str(number), len(groups[idx]), internal_links[idx], members))
+
+        columns = ["Cycle", "Components", "Links", "Members"]
+
+        footer = "\nCondensed graph:\n"
+        for source_idx, target_idx in group_links:
+            if source_idx in visible and target_idx in visible:
+                footer += f"{labels[source_idx]} --> {labels[target_idx]}\n"
+
+        return CycleReport(columns=columns, data=data, footer=footer)
+
+    @staticmethod
+    def _round(value: Optional[float]) -> Optional[float]:
+        """Metrics are kept at full precision, they are only rounded to be
+        shown in the reports"""
+
+        if value is None:
+            return None
+
+        return round(value, utils.DECIMALS)
+
     def get_as_report(self, filters: Optional[ReportFilter] = None) -> ASReport:
         data = []
         columns = ["Component", "I", "A", "E"]
@@ -110,24 +237,21 @@ class Reporter:
         self._loader.calculate_instability()
         self._loader.calculate_error()
 
-        components = self._loader.get_components()
+        components = self._filter_components(self._loader.get_components(), filters)
 
         for component in components:
-            if filters and not self._filter(component, filters):
-                continue
-
             name = component.name
-            instability = component.instability
-            abstraction = component.abstraction
-            error = component.error
+            instability = self._round(component.instability)
+            abstraction = self._round(component.abstraction)
+            error = self._round(component.error)
 
             row = (name, instability, abstraction, error)
 
             data.append(row)
 
-        mean_error = self._loader.calculate_mean_error()
-        mean_abstraction = self._loader.calculate_mean_abstraction()
-        mean_instability = self._loader.calculate_mean_instability()
+        mean_error = self._round(self._loader.calculate_mean_error())
+        mean_abstraction = self._round(self._loader.calculate_mean_abstraction())
+        mean_instability = self._round(self._loader.calculate_mean_instability())
 
         data.append(None)
         data.append(("Mean", mean_instability, mean_abstraction, mean_error))
@@ -139,6 +263,41 @@ class Reporter:
 
         return report
 
+    def _format_change(self, base_value: float, head_value: float):
+        base_value = self._round(base_value)
+        head_value = self._round(head_value)
+        if base_value == head_value:
+            return head_value
+
+        return f"{base_value} -> {head_value}"
+
+    def get_diff_report(self, diff: SnapshotDiff) -> DiffReport:
+        """Components added (+), removed (-) or with changed metrics (~), and
+        the links added or removed between two snapshots"""
+
+        data = []
+        for name, metrics_values in diff.added_components.items():
+            data.append(("+", name, *map(self._round, metrics_values)))
+
+        for name, metrics_values in diff.removed_components.items():
+            data.append(("-", name, *map(self._round, metrics_values)))
+
+        for name, (base_values, head_values) in diff.changed_components.items():
+            changes = map(self._format_change, base_values, head_values)
+            data.append(("~", name, *changes))
+
+        footer = None
+        if diff.added_links or diff.removed_links:
+            footer = "\nLinks:\n"
+            for source, target in diff.added_links:
+                footer += f"+ {source} --> {target}\n"
+            for source, target in diff.removed_links:
+                footer += f"- {source} --> {target}\n"
+
+        columns = ["Change", "Component", "I", "A", "E"]
+
+        return DiffReport(columns=columns, data=data, footer=footer)
+
     def format_report(
         self, report: Report, report_format: Optional[ReportFormat] = None
     ):
@@ -149,8 +308,12 @@ class Reporter:
             ReportFormat.MEAN_A: (self._format_abstraction_mean, [ASReport.name]),
             ReportFormat.MEAN_E: (self._format_error_mean, [ASReport.name]),
             ReportFormat.MEAN: (self._format_error_mean, [ASReport.name]),
-            ReportFormat.UML: (self._format_uml, [LinkReport.name]),
-            ReportFormat.UML_IMG: (self._format_uml_img, [LinkReport.name]),
+            ReportFormat.UML: (self._format_uml, [LinkReport.name, EdgeReport.name]),
+            ReportFormat.UML_IMG: (
+                self._format_uml_img,
+                [LinkReport.name, EdgeReport.name],
+            ),
+            ReportFormat.ADJACENCY: (self._format_adjacency, [EdgeReport.name]),
         }
 
         if not report_format:
@@ -159,9 +322,11 @@ class Reporter:
         format_fn, available_reports = _report_formats.get(report_format)
 
         if available_reports != "*" and report.name not in available_reports:
-            raise ValueError(
-                f"The format {report_format} is not valid for {report.name}"
-            )
+            message = f"The format {report_format.value} is not valid for {report.name}"
+            if report_format == ReportFormat.ADJACENCY:
+                message += ", it requires --sparse"
+
+            raise ValueError(message)
 
         return format_fn(report)
 
@@ -188,7 +353,7 @@ class Reporter:
         i_total = totals[3]
         return i_total
 
-    def _format_uml(self, report: LinkReport) -> str:
+    def _get_links_from_link_report(self, report: LinkReport):
         labels = {}
         if not report.footer:
             raise TypeError("Missing Footer")
@@ -199,10 +364,7 @@ class Reporter:
                 labels[idx] = comp_name
 
         source_depx_comp_idx = report.columns[1:]
-        uml_staments = []
-
-        for label, component in labels.items():
-            uml_staments.append(f"component [{component}]")
+        links = []
 
         for deps in report.data:
             comp_name = deps[0]
@@ -215,15 +377,54 @@ class Reporter:
 
                 from_comp_name = labels.get(from_comp_idx)
                 to_comp_name = labels.get(to_comp_idx)
-                uml_staments.append(f"[{from_comp_name}] --> [{to_comp_name}]")
+                links.append((from_comp_name, to_comp_name))
+
+        return list(labels.values()), links
+
+    def _get_links_from_edge_report(self, report: EdgeReport):
+        components = {}
+        for source, target in report.data:
+            components.setdefault(source)
+            components.setdefault(target)
+
+        return list(components), report.data
+
+    def _format_uml(self, report: Report) -> str:
+        if report.name == EdgeReport.name:
+            components, links = self._get_links_from_edge_report(report)
+        else:
+            components, links = self._get_links_from_link_report(report)
+
+        uml_staments = []
+
+        for component in components:
+            uml_staments.append(f"component [{component}]")
+
+        for from_comp_name, to_comp_name in links:
+            uml_staments.append(f"[{from_comp_name}] --> [{to_comp_name}]")
 
         uml_staments = ["@startuml"] + uml_staments + ["@enduml"]
 
         uml_text = "\n".join(uml_staments)
         return uml_text
 
+    def _format_adjacency(self, report: EdgeReport) -> str:
+        """One line per source component with the components it links to"""
+
+        adjacency = {}
+        for source, target in report.data:
+            adjacency.setdefault(source, []).append(target)
+
+        lines = [
+            f"{source}: {', '.join(targets)}" for source, targets in adjacency.items()
+        ]
+        return "\n".join(lines)
+
     def _format_uml_img(self, report):
         uml = self._format_uml(report)
+        # plantuml is only imported to render images
+        from plantuml import PlantUML
+
         plant_uml = PlantUML(url=config.PLANTUML_URL)
         uml_img = plant_uml.processes(uml)
         return uml_img
@@ -17,3 +17,18 @@ class Report:
 @dataclass
 class LinkReport(Report):
     name: str = "Link Report"
+
+
+@dataclass
+class EdgeReport(Report):
+    name: str = "Edge Report"
+
+
+@dataclass
+class CycleReport(Report):
+    name: str = "Cycle Report"
+
+
+@dataclass
+class DiffReport(Report):
+    name: str = "Diff Report"
@@ -0,0 +1,274 @@
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import inspect
+import ipaddress
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from urllib import request as urllib_request
+
+from basel.client import Basel
+from basel.dtos import Log
+from basel.dtos import LogType
+from basel.dtos import Result
+from basel.reports import ReportFormat
+
+SERVER_METHODS = ("report", "component_relations", "cycles", "snapshot", "diff")
+
+PATH_ARGS = ("component_map", "output", "base_snapshot", "head_snapshot")
+
+ClientFactory = Callable[[], Basel]
+
+
+class WarmBasel(Basel):
+    """Client that keeps the modules loaded between calls.
+
+    Loading the same paths again only parses the modules changed since the
+    last call, any other paths or exclusions load everything from scratch.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self._loaded_key: Optional[Tuple] = None
+        self._watcher = None
+
+    def _load_components(
+        self,
+        paths: List[Path],
+        ignore_dependencies: Optional[List[str]] = None,
+        exclude_components: Optional[List[str]] = None,
+        exclude_packages: bool = False,
+    ):
+        key = (
+            tuple(str(path) for path in paths),
+            tuple(exclude_components or ()),
+            bool(exclude_packages),
+        )
+        if key == self._loaded_key:
+            changes = self._watcher.poll()
+            if changes:
+                try:
+                    self.loader.update_modules(changes.modified, changes.removed)
+                except Exception:
+                    # load everything again on the next call
+                    self._loaded_key = None
+                    raise
+            return
+
+        self._loaded_key = None
+        super()._load_components(
+            paths, ignore_dependencies, exclude_components, exclude_packages
+        )
+        self._watcher = self._create_watcher()
+        self._loaded_key = key
+
+
+def is_loopback_host(host: str) -> bool:
+    if host == "localhost":
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def dump_result(result: Result) -> dict:
+    return {
+        "success": result.success,
+        "content": result.content,
+        "logs": [[log.type.value, str(log.content)] for log in result.logs],
+    }
+
+
+def load_result(content: dict) -> Result:
+    logs = [
+        Log(log_content, LogType(log_type)) for log_type, log_content in content["logs"]
+    ]
+    return Result(content["success"], content["content"], logs)
+
+
+def dump_kwargs(kwargs: dict) -> dict:
+    return json.loads(json.dumps(kwargs, default=str))
+
+
+def load_kwargs(kwargs: dict) -> dict:
+    kwargs = dict(kwargs)
+    root_path = kwargs.get("root_path")
+    if root_path:
+        if not isinstance(root_path, list) or not all(
+            isinstance(path, str) for path in root_path
+        ):
+            raise ValueError(f"root_path must be a list of paths, not {root_path!r}")
+
+        kwargs["root_path"] = [Path(path) for path in root_path]
+
+    for arg in PATH_ARGS:
+        if kwargs.get(arg):
+            if not isinstance(kwargs[arg], str):
+                raise ValueError(f"{arg} must be a path, not {kwargs[arg]!r}")
+
+            kwargs[arg] = Path(kwargs[arg])
+
+    if kwargs.get("report_format"):
+        kwargs["report_format"] = ReportFormat(kwargs["report_format"])
+
+    return kwargs
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: "BaselServer"
+
+    def do_POST(self):
+        # browsers send an Origin and can not send JSON to another site
+        # without a preflight, which keeps web pages from driving the server
+        if self.headers.get("Origin") is not None:
+            self.send_error(403, "Cross origin requests are not allowed")
+            return
+
+        if self.headers.get_content_type() != "application/json":
+            self.send_error(415, "Requests must be application/json")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            result = self.server.handle_request(request)
+        except (ValueError, KeyError) as e:
+            result = Result(success=False)
+            result.add_log(f"Invalid request: {e}", LogType.ERROR)
+
+        body = json.dumps(dump_result(result)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BaselServer(ThreadingHTTPServer):
+    """Answer basel commands over local HTTP with a warm client per set of
+    project paths.
+
+    Requests are JSON objects with the ``method`` of the client to call, its
+    ``kwargs`` and the ``cwd`` of the caller, which must be the working
+    directory of the server since modules are named relative to it. Paths
+    in the kwargs must be below that directory too.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], client_factory: ClientFactory):
+        super().__init__(address, _RequestHandler)
+        self.client_factory = client_factory
+        self.clients: Dict[Tuple[str, ...], WarmBasel] = {}
+        self._clients_lock = threading.Lock()
+
+    def get_client(self, root_path: Optional[List[Path]]) -> WarmBasel:
+        key = tuple(sorted(str(path) for path in root_path or []))
+        with self._clients_lock:
+            client = self.clients.get(key)
+            if client is None:
+                client = self.client_factory()
+                self.clients[key] = client
+
+        return client
+
+    @staticmethod
+    def check_paths(kwargs: dict):
+        cwd = os.path.realpath(os.curdir)
+        paths = list(kwargs.get("root_path") or [])
+        paths.extend(kwargs[arg] for arg in PATH_ARGS if kwargs.get(arg))
+
+        for path in paths:
+            real_path = os.path.realpath(path)
+            if os.path.commonpath([cwd, real_path]) != cwd:
+                raise ValueError(
+                    f"The path {path} is outside of the server directory {cwd}"
+                )
+
+    @staticmethod
+    def check_request(request):
+        if not isinstance(request, dict):
+            raise ValueError("the request must be a JSON object")
+
+        method_name = request["method"]
+        if not isinstance(method_name, str) or method_name not in SERVER_METHODS:
+            raise ValueError(
+                f"Not exists the method {method_name}, "
+                f"posibles values {', '.join(SERVER_METHODS)}"
+            )
+
+        if not isinstance(request["cwd"], str):
+            raise ValueError("cwd must be a path")
+
+        kwargs = request["kwargs"]
+        if not isinstance(kwargs, dict):
+            raise ValueError("kwargs must be a JSON object")
+
+        parameters = inspect.signature(getattr(WarmBasel, method_name)).parameters
+        for arg in kwargs:
+            if arg == "self" or arg not in parameters:
+                raise ValueError(f"Not exists the argument {arg} of {method_name}")
+
+    def handle_request(self, request: dict) -> Result:
+        self.check_request(request)
+        method_name = request["method"]
+
+        if os.path.abspath(request["cwd"]) != os.path.abspath(os.curdir):
+            result = Result(success=False)
+            result.add_log(
+                f"The server runs in {os.path.abspath(os.curdir)}, "
+                "run the command from there",
+                LogType.ERROR,
+            )
+            return result
+
+        kwargs = load_kwargs(request["kwargs"])
+        self.check_paths(kwargs)
+        client = self.get_client(kwargs.get("root_path"))
+        with client.lock:
+            return getattr(client, method_name)(**kwargs)
+
+
+def serve(host: str, port: int, client_factory: ClientFactory):
+    server = BaselServer((host, port), client_factory)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def send_request(url: str, method_name: str, kwargs: dict) -> Result:
+    """Run a client method in a basel server"""
+
+    content = {
+        "method": method_name,
+        "kwargs": dump_kwargs(kwargs),
+        "cwd": os.path.abspath(os.curdir),
+    }
+    http_request = urllib_request.Request(
+        url,
+        data=json.dumps(content).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+
+    try:
+        with urllib_request.urlopen(http_request) as response:
+            return load_result(json.load(response))
+    except OSError as e:
+        result = Result(success=False)
+        result.add_log(f"Can not reach the server {url}: {e}", LogType.ERROR)
+        return result
@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+from dataclasses import field
+import json
+from pathlib import Path
+import re
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from basel.loaders import Loader
+
+SNAPSHOT_VERSION = 1
+
+METRICS = ("I", "A", "E")
+LINKS_RULE = "edges"
+
+Metrics = Tuple[float, float, float]
+LinkKey = Tuple[str, str]
+
+
+@dataclass
+class Snapshot:
+    """Metrics by component and links of an analysis, to compare runs"""
+
+    components: Dict[str, Metrics] = field(default_factory=dict)
+    links: List[LinkKey] = field(default_factory=list)
+
+    @classmethod
+    def from_loader(cls, loader: Loader) -> "Snapshot":
+        loader.calculate_abstraction()
+        loader.calculate_instability()
+        loader.calculate_error()
+
+        components = {
+            comp.name: (comp.instability, comp.abstraction, comp.error)
+            for comp in loader.get_components()
+        }
+        links = list(loader.graph.get_edges())
+
+        return cls(components=components, links=links)
+
+    def save(self, path: Path):
+        content = {
+            "version": SNAPSHOT_VERSION,
+            "components": self.components,
+            "links": self.links,
+        }
+
+        with open(path, "w") as f:
+            json.dump(content, f)
+
+    @classmethod
+    def load(cls, path: Path) -> "Snapshot":
+        with open(path) as f:
+            content = json.load(f)
+
+        if content.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version in {path}")
+
+        components = {
+            name: tuple(metrics) for name, metrics in content["components"].items()
+        }
+        links = [tuple(link) for link in content["links"]]
+
+        return cls(components=components, links=links)
+
+
+@dataclass
+class SnapshotDiff:
+    added_components: Dict[str, Metrics] = field(default_factory=dict)
+    removed_components: Dict[str, Metrics] = field(default_factory=dict)
+    changed_components: Dict[str, Tuple[Metrics, Metrics]] = field(default_factory=dict)
+    added_links: List[LinkKey] = field(default_factory=list)
+    removed_links: List[LinkKey] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (
+            self.added_components
+            or self.removed_components
+            or self.changed_components
+            or self.added_links
+            or self.removed_links
+        )
+
+
+def diff_snapshots(
+    base: Snapshot, head: Snapshot, tolerance: float = 1e-9
+) -> SnapshotDiff:
+    """Changes from the base snapshot to the head one, keyed by component
+    name and link, in a single pass over each snapshot
+
+    :param tolerance: metric changes below it are ignored
+    """
+
+    diff = SnapshotDiff()
+
+    for name, head_metrics in head.components.items():
+        base_metrics = base.components.get(name)
+        if base_metrics is None:
+            diff.added_components[name] = head_metrics
+        elif any(
+            abs(head_value - base_value) > tolerance
+            for base_value, head_value in zip(base_metrics, head_metrics)
+        ):
+            diff.changed_components[name] = (base_metrics, head_metrics)
+
+    for name, base_metrics in base.components.items():
+        if name not in head.components:
+            diff.removed_components[name] = base_metrics
+
+    base_links = set(base.links)
+    head_links = set(head.links)
+    diff.added_links = [link for link in head.links if link not in base_links]
+    diff.removed_links = [link for link in base.links if link not in head_links]
+
+    return diff
+
+
+@dataclass(frozen=True)
+class FailRule:
+    """Regression that fails a diff: a metric of a component growing more
+    than the threshold, or new links when there is no metric"""
+
+    metric: Optional[str] = None
+    threshold: float = 0
+
+    @classmethod
+    def parse(cls, rule: str) -> "FailRule":
+        rule = rule.strip()
+        if rule == LINKS_RULE:
+            return cls()
+
+        match = re.match(r"^([IAE])\s*>\s*(\d+(\.\d+)?)$", rule)
+        if not match:
+            raise ValueError(
+                f"Not exists the rule {rule}, "
+                f"posibles values {LINKS_RULE} or METRIC>THRESHOLD "
+                f"with METRIC in {', '.join(METRICS)}"
+            )
+
+        return cls(metric=match.group(1), threshold=float(match.group(2)))
+
+    def get_regressions(self, diff: SnapshotDiff) -> List[str]:
+        if self.metric is None:
+            return [
+                f"New link {source} --> {target}" for source, target in diff.added_links
+            ]
+
+        idx = METRICS.index(self.metric)
+        regressions = []
+        for name, (base_metrics, head_metrics) in diff.changed_components.items():
+            delta = head_metrics[idx] - base_metrics[idx]
+            if delta > self.threshold:
+                regressions.append(
+                    f"{self.metric} of {name} grew {delta:.2f} "
+                    f"({base_metrics[idx]:.2f} -> {head_metrics[idx]:.2f})"
+                )
+
+        return regressions
@@ -1,4 +1,8 @@
+from functools import lru_cache
+import re
+from typing import Iterable
 from typing import List
+from typing import Pattern
 
 DECIMALS = 2
 
@@ -103,3 +107,71 @@ def mean(values: List[float]) -> float:
     _mean = round(sum_values / n_values, DECIMALS)
 
     return _mean
+
+
+def _translate_glob_segment(segment: str) -> str:
+    regex = ""
+    idx = 0
+    while idx < len(segment):
+        char = segment[idx]
+        idx += 1
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            start = idx + 1 if segment.startswith("!", idx) else idx
+            end = segment.find("]", start + 1)
+            if end == -1:
+                regex += re.escape(char)
+                continue
+
+            negate = "^" if start > idx else ""
+            chars = segment[start:end].replace("\\", "\\\\")
+            regex += f"[{negate}{chars}]"
+            idx = end + 1
+        else:
+            regex += re.escape(char)
+
+    return regex
+
+
+@lru_cache(maxsize=1024)
+def glob_to_regex(pattern: str) -> Pattern:
+    """Compile a glob into a regex that matches paths like ``Path.match``:
+    relative patterns match from the right, absolute ones the whole path.
+    ``**`` also matches any number of directories.
+
+    :param pattern: glob pattern, with ``/`` as separator
+    :return: compiled regex, use ``search`` to match a path
+    """
+
+    if not pattern:
+        raise ValueError("empty pattern")
+
+    regex = ""
+    need_separator = False
+    parts = pattern.strip("/").split("/")
+    for idx, part in enumerate(parts):
+        if part == "**":
+            if idx == len(parts) - 1:
+                regex += "(?:/.*)?" if need_separator else ".*"
+            else:
+                regex += ("/" if need_separator else "") + "(?:[^/]+/)*"
+                need_separator = False
+            continue
+
+        if need_separator:
+            regex += "/"
+        regex += _translate_glob_segment(part)
+        need_separator = True
+
+    anchor = "^/" if pattern.startswith("/") else "(?:^|/)"
+    return re.compile(f"{anchor}{regex}$")
+
+
+def globs_to_regex(patterns: Iterable[str]) -> Pattern:
+    """Compile globs into a single regex that matches any of them"""
+
+    regexes = [glob_to_regex(pattern).pattern for pattern in patterns]
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes) or "(?!)")
@@ -0,0 +1,105 @@
+"""Measure the memory held by parsed classes.
+
+Usage: PYTHONPATH=. python benchmarks/class_records.py [n_modules]
+
+Every synthetic module has 400 classes sharing a few base classes and
+metaclasses. The plain layout keeps the list-of-tuples with a list and a
+dict per class and nodes with a __dict__ and a children dict each, the
+compact layout keeps the ClassRecords of the summary plus the slotted
+ClassNodes built from them.
+"""
+import ast
+import sys
+import tracemalloc
+
+from basel.components.classes import ClassNode
+from basel.components.modules import ModuleNode
+from basel.parsers import ModuleSummary
+from basel.parsers.visitors import SummaryVisitor
+
+CLASS_TEMPLATE = """
+import package.module_{module}
+
+
+class Class{idx}(Base{base}, metaclass=abc.ABCMeta):
+    pass
+
+
+class Other{idx}(abc.ABC):
+    pass
+"""
+
+
+def build_module(n_classes: int = 200) -> ast.AST:
+    source = "".join(
+        CLASS_TEMPLATE.format(idx=idx, module=idx % 50, base=idx % 7)
+        for idx in range(n_classes)
+    )
+    return ast.parse(source)
+
+
+class PlainNode:
+    def __init__(self, name, subclasses=None, keywords=None):
+        self.name = name
+        self.children = {}
+        self.subclasses = subclasses or []
+        self.keywords = keywords or {}
+
+
+def plain_layout(py_tree: ast.AST, n_modules: int):
+    modules = []
+    for idx in range(n_modules):
+        visitor = SummaryVisitor()
+        visitor.visit(py_tree)
+        classes = [
+            (name, list(subclasses), dict(keywords))
+            for name, subclasses, keywords in visitor.classes
+        ]
+        imports = [str(_import) for _import in sorted(visitor.imports)]
+
+        module = PlainNode(f"module_{idx}.py")
+        for _class in classes:
+            module.children[_class[0]] = PlainNode(*_class)
+
+        modules.append(((imports, classes), module))
+
+    return modules
+
+
+def compact_layout(py_tree: ast.AST, n_modules: int):
+    modules = []
+    for idx in range(n_modules):
+        visitor = SummaryVisitor()
+        visitor.visit(py_tree)
+        summary = ModuleSummary.create(visitor.imports, visitor.classes)
+
+        module = ModuleNode(f"module_{idx}.py")
+        for _class in summary.classes:
+            module.add_child(ClassNode(*_class))
+
+        modules.append((summary, module))
+
+    return modules
+
+
+def measure(layout, py_tree: ast.AST, n_modules: int) -> float:
+    tracemalloc.start()
+    modules = layout(py_tree, n_modules)  # noqa: F841
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return current / 1024 / 1024
+
+
+def main():
+    n_modules = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    py_tree = build_module()
+
+    print(f"{n_modules * 400} classes")
+    for layout in (plain_layout, compact_layout):
+        size = measure(layout, py_tree, n_modules)
+        print(f"  {layout.__name__:<16} {size:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare the import scanning scopes on large modules.
+
+Usage: PYTHONPATH=. python benchmarks/import_scope.py [module.py ...]
+
+Without arguments a synthetic module with a few imports and thousands of
+lines of function bodies is used. Parsing is excluded from the timings, only
+the traversal of the tree is measured.
+"""
+import ast
+import sys
+import timeit
+
+from basel.parsers.visitors import ImportScope
+from basel.parsers.visitors import SummaryVisitor
+
+FUNCTION_TEMPLATE = """
+def function_{idx}(a, b, c=None):
+    values = [a * i + b for i in range(10) if i % 2]
+    if c is not None:
+        values.append({{"key": c, "other": (a, b, c)}})
+    try:
+        total = sum(v for v in values if isinstance(v, int))
+    except TypeError:
+        total = 0
+    return total + len(values) * {idx}
+"""
+
+
+def build_module(n_functions: int = 2000) -> str:
+    header = "import os\nimport sys\nfrom typing import List\n"
+    body = "".join(FUNCTION_TEMPLATE.format(idx=idx) for idx in range(n_functions))
+    return header + body
+
+
+def walk_summary(py_tree: ast.AST):
+    _imports = set()
+    _classes = []
+    for stmt in ast.walk(py_tree):
+        if isinstance(stmt, ast.Import):
+            for alias in stmt.names:
+                _imports.add(alias.name)
+        elif isinstance(stmt, ast.ImportFrom):
+            for alias in stmt.names:
+                _imports.add(f"{stmt.module}.{alias.name}")
+        elif isinstance(stmt, ast.ClassDef):
+            _classes.append(stmt.name)
+
+    return _imports
+
+
+def visit_summary(py_tree: ast.AST, scope: ImportScope):
+    visitor = SummaryVisitor(scope)
+    visitor.visit(py_tree)
+    return visitor.imports
+
+
+def bench(name: str, source: str, number: int = 5):
+    py_tree = ast.parse(source)
+    lines = source.count("\n")
+
+    print(f"{name} ({lines} lines)")
+
+    baseline = min(timeit.repeat(lambda: walk_summary(py_tree), number=number))
+    print(f"  {'ast.walk':<12} {baseline / number * 1000:8.2f} ms")
+
+    for scope in ImportScope:
+        elapsed = min(
+            timeit.repeat(lambda: visit_summary(py_tree, scope), number=number)
+        )
+        speedup = baseline / elapsed
+        print(f"  {scope.value:<12} {elapsed / number * 1000:8.2f} ms  x{speedup:.1f}")
+
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        bench("synthetic", build_module())
+
+    for path in paths:
+        with open(path, "rb") as module:
+            bench(path, module.read().decode())
+
+
+if __name__ == "__main__":
+    main()
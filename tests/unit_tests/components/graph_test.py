@@ -0,0 +1,99 @@
+from basel.components.graph import DependencyGraph
+import pytest
+
+EDGES = [("A", "B"), ("B", "C"), ("A", "C"), ("C", "C"), ("D", "A")]
+
+
+@pytest.fixture
+def graph():
+    graph = DependencyGraph()
+    for source, target in EDGES:
+        graph.add_edge(source, target)
+
+    return graph
+
+
+@pytest.mark.parametrize(
+    "name,expected_successors,expected_predecessors,expected_degrees",
+    [
+        ("A", ["B", "C"], ["D"], (1, 2)),
+        ("B", ["C"], ["A"], (1, 1)),
+        ("C", ["C"], ["B", "A", "C"], (2, 1)),
+        ("D", ["A"], [], (0, 1)),
+        ("E", [], [], (0, 0)),
+    ],
+)
+def test_get_neighbours(
+    graph, name, expected_successors, expected_predecessors, expected_degrees
+):
+    assert graph.get_successors(name) == expected_successors
+    assert graph.get_predecessors(name) == expected_predecessors
+    assert (graph.get_in_degree(name), graph.get_out_degree(name)) == expected_degrees
+
+
+def test_add_edge_once(graph):
+    assert not graph.add_edge("A", "B")
+    assert graph.add_edge("B", "A")
+
+    assert graph.get_number_of_edges() == len(EDGES) + 1
+    assert graph.get_successors("B") == ["C", "A"]
+
+
+def test_remove_node(graph):
+    graph.remove_node("C")
+
+    assert "C" not in graph
+    assert len(graph) == 3
+    assert list(graph.get_edges()) == [("A", "B"), ("D", "A")]
+    assert graph.get_out_degree("A") == 1
+    assert not graph.has_edge("B", "C")
+
+    graph.add_node("C")
+    assert not graph.has_edge("B", "C")
+    assert graph.get_predecessors("C") == []
+    assert graph.get_id("C") == 4
+
+
+def test_remove_edge(graph):
+    assert graph.remove_edge("A", "C")
+    assert not graph.remove_edge("A", "C")
+    assert not graph.remove_edge("A", "E")
+
+    assert not graph.has_edge("A", "C")
+    assert (graph.get_in_degree("C"), graph.get_out_degree("A")) == (1, 1)
+    assert graph.get_successors("A") == ["B"]
+
+    assert graph.add_edge("A", "C")
+    assert graph.get_number_of_edges() == len(EDGES)
+    assert graph.get_predecessors("C") == ["B", "C", "A"]
+
+
+@pytest.mark.parametrize(
+    "edges,expected_groups",
+    [
+        (EDGES, [["D"], ["A"], ["B"], ["C"]]),
+        (
+            [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "E"), ("E", "D")],
+            [["A", "B", "C"], ["D", "E"]],
+        ),
+        ([("A", "B"), ("C", "B"), ("B", "D")], [["C"], ["A"], ["B"], ["D"]]),
+    ],
+)
+def test_get_strongly_connected_components(edges, expected_groups):
+    graph = DependencyGraph()
+    for source, target in edges:
+        graph.add_edge(source, target)
+
+    assert graph.get_strongly_connected_components() == expected_groups
+
+
+def test_get_strongly_connected_components_of_deep_graph():
+    graph = DependencyGraph()
+    size = 50000
+    for idx in range(size):
+        graph.add_edge(str(idx), str((idx + 1) % size))
+
+    groups = graph.get_strongly_connected_components()
+
+    assert len(groups) == 1
+    assert len(groups[0]) == size
@@ -0,0 +1,108 @@
+import os
+from pathlib import Path
+
+from basel.loaders.discovery import ModuleDiscovery
+from basel.loaders.exclusion import ExclusionRules
+import pytest
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    for path in (
+        "pkg/__init__.py",
+        "pkg/a/module.py",
+        "pkg/a-b/module.py",
+        "pkg/b.py",
+        "pkg/readme.md",
+        "pkg/sub/deep/module.py",
+        "tests/module_test.py",
+    ):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+
+    return tmp_path
+
+
+def _get_relative_paths(paths, root):
+    return [path.relative_to(root).as_posix() for path in paths]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_discover_in_path_order(project_path, monkeypatch, jobs):
+    monkeypatch.setattr(ModuleDiscovery, "parallel_threshold", 1)
+
+    modules, directories = ModuleDiscovery(jobs=jobs).discover([project_path])
+
+    assert modules == sorted(modules)
+    assert _get_relative_paths(modules, project_path) == [
+        "pkg/__init__.py",
+        "pkg/a/module.py",
+        "pkg/a-b/module.py",
+        "pkg/b.py",
+        "pkg/sub/deep/module.py",
+        "tests/module_test.py",
+    ]
+    assert directories == sorted(directories)
+    assert len(directories) == 7
+
+
+def test_discover_overlapping_roots(project_path):
+    discovery = ModuleDiscovery()
+
+    modules, _ = discovery.discover(
+        [project_path / "pkg" / "sub", project_path, project_path / "tests"]
+    )
+
+    assert len(modules) == 6
+    assert len(set(modules)) == len(modules)
+
+
+@pytest.mark.parametrize(
+    "root,link,target,expected_modules",
+    [
+        (".", "pkg/sub/loop", "pkg", 6),
+        ("pkg", "pkg/sub/loop", "pkg", 5),
+        ("pkg", "pkg/a/up", ".", 5),
+    ],
+)
+def test_discover_symlink_loop(project_path, root, link, target, expected_modules):
+    os.symlink(project_path / target, project_path / link)
+
+    modules, _ = ModuleDiscovery().discover([project_path / root])
+
+    assert len(modules) == expected_modules
+
+
+def test_discover_linked_directory(project_path, tmp_path_factory):
+    external_path = tmp_path_factory.mktemp("external")
+    (external_path / "module.py").touch()
+    os.symlink(external_path, project_path / "pkg" / "external")
+    os.symlink(external_path, project_path / "tests" / "external")
+
+    modules, _ = ModuleDiscovery().discover([project_path])
+
+    assert (
+        _get_relative_paths(modules, project_path).count("pkg/external/module.py") == 1
+    )
+    assert len(modules) == 7
+
+
+def test_discover_excluded_modules(project_path):
+    rules = ExclusionRules(["*__init__.py", "tests/**"])
+
+    modules, directories = ModuleDiscovery(rules).discover([project_path])
+
+    assert "pkg/__init__.py" not in _get_relative_paths(modules, project_path)
+    assert project_path / "tests" not in directories
+
+
+def test_discover_missing_path(tmp_path):
+    assert ModuleDiscovery().discover([tmp_path / "missing"]) == ([], [])
+
+
+def test_discover_relative_path(project_path, monkeypatch):
+    monkeypatch.chdir(project_path)
+
+    modules, _ = ModuleDiscovery().discover([Path("./pkg")])
+
+    assert modules[0] == Path("pkg/__init__.py")
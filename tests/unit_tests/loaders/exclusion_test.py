@@ -0,0 +1,80 @@
+from basel.loaders.exclusion import ExclusionRules
+import pytest
+
+
+@pytest.mark.parametrize(
+    "patterns,path,expected_excluded",
+    [
+        ([], "src/module.py", False),
+        (["*__init__.py"], "src/__init__.py", True),
+        (["*__init__.py"], "src/module.py", False),
+        (["tests/*", "*__init__.py"], "tests/module_test.py", True),
+        (["tests/*", "*__init__.py"], "src/__init__.py", True),
+        (["svc/**"], "src/svc/api/views.py", True),
+    ],
+)
+def test_is_excluded_module(patterns, path, expected_excluded):
+    rules = ExclusionRules(patterns)
+
+    assert rules.is_excluded_module(path) == expected_excluded
+
+
+@pytest.mark.parametrize(
+    "patterns,path,expected_excluded",
+    [
+        ([], "src/.git", True),
+        ([], "src/__pycache__", True),
+        ([], "basel.egg-info", True),
+        ([], "src/package", False),
+        (["tests/*"], "src/tests", False),
+        (["svc/**"], "src/svc", True),
+        (["svc/**"], "src/svc/api", True),
+    ],
+)
+def test_is_excluded_dir(patterns, path, expected_excluded):
+    rules = ExclusionRules(patterns)
+
+    assert rules.is_excluded_dir(path) == expected_excluded
+
+
+def test_ignore_dirs_keep_packages(tmp_path):
+    (tmp_path / "operations" / "build").mkdir(parents=True)
+    (tmp_path / "operations" / "build" / "__init__.py").touch()
+    (tmp_path / "build" / "lib").mkdir(parents=True)
+
+    rules = ExclusionRules()
+
+    assert not rules.is_excluded_dir(str(tmp_path / "operations" / "build"))
+    assert rules.is_excluded_dir(str(tmp_path / "build"))
+
+
+def test_no_ignore_dirs():
+    rules = ExclusionRules(ignore_dirs=None)
+
+    assert not rules.is_excluded_dir("src/build")
+
+
+@pytest.mark.parametrize(
+    "lines,path,is_dir,expected_excluded",
+    [
+        (["generated/"], "generated", True, True),
+        (["generated/"], "pkg/generated.py", False, False),
+        (["*_pb2.py"], "pkg/api_pb2.py", False, True),
+        (["/scripts"], "scripts", True, True),
+        (["/scripts"], "pkg/scripts", True, False),
+        (["pkg/legacy.py"], "pkg/legacy.py", False, True),
+        (["pkg/legacy.py"], "other/pkg/legacy.py", False, False),
+        (["# comment", "!keep.py"], "keep.py", False, False),
+    ],
+)
+def test_gitignore(tmp_path, lines, path, is_dir, expected_excluded):
+    (tmp_path / ".gitignore").write_text("\n".join(lines))
+
+    rules = ExclusionRules(use_gitignore=True)
+    rules.add_gitignore(str(tmp_path))
+
+    path = str(tmp_path / path)
+    if is_dir:
+        assert rules.is_excluded_dir(path) == expected_excluded
+    else:
+        assert rules.is_excluded_module(path) == expected_excluded
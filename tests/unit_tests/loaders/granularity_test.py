@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+from basel.loaders.granularity import get_grouper
+from basel.loaders.granularity import MappingGrouper
+import pytest
+
+
+@pytest.mark.parametrize(
+    "granularity,roots,module_path,expected_name",
+    [
+        (None, [], "src/package/module.py", "src/package/module.py"),
+        ("module", [], "src/package/module.py", "src/package/module.py"),
+        ("package", [], "src/package/module.py", "src/package"),
+        ("package", [], "module.py", "."),
+        ("depth:0", [Path("src")], "src/package/sub/module.py", "src"),
+        ("depth:1", [Path("src")], "src/package/sub/module.py", "src/package"),
+        ("depth:1", [Path("src")], "src/module.py", "src"),
+        ("depth:1", [Path("lib"), Path("src")], "src/a/b/module.py", "src/a"),
+        ("depth:1", [Path("lib")], "src/package/module.py", "src/package"),
+        ("depth:3", [Path("src")], "src/a/b/module.py", "src/a/b"),
+    ],
+)
+def test_get_component_name(granularity, roots, module_path, expected_name):
+    grouper = get_grouper(granularity, roots)
+
+    assert grouper.get_component_name(module_path) == expected_name
+
+
+@pytest.mark.parametrize("granularity", ["packages", "depth", "depth:x", "depth:-1"])
+def test_raise_error_on_incorrect_granularity(granularity):
+    with pytest.raises(ValueError):
+        get_grouper(granularity)
+
+
+def test_group_by_component_map(tmp_path):
+    component_map = tmp_path / "components.json"
+    component_map.write_text(
+        json.dumps(
+            {
+                "src/parsers/*": "parsers",
+                "src/*/models.py": "models",
+                "src/services/**": "services",
+            }
+        )
+    )
+
+    grouper = get_grouper("package", component_map=component_map)
+
+    assert isinstance(grouper, MappingGrouper)
+    assert grouper.get_component_name("src/parsers/python.py") == "parsers"
+    assert grouper.get_component_name("src/loaders/models.py") == "models"
+    assert grouper.get_component_name("src/services/api/v1/users.py") == "services"
+    assert grouper.get_component_name("src/main.py") == "src/main.py"
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from basel.loaders.index import ModuleIndex
+import pytest
+
+
+@pytest.mark.parametrize(
+    "roots,modules,directories,name,expected_path",
+    [
+        (
+            [Path("/root")],
+            [Path("/root/src/package/module.py")],
+            [Path("/root/src"), Path("/root/src/package")],
+            "src.package.module",
+            Path("/root/src/package/module.py"),
+        ),
+        (
+            [Path("/root")],
+            [Path("/root/src/package/__init__.py")],
+            [Path("/root/src"), Path("/root/src/package")],
+            "src.package",
+            Path("/root/src/package/__init__.py"),
+        ),
+        (
+            [Path("/root")],
+            [Path("/root/src/package/module.py")],
+            [Path("/root/src"), Path("/root/src/package")],
+            "src.package",
+            Path("/root/src/package"),
+        ),
+        (
+            [Path("/root/src"), Path("/root")],
+            [Path("/root/src/package/module.py")],
+            [Path("/root/src"), Path("/root/src/package")],
+            "package.module",
+            Path("/root/src/package/module.py"),
+        ),
+        (
+            [Path("/root")],
+            [Path("/other/module.py")],
+            [Path("/other")],
+            "module",
+            None,
+        ),
+        (
+            [Path("/root")],
+            [Path("/root/src/module.py")],
+            [Path("/root/src")],
+            "src.module.Class",
+            None,
+        ),
+    ],
+)
+def test_search_module(roots, modules, directories, name, expected_path):
+    index = ModuleIndex(roots=roots)
+
+    for directory in directories:
+        index.add_directory(directory)
+
+    for module in modules:
+        index.add_module(module)
+
+    assert index.search(name) == expected_path
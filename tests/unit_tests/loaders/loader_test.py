@@ -0,0 +1,113 @@
+from unittest.mock import Mock
+
+from basel.components import Component
+from basel.components import Link
+from basel.components.modules import ModuleNode
+from basel.loaders import LoaderPhase
+from basel.loaders import ModuleLoader
+from basel.parsers import Parser
+import pytest
+
+
+def test_get_component_by_node():
+    component_a = Component(name="Component_A", nodes=[ModuleNode("Module_A")])
+    component_b = Component(name="Component_B", nodes=[ModuleNode("Module_B")])
+
+    loader = ModuleLoader(Mock(spec=Parser), [component_a, component_b])
+    loader.add_node("Component_A", ModuleNode("Module_A2"))
+
+    assert loader.get_component_by_node("Module_A") is component_a
+    assert loader.get_component_by_node("Module_A2") is component_a
+    assert loader.get_component_by_node("Module_B") is component_b
+    assert loader.get_component_by_node("Module_C") is None
+
+
+def test_remove_component_from_node_index():
+    component_a = Component(name="Component_A", nodes=[ModuleNode("Module_A")])
+    component_b = Component(
+        name="Component_B", nodes=[ModuleNode("Module_A"), ModuleNode("Module_B")]
+    )
+
+    loader = ModuleLoader(Mock(spec=Parser), [component_a, component_b])
+
+    assert loader.get_component_by_node("Module_A") is component_a
+
+    loader.remove_component("Component_A")
+
+    assert loader.get_component("Component_A") is None
+    assert loader.get_component_by_node("Module_A") is component_b
+
+    loader.add_component(Component(name="Component_B"))
+
+    assert loader.get_component_by_node("Module_A") is None
+    assert loader.get_component_by_node("Module_B") is None
+
+
+def test_has_link():
+    component_a = Component(name="Component_A", nodes=[ModuleNode("Module_A")])
+    component_b = Component(name="Component_B", nodes=[ModuleNode("Module_B")])
+    component_c = Component(name="Component_C", nodes=[ModuleNode("Module_C")])
+
+    loader = ModuleLoader(
+        Mock(spec=Parser),
+        [component_a, component_b, component_c],
+        [Link(component_a, component_b)],
+    )
+    loader.link_component(component_b, component_c)
+
+    assert loader.has_link(component_a, component_b)
+    assert loader.has_link(component_b, component_c)
+    assert not loader.has_link(component_b, component_a)
+    assert not loader.has_link(component_a, component_c)
+
+    loader.remove_component("Component_B")
+
+    assert not loader.has_link(component_a, component_b)
+    assert loader.get_links() == []
+
+
+def test_get_coupling():
+    component_a = Component(name="Component_A")
+    component_b = Component(name="Component_B")
+    component_c = Component(name="Component_C")
+
+    loader = ModuleLoader(
+        Mock(spec=Parser),
+        [component_a, component_b, component_c],
+        [Link(component_a, component_b), Link(component_a, component_c)],
+    )
+    loader.link_component(component_b, component_c)
+
+    assert loader.get_coupling("Component_A") == (0, 2)
+    assert loader.get_coupling("Component_B") == (1, 1)
+    assert loader.get_coupling("Component_C") == (2, 0)
+
+    loader.remove_component("Component_B")
+
+    assert loader.get_coupling("Component_A") == (0, 1)
+    assert loader.get_coupling("Component_C") == (1, 0)
+
+
+@pytest.mark.parametrize(
+    "phases,expected_stale",
+    [
+        ([], set(LoaderPhase)),
+        (
+            [LoaderPhase.CLASSES],
+            {LoaderPhase.CLASSES, LoaderPhase.ABSTRACTION, LoaderPhase.ERROR},
+        ),
+        (
+            [LoaderPhase.LINKS],
+            {LoaderPhase.LINKS, LoaderPhase.INSTABILITY, LoaderPhase.ERROR},
+        ),
+        ([LoaderPhase.ERROR], {LoaderPhase.ERROR}),
+    ],
+)
+def test_invalidate(phases, expected_stale):
+    loader = ModuleLoader(Mock(spec=Parser))
+    for phase in LoaderPhase:
+        loader._mark_fresh(phase)
+
+    loader.invalidate(*phases)
+
+    assert {phase for phase in LoaderPhase if loader.is_stale(phase)} == expected_stale
@@ -7,8 +7,13 @@ from basel.components import Component
 from basel.components.classes import ClassNode
 from basel.components.links import Link
 from basel.components.modules import ModuleNode
+from basel.loaders import discovery
+from basel.loaders.granularity import get_grouper
 from basel.loaders.modules import ModuleLoader
+from basel.parsers import ModuleSummary
+from basel.parsers import ParseCache
 from basel.parsers import Parser
+from basel.parsers import PythonParser
 import pytest
 
 STUB_PROJECT_1_PATH = Path("tests/stubs/project_1")
@@ -108,14 +113,14 @@ def test_module_loader(paths, expected_components):
 def test_load_links(components, _imports, expected_links):
     mock_parser = Mock(spec=Parser)
 
-    def mock_get_imports(path):
-        return _imports.get(path, [])
+    def mock_get_summary(path):
+        return ModuleSummary(imports=_imports.get(path, []))
 
-    mock_parser.get_imports.side_effect = mock_get_imports
+    mock_parser.get_summary.side_effect = mock_get_summary
 
     loader = ModuleLoader(mock_parser, components)
 
-    def mock_search_py_module(_import):
+    def mock_search_py_module(_import, module_path=None):
         return _import
 
     loader.search_py_module = mock_search_py_module
@@ -145,16 +150,21 @@ def test_load_links(components, _imports, expected_links):
         (STUB_PROJECT_1_PATH, "dataclasses.dataclass", None),
     ],
 )
-def test_search_by_module(root, _import, expected_py_module):
+def test_search_by_module(root, _import, expected_py_module, monkeypatch):
     cwd = os.getcwd()
     os.chdir(root)
 
     mock_parser = Mock(spec=Parser)
 
     loader = ModuleLoader(mock_parser)
+    loader.load_components([Path(".")])
+
+    monkeypatch.setattr(os.path, "exists", Mock(side_effect=AssertionError))
+    monkeypatch.setattr(os.path, "isdir", Mock(side_effect=AssertionError))
 
     py_module = loader.search_py_module(_import)
 
+    monkeypatch.undo()
     os.chdir(cwd)
 
     assert py_module == expected_py_module
@@ -192,10 +202,10 @@ def test_search_by_module(root, _import, expected_py_module):
 def test_load_classes(components, _classes, expected_components):
     mock_parser = Mock(spec=Parser)
 
-    def mock_get_parsed_classes(module):
-        return _classes.get(module)
+    def mock_get_summary(module):
+        return ModuleSummary(classes=_classes.get(module))
 
-    mock_parser.get_classes.side_effect = mock_get_parsed_classes
+    mock_parser.get_summary.side_effect = mock_get_summary
 
     loader = ModuleLoader(mock_parser, components)
 
@@ -386,4 +396,222 @@ def test_calculate_error(components, expected_error):
 
     for comp_name, error in expected_error.items():
         comp = loader.get_component(comp_name)
-        assert comp.error == error
+        assert comp.error == pytest.approx(error)
+
+
+def test_parse_each_module_once():
+    mock_parser = Mock(spec=Parser)
+    mock_parser.get_summary.return_value = ModuleSummary(
+        imports=["Module_B"], classes=[("ClassA", [], {})]
+    )
+
+    components = [
+        Component(name="Component_A", nodes=[ModuleNode("Module_A")]),
+        Component(name="Component_B", nodes=[ModuleNode("Module_B")]),
+    ]
+    loader = ModuleLoader(mock_parser, components)
+    loader.search_py_module = lambda _import, module_path=None: _import
+
+    loader.load_classes()
+    loader.load_links()
+
+    assert mock_parser.get_summary.call_count == len(components)
+
+
+def test_load_in_parallel():
+    serial_loader = ModuleLoader(PythonParser())
+    serial_loader.load_components([STUB_PROJECT_1_PATH])
+    serial_loader.load_classes()
+
+    parallel_loader = ModuleLoader(PythonParser(), jobs=2)
+    parallel_loader.parallel_threshold = 0
+    parallel_loader.load_components([STUB_PROJECT_1_PATH])
+    parallel_loader.load_classes()
+
+    assert parallel_loader._summaries == serial_loader._summaries
+    assert list(parallel_loader._summaries) == list(serial_loader._summaries)
+    assert parallel_loader.get_components() == serial_loader.get_components()
+
+
+def test_load_in_parallel_keeps_errors_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for idx in range(6):
+        # the sizes grow with the name, the biggest modules are parsed first
+        Path(f"module_{idx}.py").write_text("def broken(:\n" + "#" * idx)
+
+    serial_loader = ModuleLoader(PythonParser())
+    serial_loader.load_components([Path(".")])
+    serial_loader.load_classes()
+
+    parallel_loader = ModuleLoader(PythonParser(), jobs=2)
+    parallel_loader.parallel_threshold = 0
+    parallel_loader.load_components([Path(".")])
+    parallel_loader.load_classes()
+
+    assert len(serial_loader.get_errors()) == 6
+    assert list(parallel_loader.get_errors().items()) == list(
+        serial_loader.get_errors().items()
+    )
+
+
+def _get_logged_entries(cache):
+    with open(cache.directory.parent / "scans", "a") as scans:
+        scans.write(f"{os.getpid()}\n")
+
+    return ParseCache._get_entries_unlogged(cache)
+
+
+def test_load_in_parallel_counts_cache_size_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        ParseCache, "_get_entries_unlogged", ParseCache._get_entries, raising=False
+    )
+    monkeypatch.setattr(ParseCache, "_get_entries", _get_logged_entries)
+    cache = ParseCache(tmp_path / "cache")
+
+    loader = ModuleLoader(PythonParser(cache=cache), jobs=2)
+    loader.parallel_threshold = 0
+    loader.load_components([STUB_PROJECT_1_PATH])
+    loader.load_classes()
+
+    # counted before the workers get the cache and once they are done
+    scans = (tmp_path / "scans").read_text().split()
+    assert scans == [str(os.getpid())] * 2
+    assert cache.get_size() == sum(
+        entry.stat().st_size for entry in (tmp_path / "cache").iterdir()
+    )
+
+
+def test_recompute_stale_phases_only():
+    mock_parser = Mock(spec=Parser)
+    mock_parser.get_summary.side_effect = lambda path: ModuleSummary(
+        imports=["Module_B"] if path == "Module_A" else []
+    )
+    mock_parser.is_abstract_class.return_value = False
+
+    component_a = Component(name="Component_A", nodes=[ModuleNode("Module_A")])
+    loader = ModuleLoader(mock_parser, [component_a])
+    loader.search_py_module = Mock(
+        side_effect=lambda _import, module_path=None: _import
+    )
+
+    for _ in range(2):
+        loader.calculate_abstraction()
+        loader.calculate_instability()
+        loader.calculate_error()
+        loader.load_links()
+
+    assert loader.search_py_module.call_count == 1
+    assert loader.get_links() == []
+
+    component_b = Component(name="Component_B", nodes=[ModuleNode("Module_B")])
+    loader.add_component(component_b)
+    loader.calculate_instability()
+
+    assert loader.search_py_module.call_count == 2
+    assert loader.has_link(component_a, component_b)
+    assert component_a.instability == 1
+    assert component_b.instability == 0
+
+
+def test_group_components_without_parsing_again():
+    parser = Mock(wraps=PythonParser())
+
+    loader = ModuleLoader(parser, source_roots=[STUB_PROJECT_1_PATH])
+    loader.load_components([STUB_PROJECT_1_PATH])
+    loader.calculate_abstraction()
+    loader.calculate_instability()
+    parse_count = parser.get_summary.call_count
+
+    package_loader = loader.group_components(get_grouper("package"))
+    package_loader.calculate_abstraction()
+    package_loader.calculate_instability()
+
+    assert parser.get_summary.call_count == parse_count
+
+    root = str(STUB_PROJECT_1_PATH)
+    package_a = str(STUB_PROJECT_1_PATH / "package_a")
+    package_b = str(STUB_PROJECT_1_PATH / "package_b")
+    assert [comp.name for comp in package_loader.get_components()] == [
+        root,
+        package_a,
+        package_b,
+    ]
+    assert [link.key for link in package_loader.get_links()] == [(root, package_a)]
+    assert package_loader.get_coupling(root) == (0, 1)
+    assert len(package_loader.get_component(root).get_classes()) == len(
+        loader.get_component(str(STUB_PROJECT_1_PATH / "module_1.py")).get_classes()
+    ) + len(
+        loader.get_component(str(STUB_PROJECT_1_PATH / "module_2.py")).get_classes()
+    )
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    for path in (
+        "pkg/__init__.py",
+        "pkg/module.py",
+        "pkg/generated/api.py",
+        "pkg/__pycache__/module.py",
+        ".venv/lib/site.py",
+        "tests/module_test.py",
+    ):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+
+    (tmp_path / ".gitignore").write_text("generated/\n")
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "use_gitignore,exclude_components,exclude_packages,expected_modules",
+    [
+        (
+            False,
+            None,
+            False,
+            [
+                "pkg/__init__.py",
+                "pkg/generated/api.py",
+                "pkg/module.py",
+                "tests/module_test.py",
+            ],
+        ),
+        (
+            True,
+            None,
+            False,
+            ["pkg/__init__.py", "pkg/module.py", "tests/module_test.py"],
+        ),
+        (True, ["tests/**"], True, ["pkg/module.py"]),
+    ],
+)
+def test_discover_modules_prunes_excluded_dirs(
+    project_path,
+    monkeypatch,
+    use_gitignore,
+    exclude_components,
+    exclude_packages,
+    expected_modules,
+):
+    walked_dirs = []
+    scan_directory = discovery.scan_directory
+
+    def _scan_directory(directory):
+        walked_dirs.append(Path(directory).name)
+        return scan_directory(directory)
+
+    monkeypatch.setattr(discovery, "scan_directory", _scan_directory)
+
+    loader = ModuleLoader(Mock(spec=Parser), use_gitignore=use_gitignore)
+    loader.load_components([project_path], None, exclude_components, exclude_packages)
+
+    modules = [
+        Path(comp.name).relative_to(project_path).as_posix()
+        for comp in loader.get_components()
+    ]
+
+    assert sorted(modules) == expected_modules
+    assert ".venv" not in walked_dirs
+    assert "__pycache__" not in walked_dirs
+    assert ("generated" in walked_dirs) != use_gitignore
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from basel.loaders import ModuleLoader
+from basel.loaders import prefetch
+from basel.loaders.prefetch import prefetch_summaries
+from basel.parsers import ModuleSummary
+from basel.parsers import ParseCache
+from basel.parsers import PythonParser
+import pytest
+
+STUB_PROJECT_1_PATH = Path("tests/stubs/project_1")
+
+
+@pytest.mark.parametrize("concurrency", [1, 3, 16])
+def test_prefetch_summaries(tmp_path, concurrency):
+    module_paths = []
+    for idx in range(10):
+        path = tmp_path / f"module_{idx}.py"
+        path.write_bytes(f"import module_{idx}".encode())
+        module_paths.append(str(path))
+
+    module_paths.append(str(tmp_path / "missing.py"))
+
+    def parse(module_path, source):
+        assert source is not None
+        return ModuleSummary(imports=[source.decode()])
+
+    summaries = prefetch_summaries(module_paths, parse, concurrency)
+
+    assert list(summaries) == module_paths
+    assert summaries[str(tmp_path / "module_3.py")].imports == ["import module_3"]
+    assert summaries[str(tmp_path / "missing.py")].error.startswith("FileNotFoundError")
+
+
+def test_load_with_prefetch():
+    serial_loader = ModuleLoader(PythonParser())
+    serial_loader.load_components([STUB_PROJECT_1_PATH])
+    serial_loader.load_classes()
+
+    prefetch_loader = ModuleLoader(PythonParser(), prefetch=4)
+    prefetch_loader.load_components([STUB_PROJECT_1_PATH])
+    prefetch_loader.load_classes()
+
+    assert prefetch_loader._summaries == serial_loader._summaries
+    assert list(prefetch_loader._summaries) == list(serial_loader._summaries)
+    assert prefetch_loader.get_components() == serial_loader.get_components()
+
+
+def test_prefetch_skips_cached_modules(tmp_path, monkeypatch):
+    parser = PythonParser(cache=ParseCache(tmp_path / "cache"))
+    cached_loader = ModuleLoader(parser)
+    cached_loader.load_components([STUB_PROJECT_1_PATH])
+    cached_loader.load_classes()
+
+    read_paths = []
+    read_module = prefetch.read_module
+    monkeypatch.setattr(
+        prefetch,
+        "read_module",
+        lambda module_path: read_paths.append(module_path) or read_module(module_path),
+    )
+
+    prefetch_loader = ModuleLoader(parser, prefetch=4)
+    prefetch_loader.load_components([STUB_PROJECT_1_PATH])
+    prefetch_loader.load_classes()
+
+    assert read_paths == []
+    assert prefetch_loader._summaries == cached_loader._summaries
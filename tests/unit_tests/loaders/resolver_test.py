@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from basel.loaders.index import ModuleIndex
+from basel.loaders.resolver import ImportResolver
+import pytest
+
+MODULES = [
+    Path("/root/src/package/__init__.py"),
+    Path("/root/src/package/module_a.py"),
+    Path("/root/src/package/sub/module_b.py"),
+    Path("/root/src/other.py"),
+]
+
+
+@pytest.fixture
+def resolver():
+    index = ModuleIndex(roots=[Path("/root/src"), Path("/root")])
+    for module in MODULES:
+        index.add_directory(module.parent)
+        index.add_module(module)
+
+    return ImportResolver(index)
+
+
+@pytest.mark.parametrize(
+    "_import,module_path,expected_path",
+    [
+        ("package.module_a", None, Path("/root/src/package/module_a.py")),
+        ("package.module_a.Class", None, Path("/root/src/package/module_a.py")),
+        ("src.other", None, Path("/root/src/other.py")),
+        ("package", None, Path("/root/src/package/__init__.py")),
+        (
+            ".module_a",
+            "/root/src/package/sub/../module_b.py",
+            Path("/root/src/package/module_a.py"),
+        ),
+        (
+            ".module_a.Class",
+            "/root/src/package/__init__.py",
+            Path("/root/src/package/module_a.py"),
+        ),
+        (
+            ".sub.module_b",
+            "/root/src/package/module_a.py",
+            Path("/root/src/package/sub/module_b.py"),
+        ),
+        (
+            "..module_a",
+            "/root/src/package/sub/module_b.py",
+            Path("/root/src/package/module_a.py"),
+        ),
+        (
+            "..",
+            "/root/src/package/sub/module_b.py",
+            Path("/root/src/package/__init__.py"),
+        ),
+        ("...other", "/root/src/package/sub/module_b.py", Path("/root/src/other.py")),
+        (".module_a", None, None),
+        ("dataclasses.dataclass", None, None),
+    ],
+)
+def test_resolve_import(resolver, _import, module_path, expected_path):
+    assert resolver.resolve(_import, module_path) == expected_path
+
+
+def test_resolve_each_import_once(resolver):
+    for _ in range(3):
+        resolver.resolve("package.module_a")
+        resolver.resolve(".module_a", "/root/src/package/sub/../module_b.py")
+        resolver.resolve(".module_a", "/root/src/package/module_b.py")
+
+    cache_info = resolver._resolve.cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.hits == 7
+
+    resolver.clear()
+    assert resolver._resolve.cache_info().currsize == 0
@@ -0,0 +1,135 @@
+import os
+from pathlib import Path
+
+from basel.loaders.exclusion import ExclusionRules
+from basel.loaders.modules import ModuleLoader
+from basel.loaders.watcher import ModuleWatcher
+from basel.parsers import PythonParser
+import pytest
+
+PROJECT = {
+    "pkg/__init__.py": "",
+    "pkg/a.py": "from pkg import b\n",
+    "pkg/b.py": "import abc\n\nclass Base(abc.ABC):\n    pass\n",
+    "pkg/c.py": "from pkg.d import D\n",
+    "pkg/rel/e.py": "from . import c\nfrom .. import x\n",
+    "run.py": "from pkg import a\n",
+}
+
+
+def _write(root: Path, path: str, content: str):
+    path = root / path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+    # make sure the change is seen on filesystems with coarse mtimes
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def project_path(tmp_path, monkeypatch):
+    for path, content in PROJECT.items():
+        _write(tmp_path, path, content)
+
+    monkeypatch.chdir(tmp_path)
+    return Path(".")
+
+
+def _load(paths):
+    loader = ModuleLoader(PythonParser())
+    loader.load_components(paths)
+    loader.calculate_abstraction()
+    loader.calculate_instability()
+    loader.calculate_error()
+    return loader
+
+
+def _get_state(loader):
+    return (
+        sorted(loader.graph.get_edges()),
+        {
+            comp.name: (comp.instability, comp.abstraction, comp.error)
+            for comp in loader.get_components()
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "changes,removed",
+    [
+        ({"pkg/a.py": "from pkg import c\n"}, []),
+        ({"pkg/d.py": "class D:\n    pass\n"}, []),
+        ({"pkg/sub/e.py": "from pkg import a\n"}, []),
+        ({"pkg/sub/deep/e.py": "", "pkg/f.py": "from pkg.sub import deep\n"}, []),
+        ({}, ["pkg/b.py"]),
+        ({"pkg/b.py": "from pkg import a\n"}, ["pkg/c.py"]),
+        ({"pkg/rel/__init__.py": ""}, []),
+        ({"main.py": "from pkg import a\n"}, []),
+        ({}, ["pkg/__init__.py"]),
+    ],
+)
+def test_watch_updates_like_full_load(project_path, changes, removed):
+    loader = _load([project_path])
+    watcher = ModuleWatcher(
+        [node.name for comp in loader.get_components() for node in comp],
+        loader.module_index.directories.values(),
+    )
+    assert not watcher.poll()
+
+    for path, content in changes.items():
+        _write(project_path, path, content)
+    for path in removed:
+        os.remove(path)
+
+    module_changes = watcher.poll()
+    assert sorted(map(str, module_changes.modified)) == sorted(changes)
+    assert sorted(map(str, module_changes.removed)) == sorted(removed)
+
+    loader.update_modules(module_changes.modified, module_changes.removed)
+    loader.calculate_abstraction()
+    loader.calculate_instability()
+    loader.calculate_error()
+
+    assert _get_state(loader) == _get_state(_load([project_path]))
+    assert not watcher.poll()
+
+
+def test_update_relinks_only_affected_modules(project_path):
+    loader = _load([project_path])
+
+    _write(project_path, "pkg/d.py", "")
+    relinked = loader.update_modules([Path("pkg/d.py")])
+
+    assert relinked == {"pkg/d.py", "pkg/c.py"}
+    assert loader.has_link(
+        loader.get_component("pkg/c.py"), loader.get_component("pkg/d.py")
+    )
+
+
+def test_watcher_skips_excluded_modules(project_path):
+    modules = [Path(path) for path in PROJECT]
+    watcher = ModuleWatcher(modules, [Path("pkg")], ExclusionRules(["*_test.py"]))
+
+    _write(project_path, "pkg/a_test.py", "")
+    _write(project_path, "pkg/__pycache__/a.py", "")
+    _write(project_path, "pkg/e.py", "")
+
+    assert watcher.poll().modified == [Path("pkg/e.py")]
+
+
+def test_watcher_skips_gitignored_modules(project_path):
+    _write(project_path, ".gitignore", "generated/\n")
+    _write(project_path, "pkg/generated/g.py", "")
+
+    loader = ModuleLoader(PythonParser(), use_gitignore=True)
+    loader.load_components([project_path])
+    watcher = ModuleWatcher(
+        [node.name for comp in loader.get_components() for node in comp],
+        loader.module_index.directories.values(),
+        loader.exclusion_rules,
+    )
+
+    _write(project_path, "pkg/e.py", "")
+
+    assert watcher.poll().modified == [Path("pkg/e.py")]
@@ -0,0 +1,50 @@
+import os
+import sys
+
+from basel.dtos import LogType
+from basel.dtos import Result
+from basel.main import main
+from basel.main import print_result
+import pytest
+
+
+def test_print_result_logs_to_stderr(capsys):
+    result = Result(content="report")
+    result.add_log("Skipped pkg/a.py: SyntaxError", LogType.WARNING)
+    result.add_log("Skipped pkg/b.py: SyntaxError", LogType.WARNING)
+
+    print_result(result)
+
+    captured = capsys.readouterr()
+    assert captured.out == "report\n"
+    assert captured.err == (
+        "\033[93mSkipped pkg/a.py: SyntaxError\033[0m\n"
+        "\033[93mSkipped pkg/b.py: SyntaxError\033[0m\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "options,expected_options",
+    [
+        (["--jobs", str((os.cpu_count() or 1) + 1)], "--jobs"),
+        (["--no-cache", "--gitignore"], "--no-cache, --gitignore"),
+        (["--import-scope", "module"], "--import-scope"),
+        (["--source-roots", "src"], "--source-roots"),
+    ],
+)
+def test_reject_load_options_with_server(
+    monkeypatch, capsys, options, expected_options
+):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["basel", "report", "-p", "pkg", "--server", "http://127.0.0.1:1", *options],
+    )
+
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 2
+    assert (
+        f"{expected_options} can not be used with --server" in capsys.readouterr().err
+    )
@@ -0,0 +1,49 @@
+from basel import metrics
+import pytest
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(metrics, "numpy", None)
+
+    return request.param
+
+
+def test_instability(backend):
+    instabilities = metrics.instability([0, 1, 1, 3, 0], [0, 1, 2, 1, 1])
+    assert instabilities == pytest.approx([1, 0.5, 2 / 3, 0.25, 1])
+
+
+def test_abstraction(backend):
+    abstractions = metrics.abstraction([0, 1, 1, 3, 0], [0, 1, 2, 1, 1])
+    assert abstractions == pytest.approx([1, 0.5, 1 / 3, 0.75, 0])
+
+
+def test_abs_error_to_main_sequence(backend):
+    errors = metrics.abs_error_to_main_sequence(
+        [1, 1, 0.3, 0, 0.8], [1, 0, 0.8, 0, 0.8]
+    )
+    assert errors == pytest.approx([1, 0, 0.1, 1, 0.6])
+
+
+@pytest.mark.parametrize(
+    "values,expected_mean", [([1, 0, 0, 0], 0.25), ([], 0), ([2, 2, 3, 4], 2.75)]
+)
+def test_mean(backend, values, expected_mean):
+    assert metrics.mean(values) == pytest.approx(expected_mean)
+
+
+@pytest.mark.parametrize(
+    "values,op,value,expected_matches",
+    [
+        ([0, 0.5, 1], "gte", 0.5, [False, True, True]),
+        ([0, 0.5, 1], "lt", 0.5, [True, False, False]),
+        ([0, 0.5, 1], "not eq", 0, [False, True, True]),
+        (["a", "b"], "eq", "b", [False, True]),
+    ],
+)
+def test_compare(backend, values, op, value, expected_matches):
+    assert metrics.compare(values, op, value) == expected_matches
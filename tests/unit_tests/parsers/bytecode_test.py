@@ -0,0 +1,96 @@
+import ast
+import py_compile
+
+from basel.parsers import PythonParser
+from basel.parsers.bytecode import get_bytecode_summary
+import pytest
+
+MODULE_SOURCE = b"""
+import abc
+import os.path as osp
+from abc import ABCMeta
+from collections import *
+from typing import List, Optional
+
+
+class AbstractClass1(abc.ABC):
+    class Nested:
+        pass
+
+
+class AbstractClass2(metaclass=abc.ABCMeta):
+    pass
+
+
+class ConcretClass1(AbstractClass1, Base, metaclass=ABCMeta):
+    pass
+
+
+def function():
+    from json import loads
+
+    class FunctionClass(dict):
+        pass
+"""
+
+
+@pytest.fixture
+def module_path(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_bytes(MODULE_SOURCE)
+    return path
+
+
+@pytest.mark.parametrize(
+    "invalidation_mode",
+    [
+        py_compile.PycInvalidationMode.TIMESTAMP,
+        py_compile.PycInvalidationMode.CHECKED_HASH,
+    ],
+)
+def test_bytecode_summary(module_path, invalidation_mode):
+    py_compile.compile(str(module_path), invalidation_mode=invalidation_mode)
+
+    summary = get_bytecode_summary(module_path)
+
+    assert summary == PythonParser().get_summary(module_path)
+
+
+@pytest.mark.parametrize(
+    "invalidation_mode",
+    [
+        py_compile.PycInvalidationMode.TIMESTAMP,
+        py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    ],
+)
+def test_ignore_stale_bytecode(module_path, invalidation_mode):
+    py_compile.compile(str(module_path), invalidation_mode=invalidation_mode)
+    module_path.write_bytes(MODULE_SOURCE + b"\nimport json\n")
+
+    assert get_bytecode_summary(module_path) is None
+
+
+def test_ignore_missing_bytecode(module_path):
+    assert get_bytecode_summary(module_path) is None
+
+
+def test_ignore_unsupported_bytecode(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_bytes(b"class ClassA(Generic[T]):\n    pass\n")
+    py_compile.compile(str(path))
+
+    assert get_bytecode_summary(path) is None
+
+
+def test_parser_uses_bytecode(module_path, monkeypatch):
+    expected_summary = PythonParser().get_summary(module_path)
+    py_compile.compile(str(module_path))
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("ast.parse called with a fresh pyc")
+
+    monkeypatch.setattr(ast, "parse", fail_parse)
+
+    summary = PythonParser(use_bytecode=True).get_summary(module_path)
+
+    assert summary == expected_summary
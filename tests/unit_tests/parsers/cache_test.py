@@ -0,0 +1,102 @@
+import ast
+import os
+
+from basel.parsers import ModuleSummary
+from basel.parsers import ParseCache
+from basel.parsers import PythonParser
+import pytest
+
+MODULE_SOURCE = b"import abc\n\n\nclass ClassA(abc.ABC):\n    pass\n"
+
+MODULE_SUMMARY = ModuleSummary.create(["abc"], [("ClassA", ["ABC"], {})])
+
+
+@pytest.fixture
+def module_path(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_bytes(MODULE_SOURCE)
+    return path
+
+
+def test_get_cached_summary(tmp_path, module_path):
+    cache = ParseCache(tmp_path / "cache")
+
+    assert cache.get(module_path) is None
+
+    cache.set(module_path, MODULE_SUMMARY, MODULE_SOURCE)
+
+    assert cache.get(module_path) == MODULE_SUMMARY
+    assert cache.get(module_path, variant="other") is None
+
+
+def test_invalidate_on_content_change(tmp_path, module_path):
+    cache = ParseCache(tmp_path / "cache")
+    cache.set(module_path, MODULE_SUMMARY, MODULE_SOURCE)
+
+    module_path.write_bytes(MODULE_SOURCE + b"\nimport os\n")
+
+    assert cache.get(module_path) is None
+
+
+def test_keep_entry_when_only_mtime_changes(tmp_path, module_path):
+    cache = ParseCache(tmp_path / "cache")
+    cache.set(module_path, MODULE_SUMMARY, MODULE_SOURCE)
+
+    stat = module_path.stat()
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert cache.get(module_path) == MODULE_SUMMARY
+
+    module_path.write_bytes(MODULE_SOURCE.replace(b"ClassA", b"ClassB"))
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+
+    assert cache.get(module_path) is None
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+
+    modules = []
+    for idx in range(3):
+        path = tmp_path / f"module_{idx}.py"
+        path.write_bytes(MODULE_SOURCE)
+        cache.set(path, MODULE_SUMMARY, MODULE_SOURCE)
+        os.utime(cache._get_entry_path(path, ""), ns=(idx, idx))
+        modules.append(path)
+
+    cache.max_size = cache.get_size() - 1
+    cache.evict()
+
+    assert cache.get(modules[0]) is None
+    assert cache.get(modules[1]) == MODULE_SUMMARY
+    assert cache.get(modules[2]) == MODULE_SUMMARY
+
+
+def test_sync_counts_entries_of_other_processes(tmp_path, module_path):
+    cache = ParseCache(tmp_path / "cache")
+    cache.set(module_path, MODULE_SUMMARY, MODULE_SOURCE)
+    size = cache.get_size()
+
+    other_cache = ParseCache(tmp_path / "cache")
+    other_path = tmp_path / "other.py"
+    other_path.write_bytes(MODULE_SOURCE)
+    other_cache.set(other_path, MODULE_SUMMARY, MODULE_SOURCE)
+
+    cache.max_size = size
+    cache.sync()
+
+    assert cache.get_size() == size
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_parser_skips_parsing_on_warm_cache(tmp_path, module_path, monkeypatch):
+    parser = PythonParser(cache=ParseCache(tmp_path / "cache"))
+
+    assert parser.get_summary(module_path) == MODULE_SUMMARY
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("ast.parse called on a warm cache")
+
+    monkeypatch.setattr(ast, "parse", fail_parse)
+
+    assert parser.get_summary(module_path) == MODULE_SUMMARY
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from basel.parsers import ClassRecord
+from basel.parsers import ModuleSummary
 from basel.parsers.python_parser import PythonParser
 import pytest
 
@@ -12,10 +14,10 @@ STUB_PROJECT_1_PATH = Path("tests/stubs/project_1")
         (
             STUB_PROJECT_1_PATH / "module_1.py",
             [
+                ".module_2",
                 "abc",
                 "abc.ABCMeta",
                 "dataclasses.dataclass",
-                "module_2",
                 "package_a.module_a1.ConcretClass",
             ],
         )
@@ -35,10 +37,10 @@ def test_get_imports(path, expected_imports):
         (
             STUB_PROJECT_1_PATH / "module_1.py",
             [
-                ("AbstractClass1", ["ABC"], {}),
-                ("AbstractClass2", [], {"metaclass": "ABCMeta"}),
-                ("AbstractClass3", [], {"metaclass": "ABCMeta"}),
-                ("ConcretClass1", ["AbstractClass1"], {}),
+                ClassRecord("AbstractClass1", ("ABC",)),
+                ClassRecord("AbstractClass2", (), (("metaclass", "ABCMeta"),)),
+                ClassRecord("AbstractClass3", (), (("metaclass", "ABCMeta"),)),
+                ClassRecord("ConcretClass1", ("AbstractClass1",)),
             ],
         )
     ],
@@ -70,3 +72,25 @@ def test_is_abstract_class(_class, expected_abstract_result):
     parser = PythonParser()
     is_abstract = parser.is_abstract_class(*_class)
     assert is_abstract == expected_abstract_result
+
+
+def test_get_summary():
+    parser = PythonParser()
+
+    summary = parser.get_summary(STUB_PROJECT_1_PATH / "module_1.py")
+
+    assert summary == ModuleSummary.create(
+        imports=[
+            ".module_2",
+            "abc",
+            "abc.ABCMeta",
+            "dataclasses.dataclass",
+            "package_a.module_a1.ConcretClass",
+        ],
+        classes=[
+            ("AbstractClass1", ["ABC"], {}),
+            ("AbstractClass2", [], {"metaclass": "ABCMeta"}),
+            ("AbstractClass3", [], {"metaclass": "ABCMeta"}),
+            ("ConcretClass1", ["AbstractClass1"], {}),
+        ],
+    )
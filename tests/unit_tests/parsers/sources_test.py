@@ -0,0 +1,64 @@
+import mmap
+
+from basel.parsers import ModuleSummary
+from basel.parsers import PythonParser
+from basel.parsers import sources
+from basel.parsers.sources import open_source
+import pytest
+
+LATIN_1_SOURCE = (
+    b"# -*- coding: latin-1 -*-\n"
+    b"import abc\n\n\n"
+    b"class Cl\xe1ss(abc.ABC):\n"
+    b"    pass\n"
+)
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, sources.MMAP_THRESHOLD])
+def test_open_source(tmp_path, monkeypatch, mmap_threshold):
+    monkeypatch.setattr(sources, "MMAP_THRESHOLD", mmap_threshold)
+    path = tmp_path / "module.py"
+    path.write_bytes(LATIN_1_SOURCE)
+
+    with open_source(path) as source:
+        assert bytes(source) == LATIN_1_SOURCE
+        assert isinstance(source, mmap.mmap) == (not mmap_threshold)
+
+
+def test_open_empty_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(sources, "MMAP_THRESHOLD", 0)
+    path = tmp_path / "__init__.py"
+    path.write_bytes(b"")
+
+    with open_source(path) as source:
+        assert source == b""
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, sources.MMAP_THRESHOLD])
+def test_parse_declared_encoding(tmp_path, monkeypatch, mmap_threshold):
+    monkeypatch.setattr(sources, "MMAP_THRESHOLD", mmap_threshold)
+    path = tmp_path / "module.py"
+    path.write_bytes(LATIN_1_SOURCE)
+
+    summary = PythonParser().get_summary(path)
+
+    assert summary == ModuleSummary.create(["abc"], [("Cláss", ["ABC"], {})])
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        b"class Cl\xe1ss:\n    pass\n",
+        b"# -*- coding: unknown -*-\nimport abc\n",
+        b"import abc\ndef broken(:\n",
+    ],
+)
+def test_report_unparsable_module(tmp_path, source):
+    path = tmp_path / "module.py"
+    path.write_bytes(source)
+
+    summary = PythonParser().get_summary(path)
+
+    assert summary.imports == []
+    assert summary.classes == []
+    assert summary.error
@@ -0,0 +1,81 @@
+import ast
+
+from basel.parsers.visitors import ImportScope
+from basel.parsers.visitors import SummaryVisitor
+import pytest
+
+MODULE_SOURCE = """
+import os
+
+if os.name == "nt":
+    import ntpath
+
+    class ConditionalClass:
+        pass
+else:
+    try:
+        import posixpath
+    except ImportError:
+        from fallback import path
+
+for _ in range(1):
+    import loop_module
+
+
+def function():
+    import function_module
+
+    class FunctionClass:
+        pass
+
+
+class ClassA(metaclass=abc.ABCMeta):
+    import class_module
+
+    class NestedClass(ClassB):
+        pass
+"""
+
+ALL_CLASSES = [
+    ("ConditionalClass", [], {}),
+    ("FunctionClass", [], {}),
+    ("ClassA", [], {"metaclass": "ABCMeta"}),
+    ("NestedClass", ["ClassB"], {}),
+]
+
+
+@pytest.mark.parametrize(
+    "scope,expected_imports,expected_classes",
+    [
+        (
+            ImportScope.MODULE,
+            {"os"},
+            ALL_CLASSES,
+        ),
+        (
+            ImportScope.CONDITIONAL,
+            {"os", "ntpath", "posixpath", "fallback.path"},
+            ALL_CLASSES,
+        ),
+        (
+            ImportScope.FULL,
+            {
+                "os",
+                "ntpath",
+                "posixpath",
+                "fallback.path",
+                "loop_module",
+                "function_module",
+                "class_module",
+            },
+            ALL_CLASSES,
+        ),
+    ],
+)
+def test_summary_visitor_scope(scope, expected_imports, expected_classes):
+    visitor = SummaryVisitor(scope)
+
+    visitor.visit(ast.parse(MODULE_SOURCE))
+
+    assert visitor.imports == expected_imports
+    assert visitor.classes == expected_classes
@@ -0,0 +1,71 @@
+from basel.components import Component
+from basel.reports.filters import compile_where
+from basel.reports.filters import get_where_fields
+import pytest
+
+COMPONENTS = [
+    Component(name="svc/a.py", instability=1, abstraction=1, error=1),
+    Component(name="svc/api/b.py", instability=0, abstraction=1, error=0),
+    Component(name="lib/c.py", instability=0.25, abstraction=0.5, error=0.25),
+    Component(name="lib/__init__.py", instability=0.7, abstraction=0, error=0.7),
+]
+
+
+@pytest.mark.parametrize(
+    "expression,expected_names",
+    [
+        ("E > 0.5", ["svc/a.py", "lib/__init__.py"]),
+        ("error >= 0.7", ["svc/a.py", "lib/__init__.py"]),
+        ("I == 0", ["svc/api/b.py"]),
+        ("A != 1", ["lib/c.py", "lib/__init__.py"]),
+        ("name ~ 'svc/**'", ["svc/a.py", "svc/api/b.py"]),
+        ('name ~ "*/__init__.py"', ["lib/__init__.py"]),
+        ("name !~ 'svc/**'", ["lib/c.py", "lib/__init__.py"]),
+        ("E > 0.5 and name ~ 'svc/**'", ["svc/a.py"]),
+        ("E < 0.1 or I < 0.5 and A < 1", ["svc/api/b.py", "lib/c.py"]),
+        ("(E < 0.1 or I < 0.5) and A < 1", ["lib/c.py"]),
+        ("not (E > 0.5 OR name ~ 'lib/*')", ["svc/api/b.py"]),
+        ("name == 'lib/c.py'", ["lib/c.py"]),
+    ],
+)
+def test_compile_where(expression, expected_names):
+    predicate = compile_where(expression)
+
+    names = [comp.name for comp in COMPONENTS if predicate(comp)]
+
+    assert names == expected_names
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "",
+        "E >",
+        "E 0.5",
+        "X > 0.5",
+        "E > 0.5 and",
+        "(E > 0.5",
+        "E > 0.5)",
+        "name ~ 1",
+        "name > 1",
+        "name <= 'lib'",
+        "E > 'x'",
+        "E > 0.5; import os",
+        "__class__ == 1",
+    ],
+)
+def test_raise_error_on_invalid_expression(expression):
+    with pytest.raises(ValueError):
+        compile_where(expression)
+
+
+@pytest.mark.parametrize(
+    "expression,expected_fields",
+    [
+        ("name ~ 'svc/**'", {"name"}),
+        ("E > 0.5 and name ~ 'svc/**'", {"error", "name"}),
+        ("not (I < 0.5 or abstraction == 1)", {"instability", "abstraction"}),
+    ],
+)
+def test_get_where_fields(expression, expected_fields):
+    assert get_where_fields(expression) == expected_fields
@@ -2,11 +2,16 @@ from unittest.mock import Mock
 
 from basel.components import Component
 from basel.components import Link
+from basel.components.graph import DependencyGraph
 from basel.loaders import Loader
 from basel.reports import ASReport
+from basel.reports import CycleReport
+from basel.reports import DiffReport
+from basel.reports import EdgeReport
 from basel.reports import LinkReport
 from basel.reports import Reporter
 from basel.reports import ReportFormat
+from basel.snapshots import SnapshotDiff
 import pytest
 
 MockComponent = Mock(spec=Component)
@@ -143,6 +148,19 @@ MOCK_COMPONENTS_LIST = [
             ),
             {"error": ["gt", 0.5]},
         ),
+        (
+            MOCK_COMPONENTS_LIST,
+            (0.39, 0.51, 0.59),
+            ASReport(
+                columns=["Component", "I", "A", "E"],
+                data=[
+                    ("Component_D", 0.7, 0, 0.7),
+                    None,
+                    ("Mean", 0.39, 0.51, 0.59),
+                ],
+            ),
+            {"where": "E > 0.5 and name ~ 'Component_[BCD]'"},
+        ),
     ],
 )
 def test_get_as_report(components, means, expected_report, filters):
@@ -194,7 +212,9 @@ def test_get_as_report(components, means, expected_report, filters):
 def test_get_component_links_report(components, links, expected_report):
     mock_loader = Mock(spec=Loader)
     mock_loader.get_components.return_value = components
-    mock_loader.get_links.return_value = links
+    mock_loader.get_dependants.side_effect = lambda name: [
+        link.source.name for link in links if link.target.name == name
+    ]
 
     reporter = Reporter(mock_loader)
 
@@ -203,6 +223,103 @@ def test_get_component_links_report(components, links, expected_report):
     assert report == expected_report
 
 
+@pytest.mark.parametrize(
+    "links,filters,expected_data",
+    [
+        (
+            [("A", "B"), ("B", "C"), ("A", "D")],
+            None,
+            [("A", "B"), ("A", "D"), ("B", "C")],
+        ),
+        (
+            [("A", "B"), ("B", "C"), ("A", "D")],
+            {"name": ["match in", ["A", "B"]]},
+            [("A", "B")],
+        ),
+    ],
+)
+def test_get_component_edges_report(links, filters, expected_data):
+    mock_loader = Mock(spec=Loader)
+    mock_loader.get_components.return_value = [
+        Component("A"),
+        Component("B"),
+        Component("C"),
+        Component("D"),
+    ]
+    mock_loader.get_dependencies.side_effect = lambda name: [
+        target for source, target in links if source == name
+    ]
+
+    reporter = Reporter(mock_loader)
+
+    report = reporter.get_component_edges_report(filters)
+
+    assert report == EdgeReport(columns=["Source", "Target"], data=expected_data)
+
+
+@pytest.mark.parametrize(
+    "links,filters,expected_report",
+    [
+        (
+            # A --* B --* C --* B, C --* D --* D
+            [("A", "B"), ("B", "C"), ("C", "B"), ("C", "D"), ("D", "D")],
+            None,
+            CycleReport(
+                columns=["Cycle", "Components", "Links", "Members"],
+                data=[("1", 2, 2, "B\nC"), ("2", 1, 1, "D")],
+                footer="\nCondensed graph:\nA --> cycle 1\ncycle 1 --> cycle 2\n",
+            ),
+        ),
+        (
+            [("A", "B"), ("B", "C"), ("C", "B"), ("C", "D"), ("D", "D")],
+            {"name": ["match in", ["A", "B"]]},
+            CycleReport(
+                columns=["Cycle", "Components", "Links", "Members"],
+                data=[("1", 2, 2, "B\nC")],
+                footer="\nCondensed graph:\nA --> cycle 1\n",
+            ),
+        ),
+    ],
+)
+def test_get_cycles_report(links, filters, expected_report):
+    graph = DependencyGraph()
+    for source, target in links:
+        graph.add_edge(source, target)
+
+    mock_loader = Mock(spec=Loader)
+    mock_loader.get_components.return_value = [Component(name) for name in graph]
+    mock_loader.get_link_groups.side_effect = graph.get_strongly_connected_components
+    mock_loader.get_dependencies.side_effect = graph.get_successors
+
+    reporter = Reporter(mock_loader)
+
+    report = reporter.get_cycles_report(filters)
+
+    assert report == expected_report
+
+
+def test_get_diff_report():
+    diff = SnapshotDiff(
+        added_components={"D": (1, 1, 1)},
+        removed_components={"C": (0, 1, 0)},
+        changed_components={"B": ((0.5, 0.5, 0), (0.5, 1 / 3, 1 / 6))},
+        added_links=[("B", "D")],
+        removed_links=[("B", "C")],
+    )
+
+    report = Reporter().get_diff_report(diff)
+
+    assert report == DiffReport(
+        columns=["Change", "Component", "I", "A", "E"],
+        data=[
+            ("+", "D", 1, 1, 1),
+            ("-", "C", 0, 1, 0),
+            ("~", "B", 0.5, "0.5 -> 0.33", "0 -> 0.17"),
+        ],
+        footer="\nLinks:\n+ B --> D\n- B --> C\n",
+    )
+
+
 @pytest.mark.parametrize(
     "report,report_format,expected_result",
     [
@@ -249,6 +366,30 @@ def test_get_component_links_report(components, links, expected_report):
             "[B] --> [C]\n"
             "@enduml",
         ),
+        (
+            EdgeReport(
+                columns=["Source", "Target"],
+                data=[("A", "B"), ("A", "D"), ("B", "C")],
+            ),
+            ReportFormat.UML,
+            "@startuml\n"
+            "component [A]\n"
+            "component [B]\n"
+            "component [D]\n"
+            "component [C]\n"
+            "[A] --> [B]\n"
+            "[A] --> [D]\n"
+            "[B] --> [C]\n"
+            "@enduml",
+        ),
+        (
+            EdgeReport(
+                columns=["Source", "Target"],
+                data=[("A", "B"), ("A", "D"), ("B", "C")],
+            ),
+            ReportFormat.ADJACENCY,
+            "A: B, D\nB: C",
+        ),
     ],
 )
 def test_format_report(report, report_format, expected_result):
@@ -258,15 +399,59 @@ def test_format_report(report, report_format, expected_result):
 
 
 @pytest.mark.parametrize(
-    "report,report_format",
+    "report,report_format,expected_message",
     [
-        (ASReport(), ReportFormat.UML),
-        (LinkReport(), ReportFormat.MEAN_I),
-        (LinkReport(), ReportFormat.MEAN_A),
-        (LinkReport(), ReportFormat.MEAN_E),
+        (ASReport(), ReportFormat.UML, "The format uml is not valid for AS plane"),
+        (LinkReport(), ReportFormat.MEAN_I, "The format mean_i is not valid"),
+        (LinkReport(), ReportFormat.MEAN_A, "The format mean_a is not valid"),
+        (LinkReport(), ReportFormat.MEAN_E, "The format mean_e is not valid"),
+        (
+            LinkReport(),
+            ReportFormat.ADJACENCY,
+            "The format adjacency is not valid for Link Report, it requires --sparse",
+        ),
+        (EdgeReport(), ReportFormat.MEAN, "The format mean is not valid"),
     ],
 )
-def test_raise_error_on_incorrect_report_format(report, report_format):
+def test_raise_error_on_incorrect_report_format(
+    report, report_format, expected_message
+):
     reporter = Reporter()
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=expected_message):
         reporter.format_report(report, report_format)
+
+
+@pytest.mark.parametrize(
+    "filters,expected_edges,expected_cycles",
+    [
+        ({"where": "E < 0.6"}, [("B", "C"), ("C", "B")], [("1", 2, 2, "B\nC")]),
+        ({"where": "E > 0.6 or name ~ 'B'"}, [("A", "B")], [("1", 2, 2, "B\nC")]),
+        ({"where": "E > 0.6"}, [], []),
+    ],
+)
+def test_filter_link_reports_by_metrics(filters, expected_edges, expected_cycles):
+    # A --* B --* C --* B
+    graph = DependencyGraph()
+    for source, target in [("A", "B"), ("B", "C"), ("C", "B")]:
+        graph.add_edge(source, target)
+
+    components = {name: Component(name) for name in ["A", "B", "C"]}
+    errors = {"A": 0.9, "B": 0.5, "C": 0}
+
+    def calculate_error():
+        for name, error in errors.items():
+            components[name].set_error(error)
+
+    mock_loader = Mock(spec=Loader)
+    mock_loader.get_components.return_value = list(components.values())
+    mock_loader.get_link_groups.side_effect = graph.get_strongly_connected_components
+    mock_loader.get_dependencies.side_effect = graph.get_successors
+    mock_loader.calculate_error.side_effect = calculate_error
+
+    reporter = Reporter(mock_loader)
+
+    edges_report = reporter.get_component_edges_report(filters)
+    cycles_report = reporter.get_cycles_report(filters)
+
+    assert edges_report.data == expected_edges
+    assert cycles_report.data == expected_cycles
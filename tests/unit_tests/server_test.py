@@ -0,0 +1,198 @@
+import json
+from pathlib import Path
+import threading
+from urllib import error as urllib_error
+from urllib import request as urllib_request
+
+from basel.main import setup_basel_client
+from basel.reports import ReportFormat
+from basel.server import BaselServer
+from basel.server import is_loopback_host
+from basel.server import load_kwargs
+from basel.server import send_request
+from basel.server import WarmBasel
+import pytest
+
+
+@pytest.fixture
+def project_path(tmp_path, monkeypatch):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("from pkg import b\n")
+    (tmp_path / "pkg" / "b.py").write_text("")
+
+    monkeypatch.chdir(tmp_path)
+    return Path("pkg")
+
+
+@pytest.fixture
+def server_url(project_path):
+    server = BaselServer(
+        ("127.0.0.1", 0), lambda: setup_basel_client(client_class=WarmBasel)
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_load_kwargs():
+    kwargs = load_kwargs(
+        {"root_path": ["pkg"], "output": "snapshot.json", "report_format": "mean"}
+    )
+
+    assert kwargs == {
+        "root_path": [Path("pkg")],
+        "output": Path("snapshot.json"),
+        "report_format": ReportFormat.MEAN,
+    }
+
+
+def test_warm_client_patches_changed_modules(project_path, monkeypatch):
+    client = setup_basel_client(client_class=WarmBasel)
+    result = client.report(root_path=[project_path])
+    assert "pkg/a.py" in result.content
+
+    monkeypatch.setattr(
+        client.loader,
+        "load_components",
+        lambda *args, **kwargs: pytest.fail("modules loaded from scratch"),
+    )
+
+    (project_path / "c.py").write_text("from pkg import a\n")
+    result = client.report(root_path=[project_path])
+
+    assert "pkg/c.py" in result.content
+    assert client.loader.get_fan_in("pkg/a.py") == 1
+
+
+def test_warm_client_reloads_other_exclusions(project_path):
+    client = setup_basel_client(client_class=WarmBasel)
+    client.report(root_path=[project_path])
+
+    result = client.report(root_path=[project_path], exclude_components=["*b.py"])
+
+    assert "pkg/a.py" in result.content
+    assert "pkg/b.py" not in result.content
+    assert client.loader.get_component("pkg/b.py") is None
+
+
+def test_send_request(server_url, project_path):
+    result = send_request(
+        server_url, "component_relations", {"root_path": [project_path], "sparse": True}
+    )
+
+    assert result.success
+    assert "pkg/a.py" in result.content
+    assert "pkg/b.py" in result.content
+
+
+def test_send_unknown_method(server_url, project_path):
+    result = send_request(server_url, "watch", {"root_path": [project_path]})
+
+    assert not result.success
+    assert "Not exists the method watch" in result.logs[0].content
+
+
+@pytest.mark.parametrize(
+    "request_content,expected_message",
+    [
+        (["report"], "the request must be a JSON object"),
+        ({"method": "report", "kwargs": [], "cwd": "."}, "kwargs must be"),
+        (
+            {"method": "report", "kwargs": {"unknown": 1}, "cwd": "."},
+            "Not exists the argument unknown of report",
+        ),
+        (
+            {"method": "report", "kwargs": {"root_path": "pkg"}, "cwd": "."},
+            "root_path must be a list of paths",
+        ),
+        (
+            {"method": "snapshot", "kwargs": {"output": 1}, "cwd": "."},
+            "output must be a path",
+        ),
+    ],
+)
+def test_send_invalid_request(server_url, request_content, expected_message):
+    http_request = urllib_request.Request(
+        server_url,
+        data=json.dumps(request_content).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+
+    with urllib_request.urlopen(http_request) as response:
+        result = json.load(response)
+
+    assert not result["success"]
+    assert expected_message in result["logs"][0][1]
+
+
+def test_request_from_other_directory(project_path):
+    server = BaselServer(("127.0.0.1", 0), WarmBasel)
+    server.server_close()
+
+    result = server.handle_request(
+        {"method": "report", "kwargs": {"root_path": ["pkg"]}, "cwd": "/"}
+    )
+
+    assert not result.success
+    assert "The server runs in" in result.logs[0].content
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"root_path": ["/"]},
+        {"root_path": ["pkg"], "output": "../snapshot.json"},
+        {"root_path": ["pkg"], "component_map": "/etc/passwd"},
+    ],
+)
+def test_send_request_with_outside_paths(server_url, project_path, kwargs):
+    result = send_request(server_url, "snapshot", kwargs)
+
+    assert not result.success
+    assert "is outside of the server directory" in result.logs[0].content
+
+
+@pytest.mark.parametrize(
+    "headers,expected_status",
+    [
+        ({"Content-Type": "text/plain"}, 415),
+        ({}, 415),
+        ({"Content-Type": "application/json", "Origin": "http://example.com"}, 403),
+    ],
+)
+def test_reject_browser_requests(server_url, project_path, headers, expected_status):
+    content = {"method": "report", "kwargs": {"root_path": ["pkg"]}, "cwd": "."}
+    http_request = urllib_request.Request(
+        server_url, data=json.dumps(content).encode(), headers=headers
+    )
+
+    with pytest.raises(urllib_error.HTTPError) as error:
+        urllib_request.urlopen(http_request)
+
+    assert error.value.code == expected_status
+
+
+@pytest.mark.parametrize(
+    "host,expected_loopback",
+    [
+        ("127.0.0.1", True),
+        ("::1", True),
+        ("localhost", True),
+        ("0.0.0.0", False),
+        ("192.168.1.10", False),
+        ("example.com", False),
+    ],
+)
+def test_is_loopback_host(host, expected_loopback):
+    assert is_loopback_host(host) == expected_loopback
+
+
+def test_send_request_without_server():
+    result = send_request("http://127.0.0.1:1", "report", {})
+
+    assert not result.success
+    assert "Can not reach the server" in result.logs[0].content
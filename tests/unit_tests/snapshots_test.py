@@ -0,0 +1,90 @@
+from unittest.mock import Mock
+
+from basel.components import Component
+from basel.components import Link
+from basel.loaders import ModuleLoader
+from basel.parsers import Parser
+from basel.snapshots import diff_snapshots
+from basel.snapshots import FailRule
+from basel.snapshots import Snapshot
+from basel.snapshots import SnapshotDiff
+import pytest
+
+BASE_SNAPSHOT = Snapshot(
+    components={"A": (1, 0, 0), "B": (0.5, 0.5, 0), "C": (0, 1, 0)},
+    links=[("A", "B"), ("B", "C")],
+)
+
+
+def test_save_and_load_snapshot(tmp_path):
+    path = tmp_path / "snapshot.json"
+    BASE_SNAPSHOT.save(path)
+
+    assert Snapshot.load(path) == BASE_SNAPSHOT
+
+
+def test_snapshot_from_loader():
+    component_a = Component(name="A")
+    component_b = Component(name="B")
+    loader = ModuleLoader(
+        Mock(spec=Parser), [component_a, component_b], [Link(component_a, component_b)]
+    )
+    loader.load_links = Mock()
+    loader.load_classes = Mock()
+
+    snapshot = Snapshot.from_loader(loader)
+
+    assert snapshot == Snapshot(
+        components={"A": (1, 1, 1), "B": (0, 1, 0)}, links=[("A", "B")]
+    )
+
+
+@pytest.mark.parametrize(
+    "head,expected_diff",
+    [
+        (BASE_SNAPSHOT, SnapshotDiff()),
+        (
+            Snapshot(
+                components={"A": (1, 0, 0), "B": (0.5, 0.25, 0.25), "D": (1, 1, 1)},
+                links=[("A", "B"), ("B", "D")],
+            ),
+            SnapshotDiff(
+                added_components={"D": (1, 1, 1)},
+                removed_components={"C": (0, 1, 0)},
+                changed_components={"B": ((0.5, 0.5, 0), (0.5, 0.25, 0.25))},
+                added_links=[("B", "D")],
+                removed_links=[("B", "C")],
+            ),
+        ),
+    ],
+)
+def test_diff_snapshots(head, expected_diff):
+    diff = diff_snapshots(BASE_SNAPSHOT, head)
+
+    assert diff == expected_diff
+    assert diff.is_empty() == (head is BASE_SNAPSHOT)
+
+
+@pytest.mark.parametrize(
+    "rule,expected_regressions",
+    [
+        ("edges", ["New link B --> D"]),
+        ("E>0.05", ["E of B grew 0.25 (0.00 -> 0.25)"]),
+        ("E > 0.25", []),
+        ("I>0", []),
+        ("A>0", []),
+    ],
+)
+def test_get_regressions(rule, expected_regressions):
+    diff = SnapshotDiff(
+        changed_components={"B": ((0.5, 0.5, 0), (0.5, 0.25, 0.25))},
+        added_links=[("B", "D")],
+    )
+
+    assert FailRule.parse(rule).get_regressions(diff) == expected_regressions
+
+
+@pytest.mark.parametrize("rule", ["links", "E", "E<0.1", "X>0.1", "E>-1"])
+def test_raise_error_on_incorrect_rule(rule):
+    with pytest.raises(ValueError):
+        FailRule.parse(rule)
@@ -1,3 +1,5 @@
+from pathlib import PurePosixPath
+
 from basel import utils
 import pytest
 
@@ -53,3 +55,51 @@ def test_abs_error_to_main_sequence(instability, abstraction, expected_error):
 def test_mean(values, expected_mean):
     _mean = utils.mean(values)
     assert _mean == expected_mean
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["a.py", "src/a.py", "src/pkg/a.py", "/abs/src/a.py", "x/src/a.py", "test_x.py"],
+)
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*.py",
+        "a.py",
+        "src/*.py",
+        "*/a.py",
+        "/abs/src/*.py",
+        "/src/a.py",
+        "test_?.py",
+        "[ab].py",
+        "[!a].py",
+        "src/*/*.py",
+    ],
+)
+def test_glob_to_regex_as_path_match(path, pattern):
+    regex = utils.glob_to_regex(pattern)
+    assert (regex.search(path) is not None) == PurePosixPath(path).match(pattern)
+
+
+@pytest.mark.parametrize(
+    "pattern,path,expected_match",
+    [
+        ("src/**", "src/pkg/sub/b.py", True),
+        ("src/**", "src", True),
+        ("src/**/b.py", "src/pkg/sub/b.py", True),
+        ("src/**/b.py", "src/b.py", True),
+        ("src/**/b.py", "srcx/b.py", False),
+        ("**/b.py", "x/y/b.py", True),
+    ],
+)
+def test_glob_to_regex_any_directories(pattern, path, expected_match):
+    assert (utils.glob_to_regex(pattern).search(path) is not None) == expected_match
+
+
+def test_globs_to_regex():
+    regex = utils.globs_to_regex(["*/a.py", "b.py"])
+
+    assert regex.search("src/a.py")
+    assert regex.search("src/b.py")
+    assert not regex.search("src/c.py")
+    assert not utils.globs_to_regex([]).search("src/a.py")